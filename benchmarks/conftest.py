@@ -0,0 +1,4 @@
+def pytest_benchmark_update_json(config, benchmarks, output_json):
+    # Keep the stats but drop the timings of every round, which make the baseline megabytes large
+    for benchmark in output_json["benchmarks"]:
+        benchmark["stats"].pop("data", None)
@@ -0,0 +1,57 @@
+"""Compare the size and speed of the JSON and MessagePack codecs on persisted form state.
+
+Run with ``uv run pytest benchmarks/test_codec.py``. The encoded size of each state is reported in the
+``extra_info`` column, so both the time and the size show up in the same table.
+"""
+
+from datetime import datetime, timedelta, timezone
+from ipaddress import IPv4Address
+from uuid import UUID
+
+import pytest
+
+from pydantic_forms.utils.json import json_dumps, json_loads
+from pydantic_forms.utils.msgpack import msgpack_dumps, msgpack_loads
+
+START = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+STATES = {
+    "uuid_heavy": {
+        "form_key": "create_port",
+        "subscription_ids": [UUID(int=i) for i in range(1000)],
+        "ports": [{"port_id": UUID(int=i), "vlan": i} for i in range(1000)],
+    },
+    "datetime_heavy": {
+        "form_key": "maintenance",
+        "windows": [{"start": START + timedelta(hours=i), "end": START + timedelta(hours=i + 1)} for i in range(1000)],
+    },
+    "mixed": {
+        "form_key": "create_service",
+        "customer_id": UUID(int=1),
+        "created": START,
+        "contacts": [{"name": f"Person {i}", "email": f"person{i}@example.com"} for i in range(200)],
+        "ip": IPv4Address("192.168.1.1"),
+    },
+}
+
+CODECS = {
+    "json": (lambda obj: json_dumps(obj).encode(), json_loads),
+    "msgpack": (msgpack_dumps, msgpack_loads),
+}
+
+
+@pytest.mark.parametrize("state", STATES, ids=str)
+@pytest.mark.parametrize("codec", CODECS, ids=str)
+def test_dumps(benchmark, codec, state):
+    dumps, _ = CODECS[codec]
+    benchmark.extra_info["bytes"] = len(dumps(STATES[state]))
+    benchmark(dumps, STATES[state])
+
+
+@pytest.mark.parametrize("state", STATES, ids=str)
+@pytest.mark.parametrize("codec", CODECS, ids=str)
+def test_loads(benchmark, codec, state):
+    dumps, loads = CODECS[codec]
+    data = dumps(STATES[state])
+    benchmark.extra_info["bytes"] = len(data)
+    benchmark(loads, data)
@@ -0,0 +1,55 @@
+"""Benchmark the factories of the components, which forms call each time they yield a page that uses one.
+
+Run with ``uv run pytest benchmarks/test_components.py``.
+"""
+
+from uuid import UUID
+
+import pytest
+
+from pydantic_forms.types import strEnum
+from pydantic_forms.validators import (
+    Choice,
+    callout,
+    choice_list,
+    contact_person_list,
+    markdown,
+    migration_summary,
+    read_only_field,
+    read_only_list,
+    timestamp,
+    unique_conlist,
+)
+
+
+class Colour(Choice):
+    RED = "red"
+    GREEN = "green"
+    BLUE = "blue"
+
+
+class Size(strEnum):
+    SMALL = "small"
+    LARGE = "large"
+
+
+SUMMARY = {"headers": ["Port", "Speed"], "labels": ["Before", "After"], "columns": [["1G", "10G"], ["10G", "100G"]]}
+
+FACTORIES = {
+    "callout": lambda: callout(header="Maintenance", message="The port goes down for 10 minutes"),
+    "choice_list": lambda: choice_list(Colour, min_items=1, max_items=2),
+    "contact_person_list": lambda: contact_person_list(UUID(int=1)),
+    "markdown": lambda: markdown(content="# Heading\n\nSome **bold** text"),
+    "migration_summary": lambda: migration_summary(SUMMARY),
+    "read_only_field": lambda: read_only_field("port-1"),
+    "read_only_field_enum": lambda: read_only_field(Size.SMALL),
+    "read_only_list": lambda: read_only_list(["port-1", "port-2", "port-3"]),
+    "timestamp": lambda: timestamp(locale="nl-nl", min=0, max=2**31),
+    "unique_conlist": lambda: unique_conlist(str, min_items=1),
+}
+
+
+@pytest.mark.filterwarnings("ignore:organisationId and organisationKey:DeprecationWarning")
+@pytest.mark.parametrize("factory", FACTORIES, ids=str)
+def test_factory(benchmark, factory):
+    benchmark(FACTORIES[factory])
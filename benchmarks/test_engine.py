@@ -0,0 +1,62 @@
+"""Benchmark running forms: wizards of increasing depth, pages and the translation of validation errors.
+
+Run with ``uv run pytest benchmarks/test_engine.py``.
+"""
+
+import pytest
+from pydantic import ValidationError, create_model
+
+from pydantic_forms.core import FormPage, default_registry, post_form
+from pydantic_forms.exceptions import FormValidationError
+
+DEPTHS = [1, 5, 10, 25, 50]
+
+ERROR_COUNTS = [10, 100, 1000, 10000]
+
+
+def wizard(depth: int):
+    pages = [create_model(f"Page{i}", __base__=FormPage, value=(int, ...), note=(str, "")) for i in range(depth)]
+
+    def form(state):
+        values = []
+        for page in pages:
+            user_input = yield page
+            values.append(user_input.value)
+        return {"values": values}
+
+    return form
+
+
+class Contact(FormPage):
+    name: str
+    email: str
+    phone: str = ""
+    tags: list[str] = []
+
+
+@pytest.mark.parametrize("depth", DEPTHS)
+def test_post_form(benchmark, depth):
+    form = wizard(depth)
+    user_inputs = [{"value": i, "note": f"page {i}"} for i in range(depth)]
+
+    state = benchmark(post_form, form, {}, user_inputs)
+
+    assert state["values"] == list(range(depth))
+
+
+def test_form_page_instantiation(benchmark):
+    contact = benchmark(Contact, name="Jane", email="jane@example.com", tags=["a", "b"])
+
+    assert contact.name == "Jane"
+
+
+@pytest.mark.parametrize("count", ERROR_COUNTS)
+def test_form_validation_error(benchmark, count):
+    Page = create_model("Page", __base__=FormPage, values=(list[int], ...))
+    with pytest.raises(ValidationError) as exc_info:
+        Page(values=["not a number"] * count)
+    translator = default_registry.translator
+
+    error = benchmark(FormValidationError, "Page", exc_info.value, translator, "nl_NL")
+
+    assert len(error.errors) == count
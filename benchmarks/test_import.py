@@ -0,0 +1,32 @@
+"""Benchmark importing the packages of pydantic-forms in a fresh interpreter.
+
+The packages import their members on first access, so importing one component shouldn't pay for all of them. Every
+round starts a new interpreter, so the timings include its startup; `interpreter` measures that alone.
+
+Run with ``uv run pytest benchmarks/test_import.py``.
+"""
+
+import subprocess
+import sys
+
+import pytest
+
+MODULES = {
+    "interpreter": "pass",
+    "pydantic_forms": "import pydantic_forms",
+    "core": "import pydantic_forms.core",
+    "core.hooks": "import pydantic_forms.core.hooks",
+    "core.start_form": "from pydantic_forms.core import start_form",
+    "validators": "import pydantic_forms.validators",
+    "validators.Label": "from pydantic_forms.validators import Label",
+    "validators.all": "from pydantic_forms.validators import *",
+}
+
+
+def run_python(code: str) -> None:
+    subprocess.run([sys.executable, "-c", code], check=True)  # noqa: S603
+
+
+@pytest.mark.parametrize("code", MODULES.values(), ids=MODULES.keys())
+def test_import(benchmark, code):
+    benchmark.pedantic(run_python, args=(code,), rounds=10, warmup_rounds=1)
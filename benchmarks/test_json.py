@@ -0,0 +1,55 @@
+"""Compare the JSON backends on a large form state.
+
+Run with ``uv run pytest benchmarks/test_json.py``. Only the backends that are installed are benchmarked; install the
+`orjson` and `rapidjson` extras to compare all three.
+"""
+
+from datetime import datetime, timedelta, timezone
+from uuid import UUID
+
+import pytest
+from pydantic import BaseModel
+
+from pydantic_forms.utils.json import JSON_BACKENDS
+
+START = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+STATE = {
+    "form_key": "create_service",
+    "created": START,
+    "customer_id": UUID(int=1),
+    "contacts": [{"name": f"Person {i}", "email": f"person{i}@example.com", "phone": None} for i in range(1000)],
+    "ports": [{"port_id": UUID(int=i), "vlan": i, "tagged": i % 2 == 0} for i in range(1000)],
+    "windows": [{"start": START + timedelta(hours=i), "end": START + timedelta(hours=i + 1)} for i in range(100)],
+}
+
+
+class Port(BaseModel):
+    port_id: UUID
+    created: datetime
+    name: str
+    vlans: list[int]
+
+
+MODEL_STATE = {
+    "form_key": "create_ports",
+    "ports": [Port(port_id=UUID(int=i), created=START, name=f"port-{i}", vlans=[1, 2, 3]) for i in range(1000)],
+}
+
+
+@pytest.mark.parametrize("backend", sorted(JSON_BACKENDS))
+def test_json_dumps(benchmark, backend):
+    dumps, _ = JSON_BACKENDS[backend]
+    benchmark(dumps, STATE)
+
+
+@pytest.mark.parametrize("backend", sorted(JSON_BACKENDS))
+def test_json_loads(benchmark, backend):
+    dumps, loads = JSON_BACKENDS[backend]
+    benchmark(loads, dumps(STATE))
+
+
+@pytest.mark.parametrize("backend", sorted(JSON_BACKENDS))
+def test_json_dumps_models(benchmark, backend):
+    dumps, _ = JSON_BACKENDS[backend]
+    benchmark(dumps, MODEL_STATE)
@@ -0,0 +1,46 @@
+"""Benchmark generating the JSON schema of wide pages, with and without the schema cache of the registry.
+
+Run with ``uv run pytest benchmarks/test_schema.py``.
+"""
+
+from typing import Optional
+
+import pytest
+from pydantic import create_model
+
+from pydantic_forms.core import FormPage, FormRegistry
+from pydantic_forms.core.shared import form_schema
+
+WIDTHS = [10, 100, 500]
+
+
+def wide_page(width: int) -> type[FormPage]:
+    fields = {}
+    for i in range(width):
+        match i % 3:
+            case 0:
+                fields[f"field_{i}"] = (str, ...)
+            case 1:
+                fields[f"field_{i}"] = (Optional[int], None)
+            case _:
+                fields[f"field_{i}"] = (list[str], [])
+    return create_model(f"Wide{width}", __base__=FormPage, **fields)
+
+
+@pytest.mark.parametrize("width", WIDTHS)
+def test_form_schema(benchmark, width):
+    page = wide_page(width)
+
+    schema = benchmark(form_schema, page)
+
+    assert len(schema["properties"]) == width
+
+
+@pytest.mark.parametrize("width", WIDTHS)
+def test_cached_schema(benchmark, width):
+    page = wide_page(width)
+    registry = FormRegistry()
+
+    schema = benchmark(registry.schema, page)
+
+    assert len(schema["properties"]) == width
@@ -0,0 +1,114 @@
+# Copyright 2019-2026 SURF.
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Command line tools, run with `python -m pydantic_forms`.
+
+- `replay <recording>` runs a recording of `FormRecorder` through the engines again, see
+  `pydantic_forms.core.recording`. It exits with status 1 when the outcome of a run changed.
+- `profile <form_key> --inputs <file>` runs a form under the profiler, see `pydantic_forms.core.profiling`. It writes
+  the `cProfile` stats to `<output>.pstats` and the sampled stacks to `<output>.collapsed`, for flame graphs.
+
+The forms are looked up in the registry that `--registry` names: `module:attribute` for a `FormRegistry`, or just
+a module that registers its forms in `default_registry` when it is imported.
+"""
+
+import argparse
+import sys
+from collections.abc import Sequence
+from importlib import import_module
+from pathlib import Path
+from typing import Any, Union
+
+from pydantic_forms.core.shared import FormRegistry, default_registry
+from pydantic_forms.utils.json import json_loads
+
+
+def _load_registry(spec: Union[str, None]) -> FormRegistry:
+    if not spec:
+        return default_registry
+
+    module_name, _, attribute = spec.partition(":")
+    obj: Any = import_module(module_name)
+    if not attribute:
+        return default_registry
+    for name in attribute.split("."):
+        obj = getattr(obj, name)
+    if not isinstance(obj, FormRegistry):
+        raise SystemExit(f"{spec} is not a FormRegistry but a {type(obj).__name__}")
+    return obj
+
+
+def _replay(args: argparse.Namespace) -> int:
+    from pydantic_forms.core.recording import replay
+
+    report = replay(args.recording, registry=_load_registry(args.registry))
+    print(report)  # noqa: T201
+    return 1 if report.mismatches else 0
+
+
+def _profile(args: argparse.Namespace) -> int:
+    from pydantic_forms.core.profiling import profile_form
+
+    inputs = json_loads(Path(args.inputs).read_bytes())
+    # A record of a recording carries the extra state and locale of the run as well
+    record: dict[str, Any] = inputs if isinstance(inputs, dict) else {"user_inputs": inputs}
+    if not isinstance(record.get("user_inputs"), list):
+        raise SystemExit(f"{args.inputs} holds neither a JSON array of user inputs nor a recorded run")
+
+    profile = profile_form(
+        args.form_key,
+        record["user_inputs"],
+        extra_state=record.get("extra_state"),
+        locale=args.locale or record.get("locale", "en_US"),
+        runs=args.runs,
+        registry=_load_registry(args.registry),
+    )
+    output = args.output or args.form_key
+    profile.write_pstats(f"{output}.pstats")
+    profile.write_collapsed(f"{output}.collapsed")
+    print(profile)  # noqa: T201
+    print(f"\nWrote {output}.pstats and {output}.collapsed")  # noqa: T201
+    return 0
+
+
+def main(argv: Union[Sequence[str], None] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m pydantic_forms", description="Tools for pydantic-forms.")
+    commands = parser.add_subparsers(dest="command", required=True)
+    registry_help = "The registry with the forms: module:attribute, or a module that registers them on import."
+
+    replay = commands.add_parser("replay", help="Run a recording of form runs through the engines again.")
+    replay.add_argument("recording", help="The JSONL file that FormRecorder wrote.")
+    replay.add_argument("--registry", help=registry_help)
+    replay.set_defaults(run=_replay)
+
+    profile = commands.add_parser("profile", help="Run a form under the profiler.")
+    profile.add_argument("form_key", help="The key of the form to profile.")
+    profile.add_argument(
+        "--inputs",
+        required=True,
+        help="A JSON file with the array of user inputs, or with a record from a recording.",
+    )
+    profile.add_argument("--registry", help=registry_help)
+    profile.add_argument("--locale", help="The locale to translate validation errors to, en_US if not given.")
+    profile.add_argument("--runs", type=int, default=1, help="The number of times to run the form.")
+    profile.add_argument(
+        "--output", help="The path to write the results to, without extension; the form key if not given."
+    )
+    profile.set_defaults(run=_profile)
+
+    args = parser.parse_args(argv)
+    return args.run(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -10,15 +10,87 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-from pydantic_forms.core.shared import DisplayOnlyFieldType, FormPage, list_forms, register_form
-from pydantic_forms.core.sync import generate_form, post_form, start_form
+"""The form engine.
+
+The modules that define the names below are imported on first access, so that importing a submodule such as
+`pydantic_forms.core.hooks` doesn't import the engines, structlog and pydantic-i18n as well.
+"""
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from pydantic_forms.core.discovery import discover_forms
+    from pydantic_forms.core.hooks import FormHook, Phase, PhaseTiming
+    from pydantic_forms.core.shared import (
+        Completed,
+        DisplayOnlyFieldType,
+        FormPage,
+        FormRegistry,
+        FormResult,
+        Invalid,
+        NeedsInput,
+        default_registry,
+        list_forms,
+        register_form,
+        register_forms,
+    )
+    from pydantic_forms.core.sync import generate_form, post_form, run_form, start_form
+
+_MODULES = {
+    "discover_forms": "discovery",
+    "FormHook": "hooks",
+    "Phase": "hooks",
+    "PhaseTiming": "hooks",
+    "Completed": "shared",
+    "DisplayOnlyFieldType": "shared",
+    "FormPage": "shared",
+    "FormRegistry": "shared",
+    "FormResult": "shared",
+    "Invalid": "shared",
+    "NeedsInput": "shared",
+    "default_registry": "shared",
+    "list_forms": "shared",
+    "register_form": "shared",
+    "register_forms": "shared",
+    "generate_form": "sync",
+    "post_form": "sync",
+    "run_form": "sync",
+    "start_form": "sync",
+}
+"""The module that defines each name."""
 
 __all__ = [
     "list_forms",
     "register_form",
+    "register_forms",
+    "discover_forms",
+    "FormRegistry",
+    "default_registry",
+    "FormHook",
+    "Phase",
+    "PhaseTiming",
     "FormPage",
     "DisplayOnlyFieldType",
     "post_form",
     "start_form",
     "generate_form",
+    "run_form",
+    "Completed",
+    "NeedsInput",
+    "Invalid",
+    "FormResult",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    if (module := _MODULES.get(name)) is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f"pydantic_forms.core.{module}"), name)
+    # Cache it, so that the next access doesn't call this function
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
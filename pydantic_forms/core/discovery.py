@@ -0,0 +1,127 @@
+# Copyright 2019-2026 SURF.
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Discovery of forms that installed packages declare as entry points.
+
+A package declares its forms in the `pydantic_forms.forms` entry-point group, for example in its `pyproject.toml`:
+
+```toml
+[project.entry-points."pydantic_forms.forms"]
+create_port = "app.forms.create_port:create_port_form"
+```
+
+The forms are registered by import path, so no module is imported until its form is started. Reading the entry
+points of every installed distribution still takes time, so the result can be cached in a manifest file.
+"""
+
+import os
+import sys
+from importlib.metadata import entry_points
+from pathlib import Path
+from typing import Union
+
+import structlog
+
+from pydantic_forms.core.shared import FormRegistry, register_forms
+from pydantic_forms.utils.json import json_dumps, json_loads
+
+logger = structlog.get_logger(__name__)
+
+ENTRY_POINT_GROUP = "pydantic_forms.forms"
+
+MANIFEST_VERSION = 1
+
+
+def _fingerprint() -> list[list[Union[str, int]]]:
+    """Return the modification times of the directories on `sys.path`.
+
+    Installing or removing a distribution adds or removes its metadata directory in one of them, which changes that
+    directory's modification time.
+    """
+    fingerprint: list[list[Union[str, int]]] = []
+    for path in sys.path:
+        try:
+            fingerprint.append([path, os.stat(path or ".").st_mtime_ns])
+        except OSError:
+            continue
+    return fingerprint
+
+
+def _scan_entry_points() -> dict[str, str]:
+    forms: dict[str, str] = {}
+    for entry_point in entry_points(group=ENTRY_POINT_GROUP):
+        if forms.setdefault(entry_point.name, entry_point.value) != entry_point.value:
+            raise Exception(
+                f"Form {entry_point.name} is declared as both {forms[entry_point.name]} and {entry_point.value}"
+            )
+    return forms
+
+
+def _read_manifest(manifest: Path, fingerprint: list[list[Union[str, int]]]) -> Union[dict[str, str], None]:
+    try:
+        content = json_loads(manifest.read_bytes())
+    except (OSError, ValueError):
+        return None
+    if (
+        not isinstance(content, dict)
+        or content.get("version") != MANIFEST_VERSION
+        or content.get("fingerprint") != fingerprint
+    ):
+        return None
+    return content["forms"]
+
+
+def _write_manifest(manifest: Path, fingerprint: list[list[Union[str, int]]], forms: dict[str, str]) -> None:
+    content = {"version": MANIFEST_VERSION, "fingerprint": fingerprint, "forms": forms}
+    temporary = manifest.with_name(f"{manifest.name}.{os.getpid()}.tmp")
+    try:
+        temporary.write_text(json_dumps(content))
+        # Replace in one step, so that concurrently starting workers never read a partially written manifest
+        temporary.replace(manifest)
+    except OSError as e:
+        logger.warning("Could not write forms manifest", manifest=str(manifest), error=str(e))
+        temporary.unlink(missing_ok=True)
+
+
+def discover_forms(
+    manifest: Union[str, Path, None] = None, *, registry: Union[FormRegistry, None] = None
+) -> dict[str, str]:
+    """Register the forms of the `pydantic_forms.forms` entry points of all installed packages.
+
+    The forms are registered by import path, so they are only imported when they are started.
+
+    Args:
+    ----
+        manifest: A file to cache the discovered forms in. When it is up to date, the forms are read from it instead
+            of from the metadata of every installed distribution. It is rewritten when a distribution was installed
+            or removed since it was written.
+        registry: The registry to add the forms to, `default_registry` if not given.
+
+    Returns:
+    -------
+        The discovered forms, as a mapping of form key to import path.
+
+    """
+    if manifest is None:
+        forms = _scan_entry_points()
+    else:
+        manifest = Path(manifest)
+        fingerprint = _fingerprint()
+        if (cached := _read_manifest(manifest, fingerprint)) is not None:
+            forms = cached
+        else:
+            forms = _scan_entry_points()
+            _write_manifest(manifest, fingerprint, forms)
+
+    register_forms(forms, registry=registry)
+    return forms
@@ -0,0 +1,232 @@
+# Copyright 2019-2026 SURF.
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Hooks that the engines report the time spent in each phase of running a form to.
+
+Add a hook to a registry with `FormRegistry.add_hook`. As long as a registry has no hooks, and the slow form log of
+`pydantic_forms.core.slowlog` is off, the engines don't even read the clock. `pydantic_forms.core.tracing` has hooks
+that turn the timings into tracing spans.
+"""
+
+from collections.abc import Mapping, Sequence
+from time import perf_counter_ns
+from typing import Any, NamedTuple, Protocol, Union
+
+from pydantic_forms.types import State, strEnum
+
+UNKNOWN_FORM_KEY = "unknown"
+"""The form key that responses for keys that are not registered are reported with, whatever key was asked for."""
+
+INDEX_PLACEHOLDER = "*"
+"""What list indexes in the `loc` of validation errors are replaced with."""
+
+EXTRA_PLACEHOLDER = "<extra>"
+"""What the names of fields that a page doesn't have, and the keys of dicts, in the `loc` of validation errors are
+replaced with."""
+
+
+class Phase(strEnum):
+    STEP = "step"
+    """The form generator running until it yields the next page or returns, in `send` or `asend`."""
+
+    VALIDATE = "validate"
+    """Pydantic validating the user input of a page."""
+
+    DUMP = "dump"
+    """Dumping the validated page and merging it into the state."""
+
+    SCHEMA = "schema"
+    """Generating the JSON schema of the page to render next."""
+
+    TRANSLATE = "translate"
+    """Converting and translating the validation errors of a page."""
+
+
+class PhaseTiming(NamedTuple):
+    form_key: Union[str, None]
+    """The key of the form, if it was started by key."""
+
+    page_index: int
+    """The index of the page, 0 for the first one. A step has the index of the page it produces."""
+
+    page: Union[str, None]
+    """The class name of the page, `None` for the step in which the generator returns."""
+
+    phase: Phase
+
+    start_ns: int
+    """When the phase started, on the `time.perf_counter_ns` clock."""
+
+    duration_ns: int
+
+
+class FormRun(NamedTuple):
+    form_key: Union[str, None]
+
+    inputs: int
+    """The number of user inputs."""
+
+    outcome: str
+    """`Completed`, `NeedsInput` or `Invalid`, or the class name of the exception that ended the run."""
+
+    error_count: int
+    """The number of validation errors."""
+
+    start_ns: int
+    """When the run started, on the `time.perf_counter_ns` clock."""
+
+    duration_ns: int
+
+    error_locs: tuple[str, ...] = ()
+    """The dotted `loc` of each validation error, such as `"contacts.*.email"`.
+
+    The parts that come from the user input rather than from the page are replaced by placeholders, so that a client
+    can't make up new locations: list indexes by `INDEX_PLACEHOLDER`, and unknown fields and dict keys by
+    `EXTRA_PLACEHOLDER`.
+    """
+
+    user_inputs: Sequence[State] = ()
+    """The user inputs themselves. Hooks must not change them."""
+
+    extra_state: Mapping[str, Any] = {}
+    """The extra initial state that `start_form` was given."""
+
+    locale: str = "en_US"
+
+
+class FormHook(Protocol):
+    """Receives the timings of running forms.
+
+    Besides `on_phase`, a hook may define:
+
+    - `on_form_start(form_key)` and `on_form_end(run: FormRun)`, which `start_form` and the forms router call around
+      the phases of one run.
+    - `on_response(form_key, status)`, which `form_error_handler` and the forms router call with the HTTP status of
+      each response they send.
+    """
+
+    def on_phase(self, timing: PhaseTiming) -> None:
+        """Called after each phase of running a form, in the thread or task that runs it."""
+
+
+def _error_loc(error: Mapping[str, Any]) -> str:
+    loc = list(error.get("loc", ()))
+    if error.get("type") == "extra_forbidden" and loc:
+        loc[-1] = EXTRA_PLACEHOLDER
+    parts = []
+    for position, part in enumerate(loc):
+        if isinstance(part, int):
+            part = INDEX_PLACEHOLDER
+        # Pydantic locates an invalid dict key by the key followed by "[key]"
+        elif loc[position + 1 : position + 2] == ["[key]"]:
+            part = EXTRA_PLACEHOLDER
+        parts.append(str(part))
+    return ".".join(parts)
+
+
+def report_response(hooks: tuple[FormHook, ...], form_key: Union[str, None], status: int) -> None:
+    """Report the HTTP status of a response to the hooks that define `on_response`."""
+    for hook in hooks:
+        if on_response := getattr(hook, "on_response", None):
+            on_response(form_key, status)
+
+
+class PhaseClock:
+    """Times consecutive phases of running a form and reports them to the hooks.
+
+    Call `start` before the first phase and `lap` at the end of each phase; the next phase starts where the previous
+    one ended.
+    """
+
+    def __init__(self, hooks: tuple[FormHook, ...], form_key: Union[str, None]) -> None:
+        self._hooks = hooks
+        self._form_key = form_key
+        self._start_ns = 0
+        self._run_start_ns = 0
+
+    def begin(self) -> None:
+        """Start timing a whole run of the form."""
+        for hook in self._hooks:
+            if on_form_start := getattr(hook, "on_form_start", None):
+                on_form_start(self._form_key)
+        self._run_start_ns = perf_counter_ns()
+
+    def end(
+        self,
+        user_inputs: Sequence[State],
+        outcome: object,
+        *,
+        extra_state: Mapping[str, Any] = {},  # noqa: B006
+        locale: str = "en_US",
+    ) -> None:
+        """Report the run that just ended with `outcome`: a form result or an exception."""
+        duration_ns = perf_counter_ns() - self._run_start_ns
+        # Invalid and FormValidationError carry a list of errors; other exceptions may have an unrelated `errors`
+        errors = errors if isinstance(errors := getattr(outcome, "errors", None), list) else []
+        error_locs = tuple(_error_loc(error) for error in errors)
+        run = FormRun(
+            self._form_key,
+            len(user_inputs),
+            type(outcome).__name__,
+            len(errors),
+            self._run_start_ns,
+            duration_ns,
+            error_locs,
+            user_inputs,
+            extra_state,
+            locale,
+        )
+        for hook in self._hooks:
+            if on_form_end := getattr(hook, "on_form_end", None):
+                on_form_end(run)
+
+    def start(self) -> None:
+        self._start_ns = perf_counter_ns()
+
+    def lap(self, phase: Phase, page_index: int, page: Any) -> None:
+        """Report the phase that just ended, for `page`: a page class, or anything else for no page."""
+        now = perf_counter_ns()
+        page_name = page.__name__ if isinstance(page, type) else None
+        timing = PhaseTiming(self._form_key, page_index, page_name, phase, self._start_ns, now - self._start_ns)
+        for hook in self._hooks:
+            hook.on_phase(timing)
+        self._start_ns = perf_counter_ns()
+
+
+class _NoClock(PhaseClock):
+    """The clock of a registry without hooks, which doesn't even read the time."""
+
+    def __init__(self) -> None:
+        super().__init__((), None)
+
+    def begin(self) -> None:
+        pass
+
+    def end(
+        self,
+        user_inputs: Sequence[State],
+        outcome: object,
+        *,
+        extra_state: Mapping[str, Any] = {},  # noqa: B006
+        locale: str = "en_US",
+    ) -> None:
+        pass
+
+    def start(self) -> None:
+        pass
+
+    def lap(self, phase: Phase, page_index: int, page: Any) -> None:
+        pass
+
+
+NO_CLOCK = _NoClock()
@@ -0,0 +1,182 @@
+# Copyright 2019-2026 SURF.
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""In-process metrics of running forms, exported in the Prometheus text format.
+
+`MetricsCollector` is a hook, see `pydantic_forms.core.hooks`. It counts the outcomes of runs, validation errors per
+field and HTTP responses per form key. It keeps histograms of the duration of runs and of each phase of every page,
+and exports the schema cache counters of its registry. `export` renders everything as text, to serve from a
+`/metrics` endpoint of the application; no client library or network connection is needed.
+"""
+
+from bisect import bisect_left
+from collections import defaultdict
+from threading import Lock
+from typing import Union
+
+from pydantic_forms.core.hooks import FormRun, PhaseTiming
+from pydantic_forms.core.shared import FormRegistry, default_registry
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+"""The content type of the Prometheus text format that `export` renders."""
+
+DURATION_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+"""The upper bounds in seconds of the buckets of the duration histograms."""
+
+Labels = tuple[tuple[str, str], ...]
+
+
+class _Histogram:
+    __slots__ = ("buckets", "count", "sum")
+
+    def __init__(self) -> None:
+        self.buckets = [0] * (len(DURATION_BUCKETS) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        self.buckets[bisect_left(DURATION_BUCKETS, value)] += 1
+        self.count += 1
+        self.sum += value
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(labels: Labels) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in labels) + "}"
+
+
+def _form_key_label(form_key: Union[str, None]) -> tuple[str, str]:
+    return ("form_key", form_key or "")
+
+
+class MetricsCollector:
+    """Collects metrics of the forms of a registry.
+
+    Creating the collector adds it to the hooks of the registry.
+
+    Args:
+    ----
+        registry: The registry to collect the metrics of, `default_registry` if not given.
+
+    Examples:
+    --------
+        >>> from pydantic_forms.core import FormRegistry
+        >>> metrics = MetricsCollector(FormRegistry())
+        >>> print(metrics.export().splitlines()[0])
+        # HELP pydantic_forms_runs_total Runs of forms by outcome: Completed, NeedsInput, Invalid or an exception name.
+
+    """
+
+    def __init__(self, registry: Union[FormRegistry, None] = None) -> None:
+        self.registry = registry or default_registry
+        self._lock = Lock()
+        self._runs: defaultdict[Labels, int] = defaultdict(int)
+        self._validation_errors: defaultdict[Labels, int] = defaultdict(int)
+        self._responses: defaultdict[Labels, int] = defaultdict(int)
+        self._run_durations: defaultdict[Labels, _Histogram] = defaultdict(_Histogram)
+        self._phase_durations: defaultdict[Labels, _Histogram] = defaultdict(_Histogram)
+        self.registry.add_hook(self)
+
+    def on_phase(self, timing: PhaseTiming) -> None:
+        labels = (
+            _form_key_label(timing.form_key),
+            ("page", timing.page or ""),
+            ("page_index", str(timing.page_index)),
+            ("phase", str(timing.phase)),
+        )
+        with self._lock:
+            self._phase_durations[labels].observe(timing.duration_ns / 1e9)
+
+    def on_form_end(self, run: FormRun) -> None:
+        form_key = _form_key_label(run.form_key)
+        with self._lock:
+            self._runs[(form_key, ("outcome", run.outcome))] += 1
+            self._run_durations[(form_key,)].observe(run.duration_ns / 1e9)
+            for loc in run.error_locs:
+                self._validation_errors[(form_key, ("loc", loc))] += 1
+
+    def on_response(self, form_key: Union[str, None], status: int) -> None:
+        with self._lock:
+            self._responses[(_form_key_label(form_key), ("status", str(status)))] += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            for metric in (
+                self._runs,
+                self._validation_errors,
+                self._responses,
+                self._run_durations,
+                self._phase_durations,
+            ):
+                metric.clear()
+
+    def export(self) -> str:
+        """Render the metrics in the Prometheus text exposition format."""
+        lines: list[str] = []
+
+        def counter(name: str, help_text: str, values: dict[Labels, int]) -> None:
+            lines.extend((f"# HELP {name} {help_text}", f"# TYPE {name} counter"))
+            lines.extend(f"{name}{_format_labels(labels)} {value}" for labels, value in sorted(values.items()))
+
+        def histogram(name: str, help_text: str, values: dict[Labels, _Histogram]) -> None:
+            lines.extend((f"# HELP {name} {help_text}", f"# TYPE {name} histogram"))
+            for labels, observed in sorted(values.items()):
+                cumulative = 0
+                for bound, count in zip((*map(str, DURATION_BUCKETS), "+Inf"), observed.buckets):
+                    cumulative += count
+                    lines.append(f"{name}_bucket{_format_labels((*labels, ('le', bound)))} {cumulative}")
+                lines.append(f"{name}_sum{_format_labels(labels)} {observed.sum}")
+                lines.append(f"{name}_count{_format_labels(labels)} {observed.count}")
+
+        with self._lock:
+            counter(
+                "pydantic_forms_runs_total",
+                "Runs of forms by outcome: Completed, NeedsInput, Invalid or an exception name.",
+                self._runs,
+            )
+            counter(
+                "pydantic_forms_validation_errors_total",
+                "Validation errors by the dotted location of the field.",
+                self._validation_errors,
+            )
+            counter("pydantic_forms_responses_total", "HTTP responses by status code.", self._responses)
+            histogram("pydantic_forms_run_duration_seconds", "Duration of runs of forms.", self._run_durations)
+            histogram(
+                "pydantic_forms_phase_duration_seconds",
+                "Duration of each phase of running a page of a form.",
+                self._phase_durations,
+            )
+
+        registry_metrics = self.registry.metrics
+        counter(
+            "pydantic_forms_schema_cache_total",
+            "Lookups in the schema cache of the registry by result.",
+            {
+                (("result", "hit"),): registry_metrics["schema_cache_hits"],
+                (("result", "miss"),): registry_metrics["schema_cache_misses"],
+            },
+        )
+        counter(
+            "pydantic_forms_compressed_cache_total",
+            "Lookups in the compressed bodies cache of the forms routers by result.",
+            {
+                (("result", "hit"),): registry_metrics["compressed_cache_hits"],
+                (("result", "miss"),): registry_metrics["compressed_cache_misses"],
+            },
+        )
+        return "\n".join(lines) + "\n"
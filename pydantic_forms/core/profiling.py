@@ -0,0 +1,216 @@
+# Copyright 2019-2026 SURF.
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Profiling a run of a single form, to find out why it is slow.
+
+`profile_form` runs a form on given user inputs under `cProfile`, while a sampling thread records the stack of the
+run every millisecond or so. The phase timings of the engine, see `pydantic_forms.core.hooks`, split the time between
+the form generator itself and the library: validating, dumping, generating schemas and translating errors.
+
+`python -m pydantic_forms profile` does the same from the command line, and writes the `cProfile` stats and the
+sampled stacks in the collapsed format that flame graph tools read.
+"""
+
+import asyncio
+import cProfile
+import pstats
+import sys
+import threading
+from collections import Counter
+from dataclasses import dataclass, field
+from inspect import isasyncgenfunction
+from io import StringIO
+from pathlib import Path
+from time import perf_counter_ns
+from types import CodeType, FrameType
+from typing import Any, Union
+
+from pydantic_forms.core import asynchronous, sync
+from pydantic_forms.core.hooks import Phase, PhaseTiming
+from pydantic_forms.core.shared import FormRegistry, NeedsInput, default_registry, get_form
+from pydantic_forms.types import State
+
+SAMPLE_INTERVAL = 0.001
+"""The seconds between two samples of the stack."""
+
+
+def _frame_label(code: CodeType) -> str:
+    # Semicolons separate the frames of a collapsed stack
+    return f"{code.co_name} ({code.co_filename}:{code.co_firstlineno})".replace(";", ":")
+
+
+class _Sampler(threading.Thread):
+    """Samples the stack of a thread below the frame of `root`."""
+
+    def __init__(self, thread_id: int, root: CodeType, interval: float) -> None:
+        super().__init__(name="pydantic-forms-sampler", daemon=True)
+        self.thread_id = thread_id
+        self.root = root
+        self.interval = interval
+        self.stacks: Counter[str] = Counter()
+        self._stop_sampling = threading.Event()
+
+    def run(self) -> None:
+        while not self._stop_sampling.wait(self.interval):
+            frame: Union[FrameType, None] = sys._current_frames().get(self.thread_id)
+            labels = []
+            while frame is not None:
+                labels.append(_frame_label(frame.f_code))
+                if frame.f_code is self.root:
+                    self.stacks[";".join(reversed(labels))] += 1
+                    break
+                frame = frame.f_back
+
+    def stop(self) -> None:
+        self._stop_sampling.set()
+        self.join()
+
+
+class _PhaseTotals:
+    """A hook that adds up the time spent in each phase."""
+
+    def __init__(self, form_key: str) -> None:
+        self.form_key = form_key
+        self.totals: Counter[Phase] = Counter()
+
+    def on_phase(self, timing: PhaseTiming) -> None:
+        if timing.form_key == self.form_key:
+            self.totals[timing.phase] += timing.duration_ns
+
+
+def _run_once(
+    form_key: str, user_inputs: list[State], extra_state: dict[str, Any], locale: str, registry: FormRegistry
+) -> str:
+    state = {"form_key": form_key, **extra_state}
+    try:
+        if isasyncgenfunction(get_form(form_key, registry=registry)):
+            async_form = asynchronous._get_form(form_key, registry)
+            result = asyncio.run(asynchronous.run_form(async_form, state, user_inputs, locale, registry=registry))
+        else:
+            sync_form = sync._get_form(form_key, registry)
+            result = sync.run_form(sync_form, state, user_inputs, locale, registry=registry)
+        if isinstance(result, NeedsInput):
+            # Like `start_form`, generate the schema of the page that the run ends on
+            result.schema  # noqa: B018
+    except Exception as e:
+        return type(e).__name__
+    return type(result).__name__
+
+
+@dataclass
+class FormProfile:
+    form_key: str
+    outcome: str
+    """`Completed`, `NeedsInput` or `Invalid`, or the class name of the exception that ended the run."""
+
+    runs: int
+    duration_ns: int
+    """The total duration of the runs, under the profiler."""
+
+    stats: pstats.Stats = field(repr=False)
+    stacks: Counter[str] = field(default_factory=Counter, repr=False)
+    """The number of samples per stack, with the frames separated by semicolons, outermost first."""
+
+    phases: Counter[Phase] = field(default_factory=Counter)
+    """The nanoseconds spent in each phase of the runs."""
+
+    @property
+    def form_ns(self) -> int:
+        """The time spent in the form generator itself, including the page classes it defines."""
+        return self.phases[Phase.STEP]
+
+    @property
+    def library_ns(self) -> int:
+        """The time spent in pydantic-forms and pydantic, validating, dumping, generating schemas and translating."""
+        return sum(duration for phase, duration in self.phases.items() if phase != Phase.STEP)
+
+    def write_pstats(self, path: Union[str, Path]) -> None:
+        """Write the `cProfile` stats, for `python -m pstats` or a viewer such as snakeviz."""
+        self.stats.dump_stats(path)
+
+    def write_collapsed(self, path: Union[str, Path]) -> None:
+        """Write the sampled stacks in the collapsed format, for flamegraph.pl, speedscope or inferno."""
+        Path(path).write_text("".join(f"{stack} {count}\n" for stack, count in sorted(self.stacks.items())))
+
+    def __str__(self) -> str:
+        total = self.duration_ns or 1
+        other_ns = self.duration_ns - self.form_ns - self.library_ns
+        lines = [
+            f"{self.runs} runs of {self.form_key}: {self.outcome}, {self.duration_ns / 1e6:.2f} ms under the profiler",
+            f"form generator: {self.form_ns / 1e6:.2f} ms ({self.form_ns / total:.0%})",
+            f"library: {self.library_ns / 1e6:.2f} ms ({self.library_ns / total:.0%})",
+            *(f"  {phase}: {self.phases[phase] / 1e6:.2f} ms" for phase in Phase if phase != Phase.STEP),
+            f"other: {other_ns / 1e6:.2f} ms ({other_ns / total:.0%})",
+        ]
+        functions = StringIO()
+        self.stats.stream = functions  # type: ignore[attr-defined]
+        self.stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(15)
+        lines.append(functions.getvalue().strip())
+        return "\n".join(lines)
+
+
+def profile_form(
+    form_key: str,
+    user_inputs: list[State],
+    *,
+    extra_state: Union[dict[str, Any], None] = None,
+    locale: str = "en_US",
+    runs: int = 1,
+    registry: Union[FormRegistry, None] = None,
+    sample_interval: float = SAMPLE_INTERVAL,
+) -> FormProfile:
+    """Run a form under the profiler.
+
+    Args:
+    ----
+        form_key: The key of the form to run.
+        user_inputs: The user inputs to run it on, like `start_form` takes them.
+        extra_state: Extra initial state of the form.
+        locale: The locale to translate validation errors to.
+        runs: The number of times to run the form. A short run gives few samples of the stack, and the first run
+            fills the schema cache.
+        registry: The registry of the form, `default_registry` if not given.
+        sample_interval: The seconds between two samples of the stack.
+
+    Returns:
+    -------
+        The profile, which prints as a summary.
+
+    """
+    if runs < 1:
+        raise ValueError("runs must be at least 1")
+
+    registry = registry or default_registry
+    extra_state = extra_state or {}
+    phase_totals = _PhaseTotals(form_key)
+    profiler = cProfile.Profile()
+    sampler = _Sampler(threading.get_ident(), _run_once.__code__, sample_interval)
+    switch_interval = sys.getswitchinterval()
+
+    registry.add_hook(phase_totals)
+    # Let the sampler take the GIL as often as it means to sample
+    sys.setswitchinterval(min(switch_interval, sample_interval))
+    sampler.start()
+    start = perf_counter_ns()
+    try:
+        for _ in range(runs):
+            outcome = profiler.runcall(_run_once, form_key, user_inputs, extra_state, locale, registry)
+    finally:
+        duration_ns = perf_counter_ns() - start
+        sampler.stop()
+        sys.setswitchinterval(switch_interval)
+        registry.remove_hook(phase_totals)
+
+    return FormProfile(
+        form_key, outcome, runs, duration_ns, pstats.Stats(profiler), sampler.stacks, phase_totals.totals
+    )
@@ -0,0 +1,240 @@
+# Copyright 2019-2026 SURF.
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Recording of form runs, to replay real traffic offline.
+
+`FormRecorder` is a hook, see `pydantic_forms.core.hooks`. It writes every run of a form, by `start_form` or the
+forms router, as one line of JSON to a file that rotates at a size limit. Encoding a record is all the work done in
+the thread that runs the form; a background thread writes the records. When the writer can't keep up, records are
+dropped rather than slowing down the forms.
+
+`replay` runs the recorded inputs through the engines again, and reports the runs whose outcome changed and the
+duration per form key. `python -m pydantic_forms replay` does the same from the command line.
+"""
+
+import asyncio
+import os
+import time
+from collections import defaultdict
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from inspect import isasyncgenfunction
+from pathlib import Path
+from queue import Full, Queue
+from threading import Thread
+from typing import IO, Any, NamedTuple, Union, cast
+
+from pydantic_forms.core import asynchronous, sync
+from pydantic_forms.core.hooks import FormRun, PhaseTiming
+from pydantic_forms.core.shared import FormRegistry, NeedsInput, default_registry, get_form
+from pydantic_forms.utils.json import json_dumps, json_loads
+
+
+class FormRecorder:
+    """Records the runs of the forms of a registry in a JSONL file.
+
+    Creating the recorder adds it to the hooks of the registry and starts its writer thread. `close` stops both and
+    writes the records that are still queued; use the recorder as a context manager to close it automatically.
+
+    Each line holds the `form_key`, `extra_state`, `user_inputs` and `locale` of a run, its `outcome`, the time it
+    started in seconds since the epoch and its duration in milliseconds. Runs whose extra state can't be encoded as
+    JSON are not recorded.
+
+    Args:
+    ----
+        path: The file to write to. When it reaches `max_bytes` it is renamed to `<path>.1`, the previous `<path>.1`
+            to `<path>.2` and so on, keeping at most `backup_count` old files.
+        max_bytes: The size at which the file is rotated.
+        backup_count: The number of rotated files to keep.
+        queue_size: The number of records that may wait for the writer; more are dropped and counted in `dropped`.
+        registry: The registry to record the runs of, `default_registry` if not given.
+
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        *,
+        max_bytes: int = 100 * 1024 * 1024,
+        backup_count: int = 5,
+        queue_size: int = 10_000,
+        registry: Union[FormRegistry, None] = None,
+    ) -> None:
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        self.registry = registry or default_registry
+        self.dropped = 0
+        self._queue: Queue[Union[str, None]] = Queue(queue_size)
+        self._file: IO[str] = self.path.open("a", encoding="utf-8")
+        self._writer = Thread(target=self._write, name="pydantic-forms-recorder", daemon=True)
+        self._writer.start()
+        self.registry.add_hook(self)
+
+    def on_phase(self, timing: PhaseTiming) -> None:
+        pass
+
+    def on_form_end(self, run: FormRun) -> None:
+        record = {
+            "time": time.time() - run.duration_ns / 1e9,
+            "form_key": run.form_key,
+            "extra_state": run.extra_state,
+            "user_inputs": run.user_inputs,
+            "locale": run.locale,
+            "outcome": run.outcome,
+            "duration_ms": run.duration_ns / 1e6,
+        }
+        try:
+            # Encode here rather than in the writer, as the form may still change the objects after the run
+            line = json_dumps(record)
+            self._queue.put_nowait(line)
+        except (TypeError, ValueError, Full):
+            self.dropped += 1
+
+    def _write(self) -> None:
+        while (line := self._queue.get()) is not None:
+            self._file.write(line)
+            self._file.write("\n")
+            if self._file.tell() >= self.max_bytes:
+                self._rotate()
+            elif self._queue.empty():
+                self._file.flush()
+        self._file.close()
+
+    def _rotate(self) -> None:
+        self._file.close()
+        if self.backup_count > 0:
+            for number in range(self.backup_count - 1, 0, -1):
+                if (backup := self.path.with_name(f"{self.path.name}.{number}")).exists():
+                    os.replace(backup, self.path.with_name(f"{self.path.name}.{number + 1}"))
+            os.replace(self.path, self.path.with_name(f"{self.path.name}.1"))
+            self._file = self.path.open("a", encoding="utf-8")
+        else:
+            self._file = self.path.open("w", encoding="utf-8")
+
+    def close(self) -> None:
+        """Stop recording, and wait until the queued records are written."""
+        self.registry.remove_hook(self)
+        if self._writer.is_alive():
+            self._queue.put(None)
+            self._writer.join()
+
+    def __enter__(self) -> "FormRecorder":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+
+def read_recordings(path: Union[str, Path]) -> Iterator[dict[str, Any]]:
+    """Read the records of a recording, oldest first, including the files it was rotated into."""
+    path = Path(path)
+    backups = sorted(
+        (backup for backup in path.parent.glob(f"{path.name}.*") if backup.suffix[1:].isdigit()),
+        key=lambda backup: int(backup.suffix[1:]),
+        reverse=True,
+    )
+    for file in [*backups, path]:
+        with file.open(encoding="utf-8") as lines:
+            for line in lines:
+                if line.strip():
+                    yield cast(dict[str, Any], json_loads(line))
+
+
+class Mismatch(NamedTuple):
+    position: int
+    """The position of the record in the recording, 0 for the oldest."""
+
+    form_key: str
+    recorded: str
+    replayed: str
+
+
+@dataclass
+class ReplayReport:
+    runs: int = 0
+    mismatches: list[Mismatch] = field(default_factory=list)
+    """The runs whose outcome differs from the recorded one."""
+
+    recorded_ms: defaultdict[str, list[float]] = field(default_factory=lambda: defaultdict(list))
+    replayed_ms: defaultdict[str, list[float]] = field(default_factory=lambda: defaultdict(list))
+    """The duration of each run in milliseconds, per form key."""
+
+    def __str__(self) -> str:
+        lines = [f"Replayed {self.runs} runs, {len(self.mismatches)} with another outcome"]
+        for form_key, replayed in sorted(self.replayed_ms.items()):
+            recorded = self.recorded_ms[form_key]
+            lines.append(
+                f"{form_key}: {len(replayed)} runs, mean {sum(recorded) / len(recorded):.2f} ms recorded, "
+                f"{sum(replayed) / len(replayed):.2f} ms replayed"
+            )
+        lines.extend(
+            f"#{mismatch.position} {mismatch.form_key}: recorded {mismatch.recorded}, replayed {mismatch.replayed}"
+            for mismatch in self.mismatches
+        )
+        return "\n".join(lines)
+
+
+async def _replay_run(record: dict[str, Any], registry: FormRegistry) -> str:
+    form_key = record["form_key"]
+    state = {"form_key": form_key, **record["extra_state"]}
+    try:
+        if isasyncgenfunction(get_form(form_key, registry=registry)):
+            async_form = asynchronous._get_form(form_key, registry)
+            result = await asynchronous.run_form(
+                async_form, state, record["user_inputs"], record["locale"], registry=registry
+            )
+        else:
+            sync_form = sync._get_form(form_key, registry)
+            result = sync.run_form(sync_form, state, record["user_inputs"], record["locale"], registry=registry)
+        if isinstance(result, NeedsInput):
+            # Like `start_form`, generate the schema of the page that the run ends on
+            result.schema  # noqa: B018
+    except Exception as e:
+        return type(e).__name__
+    return type(result).__name__
+
+
+async def _replay(path: Union[str, Path], registry: FormRegistry) -> ReplayReport:
+    report = ReplayReport()
+    for position, record in enumerate(read_recordings(path)):
+        start = time.perf_counter_ns()
+        outcome = await _replay_run(record, registry)
+        duration_ms = (time.perf_counter_ns() - start) / 1e6
+
+        form_key = record["form_key"]
+        report.runs += 1
+        report.recorded_ms[form_key].append(record["duration_ms"])
+        report.replayed_ms[form_key].append(duration_ms)
+        if outcome != record["outcome"]:
+            report.mismatches.append(Mismatch(position, form_key, record["outcome"], outcome))
+    return report
+
+
+def replay(path: Union[str, Path], *, registry: Union[FormRegistry, None] = None) -> ReplayReport:
+    """Run the records of a recording through the engines again, one after the other.
+
+    The forms run with `run_form`, like `start_form` would run them, on the recorded user inputs, extra state and
+    locale. Async forms run in a new event loop.
+
+    Args:
+    ----
+        path: The recording, as written by `FormRecorder`. The files it was rotated into are replayed first.
+        registry: The registry with the recorded forms, `default_registry` if not given.
+
+    Returns:
+    -------
+        The report, which prints as a summary.
+
+    """
+    return asyncio.run(_replay(path, registry or default_registry))
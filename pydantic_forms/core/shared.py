@@ -10,15 +10,34 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+from collections import Counter, OrderedDict
+from collections.abc import Mapping
+from contextlib import suppress
+from contextvars import ContextVar
+from copy import deepcopy
+from dataclasses import dataclass, field
+from functools import cache, cached_property
+from hashlib import blake2b
+from importlib import import_module
 from inspect import isasyncgenfunction, isgeneratorfunction
-from typing import Any, Callable, ClassVar, cast
+from threading import Lock
+from typing import Any, Callable, ClassVar, Optional, Union, cast
+from weakref import WeakKeyDictionary, ref
 
 import structlog
 from pydantic import BaseModel, ConfigDict, PydanticUndefinedAnnotation, version
 from pydantic.json_schema import GenerateJsonSchema, JsonSchemaValue
-from pydantic_core import core_schema
-
-from pydantic_forms.types import JSON
+from pydantic_core import ErrorDetails, core_schema
+from pydantic_i18n import PydanticI18n
+from typing_extensions import Self
+
+from pydantic_forms.core.hooks import NO_CLOCK, FormHook, Phase, PhaseClock
+from pydantic_forms.core.slowlog import slow_form_log
+from pydantic_forms.core.translations import translations as default_translations
+from pydantic_forms.exceptions import FormException, FormNotCompleteError, FormValidationError
+from pydantic_forms.settings import settings
+from pydantic_forms.types import JSON, InputForm, RawJSON, State
+from pydantic_forms.utils.json import json_dumps, json_loads_as
 
 logger = structlog.get_logger(__name__)
 
@@ -59,6 +78,10 @@ class DisplayOnlyFieldType:
     pass
 
 
+# The options of the validation in progress, for `FormPage.__init__`
+_validation_options: ContextVar[Optional[dict[str, Any]]] = ContextVar("validation_options", default=None)
+
+
 class FormPage(BaseModel):
     model_config = ConfigDict(
         arbitrary_types_allowed=True,
@@ -84,7 +107,26 @@ class FormPage(BaseModel):
             return v
 
         mutable_data = {k: get_value(k, v) for k, v in data.items()}
-        super().__init__(**mutable_data)
+        if options := _validation_options.get():
+            self.__pydantic_validator__.validate_python(mutable_data, self_instance=self, **options)
+        else:
+            super().__init__(**mutable_data)
+
+    @classmethod
+    def model_validate_json(cls, json_data: Union[str, bytes, bytearray], **kwargs: Any) -> Self:
+        """Validate a JSON document, with the options of `BaseModel.model_validate_json` such as `strict` or `context`.
+
+        Pydantic validates the decoded document through `__init__`, which keeps frozen fields at their default, so
+        `strict` applies to the decoded values as it does for `FormPage(**data)`.
+        """
+        if not kwargs:
+            return super().model_validate_json(json_data)
+        # Pydantic doesn't pass the options on to a custom __init__, so they go along in a context variable
+        token = _validation_options.set(kwargs)
+        try:
+            return super().model_validate_json(json_data, **kwargs)
+        finally:
+            _validation_options.reset(token)
 
     if PYDANTIC_VERSION in ("2.9", "2.10", "2.11"):
 
@@ -136,19 +178,342 @@ class FormPage(BaseModel):
                 cls.model_rebuild(force=True)
 
 
-FORMS: dict[str, Callable] = {}
+def _import_path(form: Callable) -> str:
+    return f"{form.__module__}:{form.__qualname__}"
+
+
+@cache
+def _import_form(path: str) -> Any:
+    module_name, _, attribute = path.partition(":")
+    obj: Any = import_module(module_name)
+    for name in attribute.split("."):
+        obj = getattr(obj, name)
+    return obj
+
+
+def _has_default_factory(schema: Any) -> bool:
+    if isinstance(schema, dict):
+        return "default_factory" in schema or any(_has_default_factory(value) for value in schema.values())
+    if isinstance(schema, list):
+        return any(_has_default_factory(value) for value in schema)
+    return False
+
+
+# Whether the schema of a page is the same on every render, per page class; entries disappear together with the class
+_stable_schemas: WeakKeyDictionary[InputForm, bool] = WeakKeyDictionary()
+
+
+def has_stable_schema(page: InputForm) -> bool:
+    """Return whether every render of `page` has the same schema, so that it may be cached.
+
+    The schema of a page with a `default_factory` carries the defaults its factories produce, which may differ each
+    time.
+    """
+    if (stable := _stable_schemas.get(page)) is None:
+        stable = _stable_schemas[page] = not _has_default_factory(page.__pydantic_core_schema__)
+    return stable
+
+
+def _forget_schema_callback(registry_ref: "ref[FormRegistry]") -> Callable[["ref[InputForm]"], None]:
+    """Return the callback that removes the schema of a page from the cache of a registry once the page is gone.
+
+    It holds the registry by a weak reference, so that the pages in its cache don't keep it alive.
+    """
+
+    def forget_schema(page_ref: "ref[InputForm]") -> None:
+        if (registry := registry_ref()) is not None:
+            registry._schemas.pop(page_ref, None)
+
+    return forget_schema
+
+
+class FormRegistry:
+    """A namespace of forms, together with the caches that are used to run them.
+
+    `register_form`, `get_form`, `list_forms` and the engines use `default_registry` unless they are given another
+    one. Create more registries to keep, for example, the forms of tenants apart, or to give each its own cache
+    sizes and translations.
+
+    Reading a registry takes no lock, so any number of threads can look up forms and cached schemas while another
+    registers forms.
+
+    Args:
+    ----
+        schema_cache_size: The number of page schemas to keep, evicting the least recently used one first. Entries
+            also disappear together with their page class.
+        translations: The translations of validation errors per locale, `pydantic_forms.core.translations` if not
+            given.
+
+    """
+
+    def __init__(
+        self, *, schema_cache_size: int = 512, translations: Union[dict[str, dict[str, str]], None] = None
+    ) -> None:
+        self.forms: dict[str, Callable] = {}
+        """The registered form generators by key."""
+
+        self.lazy_forms: dict[str, str] = {}
+        """The forms registered by import path, "module:attribute", which are imported on first use."""
+
+        self.schema_cache_size = schema_cache_size
+        self.metrics: Counter[str] = Counter()
+        """Counts of `schema_cache_hits`, `schema_cache_misses` and `forms_imported`, and of the
+        `compressed_cache_hits` and `compressed_cache_misses` of the forms routers that serve the registry."""
+
+        self.hooks: tuple[FormHook, ...] = ()
+        """The hooks that the engines report the time spent in each phase of running a form to."""
+
+        self._translations = default_translations if translations is None else translations
+        self._translator: Union[PydanticI18n, None] = None
+        # The schemas by a weak reference to their page, least recently used first
+        self._schemas: OrderedDict[ref[InputForm], JSON] = OrderedDict()
+        self._forget_schema = _forget_schema_callback(ref(self))
+        self._lock = Lock()
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.forms or key in self.lazy_forms
+
+    def _register(self, key: str, form: Union[Callable, str]) -> None:
+        if isinstance(form, str):
+            module, _, attribute = form.partition(":")
+            if not module or not attribute:
+                raise Exception(
+                    f"Trying to register form {key} by import path {form!r}, which is not 'module:attribute'"
+                )
+            if (key in self.lazy_forms and form != self.lazy_forms[key]) or (
+                key in self.forms and form != _import_path(self.forms[key])
+            ):
+                raise Exception(f"Trying to re-register form {key} with a different function")
+            if key not in self.forms:
+                self.lazy_forms[key] = form
+            return
+
+        if (key in self.forms and form is not self.forms[key]) or (
+            key in self.lazy_forms and _import_path(form) != self.lazy_forms[key]
+        ):
+            raise Exception(f"Trying to re-register form {key} with a different function")
+
+        if not isasyncgenfunction(form) and not isgeneratorfunction(form):
+            raise Exception(f"Trying to register form {key} function {form} which is not an (async) generator function")
+
+        # Add before removing, so that a concurrent lookup always finds the form
+        self.forms[key] = form
+        self.lazy_forms.pop(key, None)
+
+    def register(self, key: str, form: Union[Callable, str]) -> None:
+        """Register a form generator, or its import path, under `key`; see `register_form`."""
+        # Log a constant amount of data, however many forms are registered
+        name = form if isinstance(form, str) else getattr(form, "__qualname__", repr(form))
+        logger.info("Register form", key=key, form=name, registered=len(self.forms) + len(self.lazy_forms))
+        with self._lock:
+            self._register(key, form)
+
+    def register_many(self, forms: Mapping[str, Union[Callable, str]]) -> None:
+        """Register several forms at once, logging a single line for all of them."""
+        logger.info("Register forms", count=len(forms), registered=len(self.forms) + len(self.lazy_forms))
+        with self._lock:
+            for key, form in forms.items():
+                self._register(key, form)
+
+    def get(self, key: str) -> Union[Callable, None]:
+        """Return the form registered under `key`, importing it first if it was registered by import path."""
+        if (form := self.forms.get(key)) is not None or (path := self.lazy_forms.get(key)) is None:
+            return form
+
+        try:
+            form = _import_form(path)
+        except (ImportError, AttributeError) as e:
+            raise FormException(f"Form {key} could not be imported from {path}: {e}") from e
+        self.metrics["forms_imported"] += 1
+        return form
+
+    def keys(self) -> list[str]:
+        """Return the keys of the registered forms, the ones registered by import path last."""
+        return list(self.forms) + list(self.lazy_forms)
+
+    def schema(self, page: InputForm) -> JSON:
+        """Return the JSON schema of a page, generating it only the first time.
+
+        Every call returns a copy, so that callers can change it without affecting the cache. Pages with a
+        `default_factory` are not cached, as the defaults in their schema are produced anew each time.
+        """
+        if (schema := self._schemas.get(key := ref(page))) is not None:
+            self.metrics["schema_cache_hits"] += 1
+            # Another thread may have evicted it in the meantime
+            with suppress(KeyError):
+                self._schemas.move_to_end(key)
+            return deepcopy(schema)
+
+        self.metrics["schema_cache_misses"] += 1
+        schema = form_schema(page)
+        if not has_stable_schema(page):
+            return schema
+        with self._lock:
+            if len(self._schemas) >= self.schema_cache_size:
+                self._schemas.popitem(last=False)
+            self._schemas[ref(page, self._forget_schema)] = schema
+        return deepcopy(schema)
+
+    def add_hook(self, hook: FormHook) -> None:
+        """Report the time spent in each phase of running the forms of this registry to `hook`."""
+        with self._lock:
+            self.hooks = (*self.hooks, hook)
+
+    def remove_hook(self, hook: FormHook) -> None:
+        with self._lock:
+            self.hooks = tuple(h for h in self.hooks if h is not hook)
+
+    def phase_clock(self, form_key: Union[str, None]) -> PhaseClock:
+        """Return a clock that reports the phases of running a form to the hooks, a no-op one without hooks.
+
+        While `settings.slow_form_threshold_ms` is set, the clock reports to the slow form log as well.
+        """
+        hooks = self.hooks
+        if settings.slow_form_threshold_ms:
+            hooks = (*hooks, slow_form_log)
+        return PhaseClock(hooks, form_key) if hooks else NO_CLOCK
+
+    @property
+    def translator(self) -> PydanticI18n:
+        """The translator of validation errors, created on first use."""
+        if self._translator is None:
+            self._translator = PydanticI18n(self._translations)
+        return self._translator
+
+
+default_registry = FormRegistry()
+
+# The forms of the default registry, which were a plain dict before registries existed
+FORMS: dict[str, Callable] = default_registry.forms
+LAZY_FORMS: dict[str, str] = default_registry.lazy_forms
+
+
+def register_form(key: str, form: Union[Callable, str], *, registry: Union[FormRegistry, None] = None) -> None:
+    """Register a form generator under `key`.
+
+    Args:
+    ----
+        key: The key to start the form with.
+        form: The (async) generator function, or its import path as `"module:attribute"`. A form registered by
+            import path is only imported when it is first started.
+        registry: The registry to add the form to, `default_registry` if not given.
+
+    """
+    (registry or default_registry).register(key, form)
+
+
+def register_forms(forms: Mapping[str, Union[Callable, str]], *, registry: Union[FormRegistry, None] = None) -> None:
+    """Register several forms at once, like `register_form`, logging a single line for all of them."""
+    (registry or default_registry).register_many(forms)
+
+
+def get_form(key: str, *, registry: Union[FormRegistry, None] = None) -> Union[Callable, None]:
+    """Return the form registered under `key`, importing it first if it was registered by import path."""
+    return (registry or default_registry).get(key)
+
+
+def list_forms(*, registry: Union[FormRegistry, None] = None) -> list[str]:
+    return (registry or default_registry).keys()
+
+
+def parse_user_inputs(user_inputs: Union[list[State], RawJSON, None]) -> list[State]:
+    """Return the user inputs as a list, decoding them first if they are still the raw JSON request body.
+
+    Raises a `ValueError` when the raw body is not a JSON array of objects.
+    """
+    if isinstance(user_inputs, list):
+        return user_inputs
+    if not user_inputs:
+        # Ensure the first FormNotComplete is raised from Swagger when a POST is done without user_inputs:
+        return []
+
+    decoded = json_loads_as(user_inputs, JSON)
+    if not isinstance(decoded, list):
+        raise ValueError(f"user_inputs should be a JSON array, not {type(decoded).__name__}")
+    if not all(isinstance(user_input, dict) for user_input in decoded):
+        raise ValueError("user_inputs should be a JSON array of objects")
+    return decoded
+
+
+def form_schema(form: InputForm) -> JSON:
+    """Return the JSON schema that the frontend renders for a form page."""
+    return form.model_json_schema(schema_generator=GenerateFormJsonSchema)
+
+
+def schema_hash(schema: JSON, meta: JSON = None) -> str:
+    """Return a content hash of a page's JSON schema and `meta__`, identical for every render of the same page.
+
+    The hash is taken over the encoded JSON, which all JSON backends write identically, so it is stable across
+    processes.
+    """
+    digest = blake2b(json_dumps(schema).encode(), digest_size=16)
+    if meta is not None:
+        digest.update(json_dumps(meta).encode())
+    return digest.hexdigest()
 
 
-def register_form(key: str, form: Callable) -> None:
-    logger.info("Current Forms", forms=FORMS, new_key=key)
-    if key in FORMS and form is not FORMS[key]:
-        raise Exception(f"Trying to re-register form {key} with a different function")
+@dataclass(frozen=True)
+class Completed:
+    """Every page of the form has been filled in; `state` is what the form generator returned."""
 
-    if not isasyncgenfunction(form) and not isgeneratorfunction(form):
-        raise Exception(f"Trying to register form {key} function {form} which is not an (async) generator function")
+    state: State
 
-    FORMS[key] = form
 
+@dataclass(frozen=True)
+class NeedsInput:
+    """The user inputs ran out before the form did; `page` is the page to render next.
 
-def list_forms() -> list[str]:
-    return list(FORMS.keys())
+    The JSON schema of the page is only generated when `schema` is first accessed.
+    """
+
+    page: InputForm
+    meta: Optional[JSON] = None
+    registry: Optional[FormRegistry] = field(default=None, compare=False, repr=False)
+    """The registry whose schema cache and hooks to use, `default_registry` if not given."""
+
+    form_key: Optional[str] = field(default=None, compare=False, repr=False)
+    page_index: int = field(default=0, compare=False, repr=False)
+    """The index of the page in the form, 0 for the first one."""
+
+    @cached_property
+    def schema(self) -> JSON:
+        registry = self.registry or default_registry
+        clock = registry.phase_clock(self.form_key)
+        clock.start()
+        schema = registry.schema(self.page)
+        clock.lap(Phase.SCHEMA, self.page_index, self.page)
+        return schema
+
+    @cached_property
+    def schema_hash(self) -> str:
+        return schema_hash(self.schema, self.meta)
+
+
+@dataclass(frozen=True)
+class Invalid:
+    """The user input for page `validator_name` did not validate; `errors` are the translated errors."""
+
+    validator_name: str
+    errors: list[ErrorDetails]
+
+
+FormResult = Union[Completed, NeedsInput, Invalid]
+
+
+def unwrap_result(result: FormResult) -> State:
+    """Return the state of a completed form, or raise the exception that the other outcomes used to raise.
+
+    Raises:
+    ------
+        FormNotCompleteError: for `NeedsInput`
+        FormValidationError: for `Invalid`
+
+    """
+    match result:
+        case Completed(state=state):
+            return state
+        case NeedsInput(meta=meta):
+            raise FormNotCompleteError(result.schema, meta=meta)
+        case Invalid(validator_name=validator_name, errors=errors):
+            raise FormValidationError(validator_name, errors=errors)
+    raise TypeError(f"Not a form result: {result!r}")
@@ -0,0 +1,118 @@
+# Copyright 2019-2026 SURF.
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""The slow form log, which logs the runs of forms that take longer than a threshold.
+
+When `settings.slow_form_threshold_ms` is set, every registry adds `slow_form_log` to the hooks it reports to. The
+hook keeps the phase timings of the run in progress, and when `start_form` or the forms router takes longer than the
+threshold it logs a single `Slow form` warning. The warning has the timings per page, the size of each user input
+and the slowest phase. Runs that are fast enough are not logged, so only the tail of the requests pays for logging.
+"""
+
+from collections.abc import Sequence
+from contextvars import ContextVar
+from typing import Any, Union
+
+import structlog
+
+from pydantic_forms.core.hooks import FormRun, PhaseTiming
+from pydantic_forms.settings import settings
+from pydantic_forms.types import State
+from pydantic_forms.utils.json import json_dumps
+
+logger = structlog.get_logger(__name__)
+
+REDACTED = "<redacted>"
+"""What the values of the user inputs are replaced with, unless `settings.slow_form_log_inputs` is set."""
+
+
+def _ms(duration_ns: int) -> float:
+    return round(duration_ns / 1e6, 3)
+
+
+def _payload_bytes(user_input: State) -> Union[int, None]:
+    try:
+        return len(json_dumps(user_input))
+    except (TypeError, ValueError):
+        return None
+
+
+def _redact(user_input: State) -> State:
+    return dict.fromkeys(user_input, REDACTED)
+
+
+def _pages(timings: Sequence[PhaseTiming]) -> list[dict[str, Any]]:
+    pages: dict[int, dict[str, Any]] = {}
+    for timing in timings:
+        page = pages.setdefault(timing.page_index, {"page_index": timing.page_index, "page": timing.page})
+        # The step in which the generator returns has no page; the other phases of the index do
+        page["page"] = page["page"] or timing.page
+        key = f"{timing.phase}_ms"
+        page[key] = round(page.get(key, 0) + timing.duration_ns / 1e6, 3)
+    return [pages[index] for index in sorted(pages)]
+
+
+class SlowFormLog:
+    """Logs the runs of forms that take longer than `settings.slow_form_threshold_ms`.
+
+    A registry adds the hook itself while the threshold is set, so there is no need to add it with
+    `FormRegistry.add_hook`.
+    """
+
+    def __init__(self) -> None:
+        self._timings: ContextVar[Union[list[PhaseTiming], None]] = ContextVar("slow_form_timings", default=None)
+
+    def on_form_start(self, form_key: Union[str, None]) -> None:
+        self._timings.set([])
+
+    def on_phase(self, timing: PhaseTiming) -> None:
+        # Phases outside of a run, such as the schema of `generate_form`, are not collected
+        if (timings := self._timings.get()) is not None:
+            timings.append(timing)
+
+    def on_form_end(self, run: FormRun) -> None:
+        timings = self._timings.get() or []
+        self._timings.set(None)
+        threshold_ms = settings.slow_form_threshold_ms
+        if not threshold_ms or run.duration_ns < threshold_ms * 1e6:
+            return
+
+        payload_bytes = [_payload_bytes(user_input) for user_input in run.user_inputs]
+        slowest = max(timings, key=lambda timing: timing.duration_ns, default=None)
+        slowest_phase = slowest and {
+            "phase": slowest.phase.value,
+            "page_index": slowest.page_index,
+            "page": slowest.page,
+            "duration_ms": _ms(slowest.duration_ns),
+        }
+        logger.warning(
+            "Slow form",
+            form_key=run.form_key,
+            outcome=run.outcome,
+            duration_ms=_ms(run.duration_ns),
+            threshold_ms=threshold_ms,
+            pages_replayed=run.inputs,
+            pages=_pages(timings),
+            payload_bytes=payload_bytes,
+            payload_total_bytes=sum(size for size in payload_bytes if size is not None),
+            slowest_phase=slowest_phase,
+            user_inputs=(
+                list(run.user_inputs)
+                if settings.slow_form_log_inputs
+                else [_redact(user_input) for user_input in run.user_inputs]
+            ),
+        )
+
+
+slow_form_log = SlowFormLog()
+"""The hook that the registries add while `settings.slow_form_threshold_ms` is set."""
@@ -16,98 +16,138 @@ from typing import Any, Union
 
 import structlog
 from pydantic import ValidationError
-from pydantic_i18n import PydanticI18n
-
-from pydantic_forms.core.shared import FORMS, GenerateFormJsonSchema
-from pydantic_forms.core.translations import translations
-from pydantic_forms.exceptions import (
-    FormException,
-    FormNotCompleteError,
-    FormNotFoundError,
-    FormOverflowError,
-    FormValidationError,
+
+from pydantic_forms.core.hooks import Phase
+from pydantic_forms.core.shared import (
+    Completed,
+    FormRegistry,
+    FormResult,
+    Invalid,
+    NeedsInput,
+    default_registry,
+    get_form,
+    parse_user_inputs,
+    unwrap_result,
 )
-from pydantic_forms.types import InputForm, State, StateInputFormGenerator
+from pydantic_forms.exceptions import FormException, FormNotFoundError, FormOverflowError, convert_errors
+from pydantic_forms.settings import debug_enabled, debug_sampled
+from pydantic_forms.types import InputForm, RawJSON, State, StateInputFormGenerator
 
 logger = structlog.get_logger(__name__)
 
 
-def generate_form(
+def run_form(
     form_generator: Union[StateInputFormGenerator, None],
     state: State,
     user_inputs: list[State],
-    lang: str = "en_US",
+    locale: str = "en_US",
     extra_translations: Union[dict[str, str], None] = None,
-) -> Union[State, None]:
-    """Generate form using form generator as defined by a form definition."""
-    try:
-        # Generate form is basically post_form
-        post_form(form_generator, state, user_inputs, lang, extra_translations)
-    except FormNotCompleteError as e:
-        # Form is not finished and raises the next form, this is expected
-        return e.form
+    *,
+    registry: Union[FormRegistry, None] = None,
+) -> FormResult:
+    """Run a form generator on the user inputs and return the outcome instead of raising it.
 
-    # Form is finished and thus there is no new form
-    return None
+    The translator and the schema cache of `registry` are used, those of `default_registry` if it is not given.
 
+    Returns:
+    -------
+        `Completed` with the resulting state, `NeedsInput` with the next page to render, or `Invalid` with the
+        validation errors of the page whose input was rejected.
 
-def post_form(
-    form_generator: Union[StateInputFormGenerator, None],
-    state: State,
-    user_inputs: list[State],
-    locale: str = "en_US",
-    extra_translations: Union[dict[str, str], None] = None,
-) -> State:
-    """Post user_input based ond serve a new form if the form wizard logic dictates it."""
+    Raises:
+    ------
+        FormOverflowError: when there are more user inputs than pages
+
+    """
     # there is no form_generator so we return no validated data
     if not form_generator:
-        return {}
+        return Completed({})
 
     current_state = deepcopy(state)
 
-    logger.debug("Post form", state=state, user_inputs=user_inputs)
+    if debug_sampled(logger):
+        logger.debug("Post form", state=state, user_inputs=user_inputs)
+
+    registry = registry or default_registry
+    form_key = state.get("form_key")
+    clock = registry.phase_clock(form_key)
 
     # Generate generator
     generator = form_generator(current_state)
 
-    user_inputs = user_inputs.copy()
+    processed = 0
     try:
         # Generate first form (we need to send None here, since the arguments are already given
         # when we generated the generator)
+        clock.start()
         generated_form: InputForm = generator.send(None)
+        clock.lap(Phase.STEP, processed, generated_form)
 
         # Loop through user inputs and for each input validate and update current state and validation results
-        while user_inputs:
-            user_input = user_inputs.pop(0)
+        for user_input in user_inputs:
             # Validate
             try:
                 form_validated_data = generated_form(**user_input)
             except ValidationError as e:
+                clock.lap(Phase.VALIDATE, processed, generated_form)
                 # Todo: add extra_translation to tr
-                tr = PydanticI18n(translations)
-                raise FormValidationError(generated_form.__name__, e, tr, locale) from e
+                errors = list(convert_errors(e, registry.translator, locale))
+                clock.lap(Phase.TRANSLATE, processed, generated_form)
+                return Invalid(generated_form.__name__, errors)
+            clock.lap(Phase.VALIDATE, processed, generated_form)
 
             # Update state with validated_data
             current_state.update(form_validated_data.model_dump())
+            clock.lap(Phase.DUMP, processed, generated_form)
+            processed += 1
 
             # Make next form or trigger StopIteration
             generated_form = generator.send(form_validated_data)
-
-        # Form is not completely filled; raise next form
-        raise FormNotCompleteError(
-            generated_form.model_json_schema(schema_generator=GenerateFormJsonSchema),
-            meta=getattr(generated_form, "meta__", None),
-        )
+            clock.lap(Phase.STEP, processed, generated_form)
     except StopIteration as e:
-        if user_inputs:
-            raise FormOverflowError(f"Did not process all user_inputs ({len(user_inputs)} remaining)")
+        clock.lap(Phase.STEP, processed, None)
+        if remaining := len(user_inputs) - processed:
+            raise FormOverflowError(f"Did not process all user_inputs ({remaining} remaining)")
+
+        # Form is completely filled, so we can return the last of the data
+        return Completed(e.value)
 
-        # Form is completely filled, so we can return the last of the data and
-        return e.value
+    # Form is not completely filled; return the next form
+    meta = getattr(generated_form, "meta__", None)
+    return NeedsInput(generated_form, meta=meta, registry=registry, form_key=form_key, page_index=processed)
 
 
-def _get_form(key: str) -> StateInputFormGenerator:
-    if not (func := FORMS.get(key)):
+def generate_form(
+    form_generator: Union[StateInputFormGenerator, None],
+    state: State,
+    user_inputs: list[State],
+    lang: str = "en_US",
+    extra_translations: Union[dict[str, str], None] = None,
+) -> Union[State, None]:
+    """Generate form using form generator as defined by a form definition."""
+    result = run_form(form_generator, state, user_inputs, lang, extra_translations)
+    if isinstance(result, NeedsInput):
+        # Form is not finished and returns the next form, this is expected
+        return result.schema
+
+    # Raises for invalid input; otherwise the form is finished and thus there is no new form
+    unwrap_result(result)
+    return None
+
+
+def post_form(
+    form_generator: Union[StateInputFormGenerator, None],
+    state: State,
+    user_inputs: list[State],
+    locale: str = "en_US",
+    extra_translations: Union[dict[str, str], None] = None,
+) -> State:
+    """Post user_input based ond serve a new form if the form wizard logic dictates it."""
+    return unwrap_result(run_form(form_generator, state, user_inputs, locale, extra_translations))
+
+
+def _get_form(key: str, registry: Union[FormRegistry, None] = None) -> StateInputFormGenerator:
+    if not (func := get_form(key, registry=registry)):
         raise FormNotFoundError(f"Form {key} does not exist.")
 
     if not isgeneratorfunction(func):
@@ -118,10 +158,12 @@ def _get_form(key: str) -> StateInputFormGenerator:
 
 def start_form(
     form_key: str,
-    user_inputs: Union[list[State], None] = None,
+    user_inputs: Union[list[State], RawJSON, None] = None,
     user: str = "Just a user",  # Todo: check if we need users inside form logic?
     locale: str = "en_US",
     extra_translations: Union[dict[str, str], None] = None,
+    *,
+    registry: Union[FormRegistry, None] = None,
     **extra_state: dict[str, Any],
 ) -> State:
     """Handle the logic for the endpoint that the frontend uses to render a form with or without prefilled input.
@@ -129,10 +171,11 @@ def start_form(
     Args:
     ----
         form_key: name of form in the FORM dict
-        user_inputs: List of form inputs from frontend
+        user_inputs: List of form inputs from frontend, or the raw JSON request body that holds it
         user: User who starts this form
         locale: Language of the form
         extra_translations: Extra translations to apply to the form
+        registry: The registry to look the form up in, `default_registry` if not given
         extra_state: Optional initial state variables
 
     Returns:
@@ -140,19 +183,25 @@ def start_form(
         The data that the user entered into the form
 
     """
-    if user_inputs is None:
-        # Ensure the first FormNotComplete is raised from Swagger when a POST is done without user_inputs:
-        user_inputs = []
+    user_inputs = parse_user_inputs(user_inputs)
 
-    form: StateInputFormGenerator = _get_form(form_key)
+    form: StateInputFormGenerator = _get_form(form_key, registry)
 
     initial_state = dict(form_key=form_key, **extra_state)
 
+    clock = (registry or default_registry).phase_clock(form_key)
+    clock.begin()
     try:
-        state = post_form(form, initial_state, user_inputs, locale, extra_translations)
-    except FormValidationError as exc:
-        logger.debug("Validation errors", user_inputs=user_inputs, form=exc.validator_name, errors=exc.errors)
-        logger.debug(str(exc))
+        result = run_form(form, initial_state, user_inputs, locale, extra_translations, registry=registry)
+    except Exception as e:
+        clock.end(user_inputs, e, extra_state=extra_state, locale=locale)
         raise
 
-    return state
+    if isinstance(result, Invalid) and debug_enabled(logger):
+        logger.debug("Validation errors", user_inputs=user_inputs, form=result.validator_name, errors=result.errors)
+
+    try:
+        # Generates the schema of the next page, if there is one
+        return unwrap_result(result)
+    finally:
+        clock.end(user_inputs, result, extra_state=extra_state, locale=locale)
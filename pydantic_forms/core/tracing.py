@@ -0,0 +1,160 @@
+# Copyright 2019-2026 SURF.
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tracing spans for running forms.
+
+The tracers are hooks, see `pydantic_forms.core.hooks`: add one to a registry with `FormRegistry.add_hook`. Each
+`start_form` call becomes a `pydantic_forms.start_form` span, with a child span per phase of every page, such as
+`pydantic_forms.validate` and `pydantic_forms.schema`. A registry without tracer pays nothing for tracing.
+
+`OpenTelemetryTracer` needs the `opentelemetry-api` package, which the `opentelemetry` extra installs.
+`InMemoryTracer` keeps the spans in a list, for tests.
+"""
+
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from time import perf_counter_ns, time_ns
+from typing import Any, Union
+
+from pydantic_forms.core.hooks import FormRun, PhaseTiming
+
+try:
+    from opentelemetry import context, trace
+
+    IS_OPENTELEMETRY = True
+except ImportError:
+    IS_OPENTELEMETRY = False
+
+FORM_SPAN_NAME = "pydantic_forms.start_form"
+
+# Runs that end in one of these are the normal flow of a form, any other outcome is an exception
+FORM_RESULTS = frozenset({"Completed", "NeedsInput", "Invalid"})
+
+
+def _phase_attributes(timing: PhaseTiming) -> dict[str, Any]:
+    attributes: dict[str, Any] = {"pydantic_forms.page_index": timing.page_index}
+    if timing.form_key is not None:
+        attributes["pydantic_forms.form_key"] = timing.form_key
+    if timing.page is not None:
+        attributes["pydantic_forms.page"] = timing.page
+    return attributes
+
+
+def _run_attributes(run: FormRun) -> dict[str, Any]:
+    attributes: dict[str, Any] = {
+        "pydantic_forms.inputs": run.inputs,
+        "pydantic_forms.outcome": run.outcome,
+        "pydantic_forms.error_count": run.error_count,
+    }
+    if run.form_key is not None:
+        attributes["pydantic_forms.form_key"] = run.form_key
+    return attributes
+
+
+@dataclass
+class Span:
+    name: str
+    start_ns: int
+    """When the span started, on the `time.perf_counter_ns` clock."""
+
+    end_ns: int = 0
+    attributes: dict[str, Any] = field(default_factory=dict)
+    children: list["Span"] = field(default_factory=list)
+    parent: Union["Span", None] = field(default=None, repr=False, compare=False)
+
+
+class InMemoryTracer:
+    """A tracer that keeps the finished spans in `spans`, with the phase spans as `children` of their run."""
+
+    def __init__(self) -> None:
+        self.spans: list[Span] = []
+        self._current: ContextVar[Union[Span, None]] = ContextVar(f"in_memory_tracer_{id(self)}", default=None)
+
+    def on_form_start(self, form_key: Union[str, None]) -> None:
+        self._current.set(Span(FORM_SPAN_NAME, perf_counter_ns(), parent=self._current.get()))
+
+    def on_phase(self, timing: PhaseTiming) -> None:
+        span = Span(
+            f"pydantic_forms.{timing.phase}",
+            timing.start_ns,
+            timing.start_ns + timing.duration_ns,
+            _phase_attributes(timing),
+        )
+        if parent := self._current.get():
+            parent.children.append(span)
+        else:
+            # A phase outside of start_form, for example of a direct run_form call
+            self.spans.append(span)
+
+    def on_form_end(self, run: FormRun) -> None:
+        if not (span := self._current.get()):
+            return
+        span.start_ns, span.end_ns = run.start_ns, run.start_ns + run.duration_ns
+        span.attributes = _run_attributes(run)
+        self._current.set(span.parent)
+        (span.parent.children if span.parent else self.spans).append(span)
+
+    def clear(self) -> None:
+        self.spans.clear()
+
+
+def _epoch_ns(perf_ns: int) -> int:
+    """Convert a time on the `perf_counter_ns` clock to nanoseconds since the epoch, as OpenTelemetry expects."""
+    return time_ns() - (perf_counter_ns() - perf_ns)
+
+
+class OpenTelemetryTracer:
+    """A tracer that emits the spans through the OpenTelemetry API.
+
+    The span of a `start_form` call is the current span while the form runs, so it nests under the span of the
+    request that started it, and the spans of its phases nest under it.
+
+    Args:
+    ----
+        tracer: The OpenTelemetry tracer to create the spans with, one for `pydantic_forms` from the global tracer
+            provider if not given.
+
+    """
+
+    def __init__(self, tracer: Any = None) -> None:
+        if not IS_OPENTELEMETRY:
+            raise ImportError(
+                "OpenTelemetryTracer needs the opentelemetry-api package, install pydantic-forms[opentelemetry]"
+            )
+        self._tracer = tracer or trace.get_tracer("pydantic_forms")
+        self._current: ContextVar[tuple[tuple[Any, Any], ...]] = ContextVar(f"otel_tracer_{id(self)}", default=())
+
+    def on_form_start(self, form_key: Union[str, None]) -> None:
+        attributes = {} if form_key is None else {"pydantic_forms.form_key": form_key}
+        span = self._tracer.start_span(FORM_SPAN_NAME, attributes=attributes)
+        token = context.attach(trace.set_span_in_context(span))
+        self._current.set((*self._current.get(), (span, token)))
+
+    def on_phase(self, timing: PhaseTiming) -> None:
+        span = self._tracer.start_span(
+            f"pydantic_forms.{timing.phase}",
+            start_time=_epoch_ns(timing.start_ns),
+            attributes=_phase_attributes(timing),
+        )
+        span.end(end_time=_epoch_ns(timing.start_ns + timing.duration_ns))
+
+    def on_form_end(self, run: FormRun) -> None:
+        if not (stack := self._current.get()):
+            return
+        (span, token), rest = stack[-1], stack[:-1]
+        self._current.set(rest)
+        span.set_attributes(_run_attributes(run))
+        if run.outcome not in FORM_RESULTS:
+            span.set_status(trace.Status(trace.StatusCode.ERROR, run.outcome))
+        context.detach(token)
+        span.end()
@@ -10,7 +10,6 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-import os
 
 # TODO Decide how to expose this so pydantic-forms can be framework agnostic
 from http import HTTPStatus
@@ -20,6 +19,8 @@ import structlog
 from fastapi.requests import Request
 from fastapi.responses import JSONResponse
 
+from pydantic_forms.core.hooks import UNKNOWN_FORM_KEY, report_response
+from pydantic_forms.core.shared import FormRegistry, default_registry, schema_hash
 from pydantic_forms.exceptions import (
     FormException,
     FormNotCompleteError,
@@ -27,32 +28,49 @@ from pydantic_forms.exceptions import (
     FormValidationError,
     show_ex,
 )
-from pydantic_forms.utils.json import json_dumps, json_loads
+from pydantic_forms.settings import settings
+from pydantic_forms.types import JSON
+from pydantic_forms.utils.json import json_dumps, json_loads_as
 
 logger = structlog.get_logger(__name__)
 
 
 async def form_error_handler(request: Request, exc: FormException) -> JSONResponse:
-    """FastAPI exception handler that turns a FormException into a HTTP 4xx/5xx response with JSON body."""
+    """FastAPI exception handler that turns a FormException into a HTTP 4xx/5xx response with JSON body.
+
+    The status of the response is reported to the hooks of the registry, see `pydantic_forms.core.hooks`, with the
+    `form_key` path parameter of the request.
+    """
+    response = _error_response(request, exc)
+    _report_response(request, response.status_code)
+    return response
+
+
+def _error_response(request: Request, exc: FormException) -> JSONResponse:
     match exc:
         case FormValidationError():
             status = HTTPStatus.BAD_REQUEST
             base_content = _create_content(exc, status, "Form not valid")
             detail_content = base_content | {
-                "validation_errors": json_loads(json_dumps(exc.errors)),
+                "validation_errors": json_loads_as(json_dumps(exc.errors), JSON),
             }
             debug_content = _add_traceback(exc, detail_content)
             return JSONResponse(debug_content, status_code=status)
 
         case FormNotCompleteError():
             status = HTTPStatus.NOT_EXTENDED
+            meta = getattr(exc, "meta", None)
+            headers = {"ETag": f'"{schema_hash(exc.form, meta)}"'}
+            if _etag_matches(request, headers["ETag"]):
+                return JSONResponse(_not_modified_content(exc), status_code=status, headers=headers)
+
             base_content = _create_content(exc, status, "Form not complete")
             detail_content = base_content | {
-                "form": json_loads(json_dumps(exc.form)),
-                "meta": getattr(exc, "meta", None),
+                "form": json_loads_as(json_dumps(exc.form), JSON),
+                "meta": meta,
             }
             debug_content = _add_traceback(exc, detail_content)
-            return JSONResponse(debug_content, status_code=status)
+            return JSONResponse(debug_content, status_code=status, headers=headers)
 
         case FormNotFoundError():
             status = HTTPStatus.NOT_FOUND
@@ -65,6 +83,18 @@ async def form_error_handler(request: Request, exc: FormException) -> JSONRespon
             return JSONResponse(base_content, status_code=status)
 
 
+def _report_response(request: Request, status: int) -> None:
+    # The forms router puts the registry of its forms on the request
+    registry = getattr(request.state, "form_registry", None)
+    if not isinstance(registry, FormRegistry):
+        registry = default_registry
+    if hooks := registry.hooks:
+        # The key comes from the URL, so only a registered one is reported as is
+        if (form_key := request.path_params.get("form_key")) is not None and form_key not in registry:
+            form_key = UNKNOWN_FORM_KEY
+        report_response(hooks, form_key, status)
+
+
 def _create_content(exc: FormException, status: HTTPStatus, title: str) -> dict[str, str | HTTPStatus]:
     return {
         "type": type(exc).__name__,
@@ -74,9 +104,26 @@ def _create_content(exc: FormException, status: HTTPStatus, title: str) -> dict[
     }
 
 
+def _not_modified_content(exc: FormNotCompleteError) -> dict[str, Any]:
+    """Tell a client that sent the ETag of the pending page that it can keep rendering the schema it has."""
+    return {
+        "type": type(exc).__name__,
+        "detail": "Form not modified",
+        "title": "Form not complete",
+        "status": HTTPStatus.NOT_EXTENDED,
+        "not_modified": True,
+    }
+
+
+def _etag_matches(request: Request, etag: str) -> bool:
+    if not (if_none_match := request.headers.get("if-none-match")):
+        return False
+    # If-None-Match uses weak comparison, so a W/ prefix is ignored
+    return any(tag.strip().removeprefix("W/") in (etag, "*") for tag in if_none_match.split(","))
+
+
 def _add_traceback(exc: FormException, content: dict[str, Any]) -> dict[str, Any]:
-    LOG_LEVEL_PYDANTIC_FORMS = "DEBUG" if os.getenv("LOG_LEVEL_PYDANTIC_FORMS", "INFO").upper() == "DEBUG" else "INFO"
-    if LOG_LEVEL_PYDANTIC_FORMS == "DEBUG":
+    if settings.debug:
         content_with_traceback = content | {"traceback": show_ex(exc)}
         logger.debug("Form validation Response", result=content_with_traceback)
         return content_with_traceback
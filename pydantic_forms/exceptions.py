@@ -1,4 +1,3 @@
-import os
 import traceback
 from collections.abc import Mapping
 from typing import Any, Iterable, Optional, TypedDict, Union, cast
@@ -9,6 +8,7 @@ from pydantic import ValidationError
 from pydantic_core import ErrorDetails
 from pydantic_i18n import PydanticI18n
 
+from pydantic_forms.settings import debug_enabled, settings
 from pydantic_forms.types import JSON
 
 logger = structlog.get_logger(__name__)
@@ -62,7 +62,6 @@ def convert_errors(
 
     https://docs.pydantic.dev/2.4/errors/errors/#customize-error-messages
     """
-    LOG_LEVEL_PYDANTIC_FORMS = "DEBUG" if os.getenv("LOG_LEVEL_PYDANTIC_FORMS", "INFO").upper() == "DEBUG" else "INFO"
 
     def convert_error(error: ErrorDetails) -> None:
         exc = error.get("ctx", {}).get("error")
@@ -80,30 +79,47 @@ def convert_errors(
             error["loc"] = (*error["loc"], "__root__")
         return
 
-    if LOG_LEVEL_PYDANTIC_FORMS == "DEBUG":
-        logger.debug(
-            "Form translation info",
-            original=validation_error.errors(),
-            translated=tr.translate(validation_error.errors(), locale),
-        )
+    errors = validation_error.errors()
+    translated = tr.translate(errors, locale)
+    # The errors hold the values the user entered, so they are only logged when debugging is switched on
+    if settings.debug and debug_enabled(logger):
+        logger.debug("Form translation info", original=errors, translated=translated)
 
-    return side_effect(convert_error, tr.translate(validation_error.errors(), locale))
+    return side_effect(convert_error, translated)
 
 
 class FormValidationError(FormException):
+    """Raised when the user input for a page does not validate.
+
+    Args:
+    ----
+        validator_name: The name of the page.
+        error: The validation error of pydantic, to convert with `convert_errors`.
+        tr: The translator of the error messages.
+        locale: The locale to translate the error messages to.
+        errors: Errors that were already converted by `convert_errors`, instead of `error` and `tr`.
+
+    """
+
     validator_name: str
     errors: list[ErrorDetails]
 
     def __init__(
         self,
         validator_name: str,
-        error: ValidationError,
-        tr: PydanticI18n,
+        error: Optional[ValidationError] = None,
+        tr: Optional[PydanticI18n] = None,
         locale: str = "en_US",
+        *,
+        errors: Optional[list[ErrorDetails]] = None,
     ):
         super().__init__()
         self.validator_name = validator_name
-        self.errors = list(convert_errors(error, tr, locale))
+        if errors is None:
+            if error is None or tr is None:
+                raise TypeError("FormValidationError takes either a ValidationError and a translator, or errors")
+            errors = list(convert_errors(error, tr, locale))
+        self.errors = errors
 
     def __str__(self) -> str:
         no_errors = len(self.errors)
@@ -0,0 +1,241 @@
+# Copyright 2019-2026 SURF.
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""An in-process load test of registered wizards, to size workers and compare the sync and async engines.
+
+Concurrent simulated frontends walk the wizards page by page over HTTP, the way a real frontend does: post the inputs
+so far, get the next page as a 510, and post again with one more input. Some of them first post input that fails
+validation and retry after the 400. The requests go to an ASGI app in the same process, so there is no network and
+no server to start; the app runs the forms like a worker would.
+
+Needs the `loadtest` extra, which installs FastAPI and httpx.
+"""
+
+import asyncio
+import sys
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from http import HTTPStatus
+from inspect import isasyncgenfunction
+from random import Random
+from typing import Any, NamedTuple, Union
+
+from fastapi import FastAPI, Request
+from starlette.concurrency import run_in_threadpool
+
+from pydantic_forms.core import asynchronous, sync
+from pydantic_forms.core.shared import FormRegistry, get_form
+from pydantic_forms.exception_handlers.fastapi import form_error_handler
+from pydantic_forms.exceptions import FormException
+from pydantic_forms.types import State
+
+try:
+    import httpx
+
+    IS_HTTPX = True
+except ImportError:
+    IS_HTTPX = False
+
+
+class Wizard(NamedTuple):
+    """A wizard for the frontends to walk, with the input they enter on each page."""
+
+    form_key: str
+
+    user_inputs: list[State]
+    """The valid input for each page, in order."""
+
+    invalid_inputs: dict[int, State] = {}
+    """Input that fails validation, by page index, for the frontends to post before retrying with the valid input."""
+
+
+def create_app(registry: Union[FormRegistry, None] = None) -> FastAPI:
+    """Create an app that serves the forms of a registry at `POST /forms/{form_key}`.
+
+    The endpoint lets `start_form` raise and `form_error_handler` render the exceptions. Forms written as async
+    generators run on the event loop, sync ones in the threadpool.
+    """
+    app = FastAPI()
+    app.add_exception_handler(FormException, form_error_handler)  # type: ignore[arg-type]
+
+    @app.post("/forms/{form_key}")
+    async def submit_form(form_key: str, request: Request) -> Any:
+        request.state.form_registry = registry
+        body = await request.body()
+        if isasyncgenfunction(get_form(form_key, registry=registry)):
+            return await asynchronous.start_form(form_key, body, registry=registry)
+        return await run_in_threadpool(sync.start_form, form_key, body, registry=registry)
+
+    return app
+
+
+def _percentile(ordered: list[float], percent: float) -> float:
+    if not ordered:
+        return 0.0
+    return ordered[min(len(ordered) - 1, int(len(ordered) * percent / 100))]
+
+
+def _max_rss() -> Union[int, None]:
+    """Return the peak resident set size of the process in bytes, if the platform reports it."""
+    try:
+        import resource
+    except ImportError:  # Windows
+        return None
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    return max_rss if sys.platform == "darwin" else max_rss * 1024
+
+
+@dataclass
+class LoadTestReport:
+    frontends: int
+    wizards: int
+    """The number of times a frontend walked a wizard to its last request."""
+
+    duration_s: float
+    latencies_s: list[float] = field(default_factory=list, repr=False)
+    """The latency of every request, in the order they finished."""
+
+    statuses: Counter[int] = field(default_factory=Counter)
+    """The number of responses per HTTP status."""
+
+    unexpected: int = 0
+    """The number of responses with another status than a frontend expected, such as a 500 or a 400 for valid input."""
+
+    max_rss_before: Union[int, None] = None
+    max_rss_after: Union[int, None] = None
+    """The peak resident set size of the process in bytes before and after the run, where the platform reports it."""
+
+    @property
+    def requests(self) -> int:
+        return len(self.latencies_s)
+
+    @property
+    def requests_per_second(self) -> float:
+        return self.requests / self.duration_s if self.duration_s else 0.0
+
+    @property
+    def wizards_per_second(self) -> float:
+        return self.wizards / self.duration_s if self.duration_s else 0.0
+
+    def percentile(self, percent: float) -> float:
+        """Return a percentile of the request latencies in seconds, for example `percentile(99)`."""
+        return _percentile(sorted(self.latencies_s), percent)
+
+    def __str__(self) -> str:
+        ordered = sorted(self.latencies_s)
+        latencies = [f"p{percent} {_percentile(ordered, percent) * 1000:.1f}" for percent in (50, 90, 99)]
+        if ordered:
+            latencies.append(f"max {ordered[-1] * 1000:.1f}")
+        statuses = ", ".join(f"{status}: {count}" for status, count in sorted(self.statuses.items()))
+        lines = [
+            f"{self.frontends} frontends walked {self.wizards} wizards in {self.duration_s:.2f}s",
+            f"throughput: {self.requests_per_second:.1f} requests/s, {self.wizards_per_second:.1f} wizards/s",
+            f"latency (ms): {', '.join(latencies)}",
+            f"responses: {statuses}, unexpected: {self.unexpected}",
+        ]
+        if self.max_rss_before is not None and self.max_rss_after is not None:
+            lines.append(
+                f"peak memory: {self.max_rss_after / 2**20:.1f} MiB "
+                f"(+{(self.max_rss_after - self.max_rss_before) / 2**20:.1f} MiB)"
+            )
+        return "\n".join(lines)
+
+
+class _Frontend:
+    def __init__(
+        self, client: "httpx.AsyncClient", path: str, report: LoadTestReport, failure_rate: float, rng: Random
+    ) -> None:
+        self.client = client
+        self.path = path
+        self.report = report
+        self.failure_rate = failure_rate
+        self.rng = rng
+
+    async def post(self, wizard: Wizard, user_inputs: list[State], expected: int) -> None:
+        start = time.perf_counter()
+        response = await self.client.post(self.path.format(form_key=wizard.form_key), json=user_inputs)
+        self.report.latencies_s.append(time.perf_counter() - start)
+        self.report.statuses[response.status_code] += 1
+        if response.status_code != expected:
+            self.report.unexpected += 1
+
+    async def walk(self, wizard: Wizard) -> None:
+        user_inputs: list[State] = []
+        for page_index, page_input in enumerate(wizard.user_inputs):
+            await self.post(wizard, user_inputs, HTTPStatus.NOT_EXTENDED)
+            invalid = wizard.invalid_inputs.get(page_index)
+            if invalid is not None and self.rng.random() < self.failure_rate:
+                await self.post(wizard, [*user_inputs, invalid], HTTPStatus.BAD_REQUEST)
+            user_inputs.append(page_input)
+        await self.post(wizard, user_inputs, HTTPStatus.OK)
+        self.report.wizards += 1
+
+
+async def load_test(
+    wizards: list[Wizard],
+    *,
+    frontends: int = 10,
+    rounds: int = 10,
+    failure_rate: float = 0.1,
+    app: Any = None,
+    path: str = "/forms/{form_key}",
+    registry: Union[FormRegistry, None] = None,
+    seed: int = 0,
+) -> LoadTestReport:
+    """Let concurrent frontends walk the wizards and report the throughput, latencies and memory.
+
+    Every frontend walks each wizard `rounds` times, starting at a different wizard than the other frontends.
+
+    Args:
+    ----
+        wizards: The wizards to walk, which must be registered in the registry of the app.
+        frontends: The number of frontends that walk the wizards concurrently.
+        rounds: The number of times each frontend walks each wizard.
+        failure_rate: The chance that a frontend first posts the invalid input of a page that has one.
+        app: The ASGI app to send the requests to, `create_app(registry)` if not given.
+        path: The path of the endpoint that runs a form, with a `{form_key}` placeholder.
+        registry: The registry of the forms for the default app, `default_registry` if not given.
+        seed: Seed of the random choices of the frontends, so that runs can be compared.
+
+    Returns:
+    -------
+        The report, which prints as a summary.
+
+    """
+    if not IS_HTTPX:
+        raise ImportError("The load test needs httpx, install it with `pip install pydantic-forms[loadtest]`")
+
+    report = LoadTestReport(frontends, 0, 0.0, max_rss_before=_max_rss())
+    # Unhandled exceptions of the app become 500 responses, which count as unexpected, instead of ending the test
+    transport = httpx.ASGITransport(app=app or create_app(registry), raise_app_exceptions=False)
+    async with httpx.AsyncClient(transport=transport, base_url="http://loadtest") as client:
+
+        async def run_frontend(number: int) -> None:
+            frontend = _Frontend(client, path, report, failure_rate, Random(seed + number))  # noqa: S311
+            for _ in range(rounds):
+                for offset in range(len(wizards)):
+                    await frontend.walk(wizards[(number + offset) % len(wizards)])
+
+        start = time.perf_counter()
+        await asyncio.gather(*(run_frontend(number) for number in range(frontends)))
+        report.duration_s = time.perf_counter() - start
+
+    report.max_rss_after = _max_rss()
+    return report
+
+
+def run_load_test(wizards: list[Wizard], **kwargs: Any) -> LoadTestReport:
+    """Run `load_test` in a new event loop, for scripts. Takes the same arguments."""
+    return asyncio.run(load_test(wizards, **kwargs))
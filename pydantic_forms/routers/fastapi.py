@@ -0,0 +1,401 @@
+# Copyright 2019-2026 SURF.
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Ready-made FastAPI endpoints for listing, starting and submitting the registered forms.
+
+The endpoints answer with the same JSON bodies as `form_error_handler`, so a frontend cannot tell them apart from
+hand-written endpoints that let the handler render the exceptions. They are faster, though:
+
+- Request bodies are read as raw bytes and decoded in one pass, skipping FastAPI's body validation.
+- Forms run through `run_form`, so the common "form not complete" answer never builds an exception.
+- The 510 body of a page only depends on the page class, so it is encoded once and reused for as long as the class
+  exists. It carries the `ETag` of the page, like `form_error_handler` adds. Pages with a `default_factory`, whose
+  schema may differ on every render, are encoded anew each time.
+- The list of forms carries an `ETag`, and a matching `If-None-Match` is answered with an empty 304.
+- Optionally the 510 body only carries a `schema_id`, the content hash of the page's schema. The schema itself is
+  served by a separate endpoint with immutable cache headers, so browsers and CDNs only download each page once.
+- Optionally large bodies are compressed, and the compressed schemas are cached per content hash.
+"""
+
+from collections import OrderedDict
+from functools import lru_cache, partial
+from hashlib import blake2b
+from http import HTTPStatus
+from inspect import isasyncgenfunction, isawaitable
+from typing import Any, Awaitable, Callable, NamedTuple, Optional, Protocol, Union, cast
+from weakref import WeakKeyDictionary
+
+from fastapi import APIRouter, HTTPException
+from fastapi.requests import Request
+from fastapi.responses import Response
+from starlette.concurrency import run_in_threadpool
+
+from pydantic_forms.core import asynchronous, sync
+from pydantic_forms.core.shared import (
+    FormRegistry,
+    FormResult,
+    Invalid,
+    NeedsInput,
+    default_registry,
+    get_form,
+    has_stable_schema,
+    list_forms,
+    parse_user_inputs,
+    schema_hash,
+)
+from pydantic_forms.exception_handlers.fastapi import (
+    _create_content,
+    _etag_matches,
+    _not_modified_content,
+    _report_response,
+    form_error_handler,
+)
+from pydantic_forms.exceptions import FormException, FormNotCompleteError, FormValidationError
+from pydantic_forms.settings import settings
+from pydantic_forms.types import InputForm, State
+from pydantic_forms.utils.compression import compress, negotiate_encoding
+from pydantic_forms.utils.json import json_dumps
+
+JSON_MEDIA_TYPE = "application/json"
+
+OnComplete = Callable[[str, State], Any]
+
+
+class _PageBodies(NamedTuple):
+    """The encoded 510 bodies of a page, which only depend on the page class."""
+
+    full: bytes
+    by_schema_id: bytes
+    not_modified: bytes
+    etag: str
+    schema_id: str
+    schema: bytes
+
+
+class _BodyCache:
+    """The encoded bodies that a forms router reuses, counting its hits in the metrics of the registry.
+
+    Every router has its own, so that the bodies of one registry are never served by the router of another.
+    """
+
+    def __init__(self, registry: FormRegistry) -> None:
+        self.metrics = registry.metrics
+        self.pages: WeakKeyDictionary[InputForm, _PageBodies] = WeakKeyDictionary()
+        """The encoded 510 bodies per page class; entries disappear together with the class."""
+
+        self.compressed: OrderedDict[tuple[str, str], bytes] = OrderedDict()
+        """The compressed bodies per content key and encoding, least recently served first, at most
+        `settings.compressed_cache_size`."""
+
+
+class SchemaStore(Protocol):
+    """Where the forms router keeps the schemas it serves by id, with `schema_by_id`.
+
+    A schema is stored when a 510 response refers to it, and looked up when the frontend fetches it. With more than
+    one worker process, the fetch may reach a process other than the one that stored the schema; use a store that
+    the processes share, such as Redis, for them to find it.
+    """
+
+    async def get(self, schema_id: str) -> Optional[bytes]:
+        """Return the encoded schema with id `schema_id`, or `None` if the store doesn't have it (anymore)."""
+
+    async def set(self, schema_id: str, schema: bytes) -> None:
+        """Store the encoded schema with id `schema_id`. The same id always comes with the same schema."""
+
+
+class InMemorySchemaStore:
+    """Keeps the most recently served schemas in the memory of the process.
+
+    Args:
+    ----
+        size: The number of schemas to keep, `settings.schema_store_size` if not given.
+
+    """
+
+    def __init__(self, size: Optional[int] = None) -> None:
+        self.size = size
+        self._schemas: OrderedDict[str, bytes] = OrderedDict()
+
+    async def get(self, schema_id: str) -> Optional[bytes]:
+        if (schema := self._schemas.get(schema_id)) is not None:
+            self._schemas.move_to_end(schema_id)
+        return schema
+
+    async def set(self, schema_id: str, schema: bytes) -> None:
+        self._schemas[schema_id] = schema
+        self._schemas.move_to_end(schema_id)
+        if len(self._schemas) > (self.size if self.size is not None else settings.schema_store_size):
+            self._schemas.popitem(last=False)
+
+
+def create_forms_router(
+    on_complete: Union[OnComplete, None] = None,
+    *,
+    schema_by_id: bool = False,
+    compression_threshold: Union[int, None] = None,
+    registry: Union[FormRegistry, None] = None,
+    schema_store: Union[SchemaStore, None] = None,
+    **kwargs: Any,
+) -> APIRouter:
+    """Create a router with endpoints for the forms registered with `register_form`.
+
+    - `GET /` returns the keys of the registered forms.
+    - `POST /{form_key}` takes the user inputs as a JSON array and runs the form on them. Forms written as sync
+      generators run in the threadpool, async generators on the event loop.
+    - With `schema_by_id`, `GET /schemas/{schema_id}` returns the JSON schema of a page by its content hash, with
+      headers that let browsers and proxies cache it indefinitely.
+
+    Every run of a form and every response is reported to the hooks of the registry, see `pydantic_forms.core.hooks`.
+
+    Args:
+    ----
+        on_complete: Called with the form key and the resulting state once a form is completely filled in. Its
+            return value, awaited when needed, is sent as the JSON response instead of the state.
+        schema_by_id: Answer "form not complete" with the `schema_id` of the next page instead of its schema. Only
+            enable it for frontends that fetch the schema from `GET /schemas/{schema_id}`.
+        compression_threshold: Compress response bodies of at least this many bytes with brotli or gzip, when the
+            client accepts it. Schemas are compressed once per content hash. `None` disables compression.
+        registry: The registry of the forms to serve, `default_registry` if not given.
+        schema_store: Where to keep the schemas served by id, an `InMemorySchemaStore` of this router if not given.
+            Its schemas are only found by the process that stored them, so when the app runs in several worker
+            processes, pass a store that they share, or route the requests of a client to the same process.
+        kwargs: Passed on to `APIRouter`, for example `prefix` or `tags`.
+
+    Returns:
+    -------
+        The router, to include in an app with `app.include_router(...)`.
+
+    """
+    router = APIRouter(**kwargs)
+    schemas = schema_store or InMemorySchemaStore()
+    bodies = _BodyCache(registry or default_registry)
+
+    async def get_forms(request: Request) -> Response:
+        body, etag = _list_forms_body(tuple(list_forms(registry=registry)))
+        if _etag_matches(request, etag):
+            return Response(status_code=HTTPStatus.NOT_MODIFIED, headers={"ETag": etag})
+        response = Response(body, media_type=JSON_MEDIA_TYPE, headers={"ETag": etag})
+        return _compress_response(request, response, compression_threshold, bodies, f"forms:{etag}")
+
+    async def submit_form(form_key: str, request: Request) -> Response:
+        # Lets form_error_handler report to the hooks of this registry
+        request.state.form_registry = registry
+        try:
+            user_inputs = parse_user_inputs(await _read_body(request))
+        except ValueError as e:
+            raise HTTPException(HTTPStatus.UNPROCESSABLE_ENTITY, detail=str(e)) from e
+
+        try:
+            result, page_bodies = await _run_form(form_key, user_inputs, registry, bodies)
+        except FormException as exc:
+            return _compress_response(request, await form_error_handler(request, exc), compression_threshold)
+
+        return await _result_response(
+            request,
+            form_key,
+            result,
+            page_bodies,
+            on_complete,
+            schemas if schema_by_id else None,
+            compression_threshold,
+            bodies,
+        )
+
+    async def get_schema(schema_id: str, request: Request) -> Response:
+        if (schema := await schemas.get(schema_id)) is None:
+            raise HTTPException(HTTPStatus.NOT_FOUND, detail=f"Schema {schema_id} not found")
+
+        # The id is the hash of the schema, so whatever is cached under it never changes
+        headers = {"ETag": f'"{schema_id}"', "Cache-Control": "public, max-age=31536000, immutable"}
+        if _etag_matches(request, headers["ETag"]):
+            return Response(status_code=HTTPStatus.NOT_MODIFIED, headers=headers)
+        response = Response(schema, media_type=JSON_MEDIA_TYPE, headers=headers)
+        return _compress_response(request, response, compression_threshold, bodies, f"schema:{schema_id}")
+
+    router.add_api_route("/", get_forms, methods=["GET"], response_model=list[str])
+    if schema_by_id:
+        router.add_api_route("/schemas/{schema_id}", get_schema, methods=["GET"], response_model=dict[str, Any])
+    router.add_api_route(
+        "/{form_key}",
+        submit_form,
+        methods=["POST"],
+        openapi_extra={
+            "requestBody": {
+                "content": {JSON_MEDIA_TYPE: {"schema": {"type": "array", "items": {"type": "object"}}}},
+                "required": False,
+            }
+        },
+    )
+    return router
+
+
+async def _read_body(request: Request) -> bytes:
+    """Read the request body, refusing bodies larger than `settings.max_body_size` before reading them if possible."""
+    limit = settings.max_body_size
+    too_large = HTTPException(HTTPStatus.REQUEST_ENTITY_TOO_LARGE, detail=f"Request body is larger than {limit} bytes")
+    if limit and int(request.headers.get("content-length") or 0) > limit:
+        raise too_large
+
+    body = await request.body()
+    if limit and len(body) > limit:
+        raise too_large
+    return body
+
+
+async def _run_form(
+    form_key: str, user_inputs: list[State], registry: Union[FormRegistry, None], cache: _BodyCache
+) -> tuple[FormResult, Union[_PageBodies, None]]:
+    """Run a form, and for a page to render next the 510 bodies of that page.
+
+    The bodies, and so the schema of the page, are part of the run, like the schema is part of `start_form`.
+    """
+    # Look the form up first, so that the keys that are not registered are never reported to the hooks
+    initial_state = {"form_key": form_key}
+    run: Callable[[], Awaitable[FormResult]]
+    if isasyncgenfunction(get_form(form_key, registry=registry)):
+        async_form = asynchronous._get_form(form_key, registry)
+        run = partial(asynchronous.run_form, async_form, initial_state, user_inputs, registry=registry)
+    else:
+        sync_form = sync._get_form(form_key, registry)
+        run = partial(
+            run_in_threadpool, partial(sync.run_form, sync_form, initial_state, user_inputs, registry=registry)
+        )
+
+    clock = (registry or default_registry).phase_clock(form_key)
+    clock.begin()
+    try:
+        result = await run()
+        page_bodies = _page_bodies(result, cache) if isinstance(result, NeedsInput) else None
+    except Exception as e:
+        clock.end(user_inputs, e)
+        raise
+    clock.end(user_inputs, result)
+    return result, page_bodies
+
+
+async def _result_response(
+    request: Request,
+    form_key: str,
+    result: FormResult,
+    page_bodies: Union[_PageBodies, None],
+    on_complete: Union[OnComplete, None],
+    schema_store: Union[SchemaStore, None],
+    compression_threshold: Union[int, None],
+    bodies: _BodyCache,
+) -> Response:
+    match result:
+        case NeedsInput():
+            # `_run_form` renders the bodies of every page it returns
+            response, content_key = await _not_complete_response(request, cast(_PageBodies, page_bodies), schema_store)
+            _report_response(request, response.status_code)
+            return _compress_response(request, response, compression_threshold, bodies, content_key)
+        case Invalid(validator_name=validator_name, errors=errors):
+            response = await form_error_handler(request, FormValidationError(validator_name, errors=errors))
+            return _compress_response(request, response, compression_threshold)
+
+    content = result.state
+    if on_complete:
+        content = on_complete(form_key, result.state)
+        if isawaitable(content):
+            content = await content
+    response = Response(json_dumps(content), media_type=JSON_MEDIA_TYPE)
+    _report_response(request, response.status_code)
+    return _compress_response(request, response, compression_threshold)
+
+
+def _page_bodies(result: NeedsInput, cache: _BodyCache) -> _PageBodies:
+    if (bodies := cache.pages.get(result.page)) is not None:
+        # Serves the schema of the page without asking the registry for it
+        cache.metrics["schema_cache_hits"] += 1
+        return bodies
+
+    exc = FormNotCompleteError(result.schema, meta=result.meta)
+    schema_id = schema_hash(exc.form)
+    content = _create_content(exc, HTTPStatus.NOT_EXTENDED, "Form not complete")
+    by_schema_id_content = content | {"detail": f"Form {schema_id} not complete", "schema_id": schema_id}
+    bodies = _PageBodies(
+        full=json_dumps(content | {"form": exc.form, "meta": exc.meta}).encode(),
+        by_schema_id=json_dumps(by_schema_id_content | {"meta": exc.meta}).encode(),
+        not_modified=json_dumps(_not_modified_content(exc)).encode(),
+        etag=f'"{result.schema_hash}"',
+        schema_id=schema_id,
+        schema=json_dumps(exc.form).encode(),
+    )
+    # The schema of a page with a default_factory, and so its bodies and ETag, may differ on every render
+    if has_stable_schema(result.page):
+        cache.pages[result.page] = bodies
+    return bodies
+
+
+async def _not_complete_response(
+    request: Request, bodies: _PageBodies, schema_store: Union[SchemaStore, None]
+) -> tuple[Response, str]:
+    """Return the 510 response for a page from its `bodies`, and a key that identifies its body.
+
+    With a `schema_store` the body refers to the schema by its id, and the schema is put in the store.
+    """
+    if _etag_matches(request, bodies.etag):
+        body, variant = bodies.not_modified, "not_modified"
+    elif schema_store is not None:
+        await schema_store.set(bodies.schema_id, bodies.schema)
+        body, variant = bodies.by_schema_id, "by_schema_id"
+    else:
+        body, variant = bodies.full, "full"
+    response = Response(body, HTTPStatus.NOT_EXTENDED, headers={"ETag": bodies.etag}, media_type=JSON_MEDIA_TYPE)
+    return response, f"{variant}:{bodies.etag}"
+
+
+def _compress_response(
+    request: Request,
+    response: Response,
+    threshold: Union[int, None],
+    cache: Union[_BodyCache, None] = None,
+    content_key: Union[str, None] = None,
+) -> Response:
+    """Compress the body of `response` in place if it is large enough and the client accepts it.
+
+    Bodies with a `content_key`, which identifies their content, are compressed once and then served from `cache`.
+    """
+    if threshold is None or len(response.body) < threshold:
+        return response
+
+    response.headers["Vary"] = "Accept-Encoding"
+    if not (encoding := negotiate_encoding(request.headers.get("accept-encoding"))):
+        return response
+
+    if cache is None or content_key is None:
+        body = compress(bytes(response.body), encoding)
+    elif (key := (content_key, encoding)) in cache.compressed:
+        cache.metrics["compressed_cache_hits"] += 1
+        body = cache.compressed[key]
+        cache.compressed.move_to_end(key)
+    else:
+        cache.metrics["compressed_cache_misses"] += 1
+        body = cache.compressed[key] = compress(bytes(response.body), encoding)
+        if len(cache.compressed) > settings.compressed_cache_size:
+            cache.compressed.popitem(last=False)
+
+    response.body = body
+    response.headers["Content-Encoding"] = encoding
+    response.headers["Content-Length"] = str(len(body))
+    return response
+
+
+def _etag(body: bytes) -> str:
+    return f'"{blake2b(body, digest_size=16).hexdigest()}"'
+
+
+@lru_cache(maxsize=1)
+def _list_forms_body(keys: tuple[str, ...]) -> tuple[bytes, str]:
+    body = json_dumps(list(keys)).encode()
+    return body, _etag(body)
@@ -0,0 +1,132 @@
+# Copyright 2019-2026 SURF.
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Settings of pydantic-forms.
+
+The settings are read from the environment once, when this module is imported. Code on the request path reads the
+attributes of `settings` instead of the environment. After changing the environment call `reload_settings`; to
+change a setting temporarily, for example in a test, use `override_settings`.
+"""
+
+import logging
+import os
+from collections.abc import Iterator, Mapping
+from contextlib import contextmanager
+from dataclasses import dataclass, fields, replace
+from random import random
+from typing import Any
+
+
+@dataclass
+class Settings:
+    debug: bool = False
+    """Add tracebacks to error responses, and log the untranslated validation errors, which hold the values the user
+    entered. Set with `LOG_LEVEL_PYDANTIC_FORMS=DEBUG`."""
+
+    debug_sample_rate: float = 1.0
+    """The fraction of high-volume debug events, such as one per posted form, that is logged at the debug level.
+
+    Env: `PYDANTIC_FORMS_DEBUG_SAMPLE_RATE`.
+    """
+
+    schema_store_size: int = 1024
+    """The number of schemas an `InMemorySchemaStore` keeps to serve by id. Env: `PYDANTIC_FORMS_SCHEMA_STORE_SIZE`."""
+
+    compressed_cache_size: int = 256
+    """The number of compressed bodies the forms router keeps. Env: `PYDANTIC_FORMS_COMPRESSED_CACHE_SIZE`."""
+
+    max_body_size: int = 10 * 1024 * 1024
+    """The largest request body in bytes the forms router accepts, 0 for no limit.
+
+    Env: `PYDANTIC_FORMS_MAX_BODY_SIZE`.
+    """
+
+    slow_form_threshold_ms: float = 0
+    """Log the runs of `start_form` and the forms router that take longer than this, 0 to log none.
+
+    Env: `PYDANTIC_FORMS_SLOW_FORM_THRESHOLD_MS`.
+    """
+
+    slow_form_log_inputs: bool = False
+    """Log the values of the user inputs of slow runs, rather than just their field names.
+
+    Env: `PYDANTIC_FORMS_SLOW_FORM_LOG_INPUTS=true`.
+    """
+
+    @classmethod
+    def from_env(cls, environ: Mapping[str, str] = os.environ) -> "Settings":
+        """Read the settings from environment variables, using the defaults for the ones that are not set."""
+        default = cls()
+        return cls(
+            debug=environ.get("LOG_LEVEL_PYDANTIC_FORMS", "INFO").upper() == "DEBUG",
+            debug_sample_rate=float(environ.get("PYDANTIC_FORMS_DEBUG_SAMPLE_RATE", default.debug_sample_rate)),
+            schema_store_size=int(environ.get("PYDANTIC_FORMS_SCHEMA_STORE_SIZE", default.schema_store_size)),
+            compressed_cache_size=int(
+                environ.get("PYDANTIC_FORMS_COMPRESSED_CACHE_SIZE", default.compressed_cache_size)
+            ),
+            max_body_size=int(environ.get("PYDANTIC_FORMS_MAX_BODY_SIZE", default.max_body_size)),
+            slow_form_threshold_ms=float(
+                environ.get("PYDANTIC_FORMS_SLOW_FORM_THRESHOLD_MS", default.slow_form_threshold_ms)
+            ),
+            slow_form_log_inputs=environ.get("PYDANTIC_FORMS_SLOW_FORM_LOG_INPUTS", "").lower() in ("1", "true", "yes"),
+        )
+
+
+settings = Settings.from_env()
+
+
+def debug_enabled(logger: Any) -> bool:
+    """Return whether `logger`, a structlog or standard library logger, emits debug events at its configured level.
+
+    Check it before building a debug event, so that its arguments are not even collected when it is not logged.
+    """
+    is_enabled_for = getattr(logger, "is_enabled_for", None) or getattr(logger, "isEnabledFor", None)
+    return bool(is_enabled_for(logging.DEBUG)) if is_enabled_for is not None else True
+
+
+def debug_sampled(logger: Any) -> bool:
+    """Return whether `logger` should log a high-volume debug event, sampled at `settings.debug_sample_rate`."""
+    return debug_enabled(logger) and (
+        settings.debug_sample_rate >= 1 or random() < settings.debug_sample_rate  # noqa: S311
+    )
+
+
+def _update(values: Settings) -> None:
+    # Update in place, so that modules which imported `settings` see the new values
+    for field in fields(Settings):
+        setattr(settings, field.name, getattr(values, field.name))
+
+
+def reload_settings() -> Settings:
+    """Read the settings from the environment again."""
+    _update(Settings.from_env())
+    return settings
+
+
+@contextmanager
+def override_settings(**changes: Any) -> Iterator[Settings]:
+    """Change some settings until the end of the `with` block.
+
+    Examples:
+    --------
+        >>> with override_settings(debug=True):
+        ...     settings.debug
+        True
+
+    """
+    saved = replace(settings)
+    _update(replace(settings, **changes))
+    try:
+        yield settings
+    finally:
+        _update(saved)
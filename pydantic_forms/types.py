@@ -10,6 +10,7 @@ union_types = [Union, UnionType]
 UUIDstr = str
 State = dict[str, Any]
 JSON = Any
+RawJSON = Union[str, bytes, bytearray, memoryview]
 
 
 class strEnum(str, Enum):
@@ -0,0 +1,91 @@
+# Copyright 2019-2026 SURF.
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Content-Encoding negotiation and compression of response bodies.
+
+gzip is always available. Brotli is used when the `brotli` package is installed, and preferred over gzip when the
+client accepts both equally, as it makes JSON schemas noticeably smaller.
+"""
+
+import gzip
+from typing import Callable, Union
+
+try:
+    import brotli
+
+    IS_BROTLI = True
+except ImportError:
+    IS_BROTLI = False
+
+
+def _gzip(body: bytes) -> bytes:
+    return gzip.compress(body, compresslevel=6, mtime=0)
+
+
+ENCODINGS: dict[str, Callable[[bytes], bytes]] = {"gzip": _gzip}
+"""The supported content codings, most preferred first."""
+
+if IS_BROTLI:
+
+    def _brotli(body: bytes) -> bytes:
+        return brotli.compress(body, mode=brotli.MODE_TEXT, quality=5)
+
+    ENCODINGS = {"br": _brotli} | ENCODINGS
+
+
+def _quality(params: str) -> float:
+    for param in params.split(";"):
+        name, _, value = param.partition("=")
+        if name.strip() == "q":
+            try:
+                return float(value)
+            except ValueError:
+                return 0
+    return 1
+
+
+def negotiate_encoding(accept_encoding: Union[str, None]) -> Union[str, None]:
+    """Return the supported encoding that an `Accept-Encoding` header prefers, if it allows any.
+
+    The encoding with the highest q-value is chosen, and of those the one first in `ENCODINGS`. An encoding that is
+    not listed gets the q-value of `*`, if that is; one listed with `q=0` is refused, even when `*` is allowed.
+
+    Examples:
+    --------
+        >>> negotiate_encoding("gzip, deflate")
+        'gzip'
+        >>> negotiate_encoding("gzip;q=0, identity") is None
+        True
+        >>> negotiate_encoding("br;q=0.1, gzip")
+        'gzip'
+
+    """
+    if not accept_encoding:
+        return None
+
+    qualities = {}
+    for coding in accept_encoding.lower().split(","):
+        name, _, params = coding.partition(";")
+        qualities[name.strip()] = _quality(params)
+
+    default = qualities.get("*", 0)
+    best_encoding, best_quality = None, 0.0
+    for encoding in ENCODINGS:
+        if (quality := qualities.get(encoding, default)) > best_quality:
+            best_encoding, best_quality = encoding, quality
+    return best_encoding
+
+
+def compress(body: bytes, encoding: str) -> bytes:
+    """Compress `body` with one of the `ENCODINGS`."""
+    return ENCODINGS[encoding](body)
@@ -73,30 +73,45 @@ We have named the `object_hook` function :func:`from_serializable`. Reason for n
 decoding functions differently then `default` and `object_hook` is that they are also used outside of the context of
 :func:`json.dumps` and :func:`json.loads`.
 
+The rest of the library only uses :func:`json_dumps` and :func:`json_loads`. These pick the fastest backend in
+:data:`JSON_BACKENDS` that is installed: `orjson`, then `python-rapidjson`, then the standard library. The backends are
+interchangeable; they write the same compact JSON and decode it to the same Python objects. Note that in all of them
+:func:`from_serializable` is applied to the top level `dict` only, not as an `object_hook` to every nested `dict`.
+
 """
 
+import json
 import re
 from collections.abc import Callable
 from contextlib import suppress
 from dataclasses import asdict, is_dataclass
 from datetime import datetime
-from functools import partial
+from functools import lru_cache
 from ipaddress import IPv4Address, IPv4Network, IPv6Address, IPv6Network
 from typing import Any, Sequence, Union
 from uuid import UUID
+from weakref import WeakKeyDictionary
 
 import structlog
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter
+from pydantic_core import PydanticSerializationError
+
+from pydantic_forms.types import RawJSON
 
 try:
     import orjson
 
     IS_ORJSON = True
 except ImportError:
-    import json
-
     IS_ORJSON = False
 
+try:
+    import rapidjson
+
+    IS_RAPIDJSON = True
+except ImportError:
+    IS_RAPIDJSON = False
+
 
 PY_JSON_TYPES = Union[dict[str, Any], list, str, int, float, bool, None, object]  # pragma: no mutate
 
@@ -132,13 +147,14 @@ def to_serializable(o: Any) -> Any:
         return isoformat(o)
     if is_dataclass(o):
         return asdict(o)  # type: ignore[arg-type]
+    # Look these up on the class first: hasattr on a pydantic model instance goes through its slow __getattr__
+    if isinstance(o, BaseModel) and not hasattr(type(o), "__json__") and not hasattr(type(o), "to_dict"):
+        return model_to_serializable(o)
     if hasattr(o, "__json__"):
         return o.__json__()
     if hasattr(o, "to_dict"):
         # api_client models all have a to_dict function
         return o.to_dict()
-    if isinstance(o, BaseModel):
-        return o.model_dump()
     if isinstance(o, set):
         return list(o)
     if isinstance(o, (ValueError, AssertionError)):
@@ -146,6 +162,51 @@ def to_serializable(o: Any) -> Any:
     raise TypeError(f"Could not serialize object of type {o.__class__.__name__} to JSON")
 
 
+def _may_hold_datetime(schema: Any) -> bool:
+    if isinstance(schema, dict):
+        return schema.get("type") in ("datetime", "any") or any(_may_hold_datetime(value) for value in schema.values())
+    if isinstance(schema, list):
+        return any(_may_hold_datetime(value) for value in schema)
+    return False
+
+
+# Whether a model class may hold datetimes, per class; entries disappear together with the class
+_models_with_datetimes: WeakKeyDictionary[type[BaseModel], bool] = WeakKeyDictionary()
+
+
+def model_to_serializable(model: BaseModel) -> Any:
+    """Convert a pydantic model into JSON compatible Python objects with the model's own compiled serializer.
+
+    This does in one pass, at pydantic-core speed, what would otherwise take a :meth:`~pydantic.BaseModel.model_dump`
+    plus a call from the JSON encoder back into :func:`to_serializable` for every UUID, IP address and so on in it.
+
+    Pydantic formats datetimes differently from :func:`isoformat`: it keeps the microseconds and uses a `Z` suffix for
+    UTC. So that every datetime in a document has the same format, models that may hold a datetime, in a field of
+    their own, of a nested model or of type `Any`, are dumped in python mode and their datetimes left to
+    :func:`to_serializable`.
+
+    Args:
+    ----
+        model: Model to convert.
+
+    Returns:
+    -------
+        The model as a `dict` of JSON compatible values. If pydantic cannot serialize a field to JSON, as can happen
+        with arbitrary types, the result of a plain `model_dump()` is returned instead, which leaves such values to
+        :func:`to_serializable`.
+
+    """
+    model_class = type(model)
+    if (has_datetimes := _models_with_datetimes.get(model_class)) is None:
+        has_datetimes = _models_with_datetimes[model_class] = _may_hold_datetime(model_class.__pydantic_core_schema__)
+    if has_datetimes:
+        return model.model_dump()
+    try:
+        return model.model_dump(mode="json")
+    except PydanticSerializationError:
+        return model.model_dump()
+
+
 ISO_FORMAT_STR_LEN = len("2019-05-18T15:17:00+00:00")  # assume 'seconds' precision
 UUID_PATTERN = re.compile(r"^[\da-f]{8}-([\da-f]{4}-){3}[\da-f]{12}$", re.IGNORECASE)
 
@@ -173,29 +234,129 @@ def from_serializable(dct: dict[str, Any]) -> dict[str, Any]:
     return dct
 
 
-if IS_ORJSON:
-    logger.debug("Using orjson")
+JsonDumps = Callable[..., str]
+JsonLoads = Callable[[RawJSON], PY_JSON_TYPES]
+
+
+def _decode(o: Any) -> PY_JSON_TYPES:
+    """Apply :func:`from_serializable` to a decoded document, identically for every backend.
 
-    def json_loads(s: Union[str, bytes, bytearray]) -> PY_JSON_TYPES:
-        o = orjson.loads(s)
-        if isinstance(o, list):
-            return [from_serializable(dikt) for dikt in o]
+    Only the top level `dict`, or each `dict` in a top level `list`, is passed through it. Nested dicts are left alone,
+    so unlike `object_hook` a timestamp-like string deep inside a JSON schema or an error context is never turned into
+    a `datetime` that the next encoder then has to deal with.
+    """
+    if isinstance(o, dict):
         return from_serializable(o)
+    if isinstance(o, list):
+        return [from_serializable(item) if isinstance(item, dict) else item for item in o]
+    return o
+
+
+def _json_dumps(obj: PY_JSON_TYPES, default: Callable = to_serializable, **kwargs: Any) -> str:
+    # Compact and unescaped like orjson, unless the caller asks otherwise with the options of json.dumps
+    if kwargs.get("indent") is None:
+        kwargs.setdefault("separators", (",", ":"))
+    kwargs.setdefault("ensure_ascii", False)
+    return json.dumps(obj, default=default, **kwargs)
+
+
+def _json_parse(s: RawJSON) -> PY_JSON_TYPES:
+    # Unlike orjson, json.loads does not take a memoryview
+    return json.loads(s.tobytes() if isinstance(s, memoryview) else s)
+
+
+def _json_loads(s: RawJSON) -> PY_JSON_TYPES:
+    return _decode(_json_parse(s))
+
 
-    def json_dumps(obj: PY_JSON_TYPES, default: Callable = to_serializable) -> str:
-        try:
-            return orjson.dumps(
-                obj,
-                default=default,
-                option=orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_OMIT_MICROSECONDS | orjson.OPT_NON_STR_KEYS,
-            ).decode("utf8")
-        except TypeError as e:
-            raise e
-
-else:
-    logger.debug("Using stdlib json")
-    json_loads = json.loads
-    json_dumps = partial(json.dumps, default=to_serializable)
+JSON_BACKENDS: dict[str, tuple[JsonDumps, JsonLoads]] = {"json": (_json_dumps, _json_loads)}
+"""The available JSON backends by name, as a `(json_dumps, json_loads)` pair each.
+
+They all produce the same output: compact, UTF-8, with every type that the backend cannot encode natively passed to
+:func:`to_serializable`, and datetimes formatted by :func:`isoformat`.
+"""
+
+if IS_RAPIDJSON:
+
+    def _rapidjson_dumps(obj: PY_JSON_TYPES, default: Callable = to_serializable) -> str:
+        return rapidjson.dumps(
+            obj, default=default, ensure_ascii=False, mapping_mode=rapidjson.MM_COERCE_KEYS_TO_STRINGS
+        )
+
+    # Decoding with rapidjson is no faster than with the C scanner of the standard library, so only encode with it
+    JSON_BACKENDS["rapidjson"] = (_rapidjson_dumps, _json_loads)
+
+if IS_ORJSON:
+
+    def _orjson_dumps(obj: PY_JSON_TYPES, default: Callable = to_serializable) -> str:
+        return orjson.dumps(
+            obj,
+            default=default,
+            option=orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_OMIT_MICROSECONDS | orjson.OPT_NON_STR_KEYS,
+        ).decode("utf8")
+
+    def _orjson_loads(s: RawJSON) -> PY_JSON_TYPES:
+        return _decode(orjson.loads(s))
+
+    JSON_BACKENDS["orjson"] = (_orjson_dumps, _orjson_loads)
+
+# Plain decoding, without from_serializable. orjson reads a bytes-like object without copying it.
+_parse: Callable[[RawJSON], PY_JSON_TYPES] = orjson.loads if IS_ORJSON else _json_parse
+
+JSON_BACKEND = next(name for name in ("orjson", "rapidjson", "json") if name in JSON_BACKENDS)
+"""Name of the fastest available backend, which :func:`json_dumps` and :func:`json_loads` use."""
+
+logger.debug("Using JSON backend", backend=JSON_BACKEND)
+
+json_dumps, json_loads = JSON_BACKENDS[JSON_BACKEND]
+
+
+@lru_cache(maxsize=256)
+def _type_adapter(type_: Any) -> TypeAdapter:
+    return TypeAdapter(type_)
+
+
+def json_loads_as(s: RawJSON, type_: Any) -> Any:
+    """Decode JSON straight into the Python types that `type_` describes.
+
+    Where :func:`json_loads` guesses which strings are timestamps, this has pydantic decode the document against a
+    schema. Every value gets the type it is annotated with, including timestamps with microseconds or a `Z` suffix,
+    and no other string is inspected.
+
+    Args:
+    ----
+        s: JSON document.
+        type_: A pydantic model such as a `FormPage`, a :class:`pydantic.TypeAdapter`, or any other type that a
+            `TypeAdapter` accepts, like `dict[str, datetime]`. With `Any` the document is decoded as is, by the
+            fastest parser available.
+
+    Returns:
+    -------
+        The decoded and validated value.
+
+    Raises:
+    ------
+        pydantic.ValidationError: in case the document does not match the type.
+
+    Examples:
+    --------
+        >>> json_loads_as('{"count": "3"}', dict[str, int])
+        {'count': 3}
+
+    """
+    if type_ is Any:
+        return _parse(s)
+    if isinstance(s, memoryview):
+        s = s.tobytes()  # pydantic only reads str, bytes and bytearray
+    if isinstance(type_, TypeAdapter):
+        return type_.validate_json(s)
+    if isinstance(type_, type) and issubclass(type_, BaseModel):
+        return type_.model_validate_json(s)
+    try:
+        adapter = _type_adapter(type_)
+    except TypeError:  # Not hashable, so it cannot be cached
+        adapter = TypeAdapter(type_)
+    return adapter.validate_json(s)
 
 
 def non_none_dict(dikt: Sequence[tuple[str, Any]]) -> dict[Any, Any]:
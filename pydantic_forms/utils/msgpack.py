@@ -0,0 +1,99 @@
+# Copyright 2019-2026 SURF.
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Compact binary (de)serialization of form state with MessagePack.
+
+This is the binary counterpart of :mod:`pydantic_forms.utils.json`, meant for persisting `post_form` results and
+intermediate state rather than for sending them to a frontend. It follows the same rules for custom data types: every
+object MessagePack cannot encode natively is handed to :func:`~pydantic_forms.utils.json.to_serializable`, so
+dataclasses, pydantic models, IP addresses and networks, sets and so on end up exactly as they would in JSON.
+
+Two types are encoded more compactly than their JSON string form, using MessagePack extension types:
+
+- :obj:`uuid.UUID` is stored as its 16 raw bytes instead of a 36 character string. Like the JSON codec, decoding
+  returns the UUID as a `str`; see the warning in :mod:`pydantic_forms.utils.json` for why.
+- Timezone aware :obj:`datetime.datetime` objects are stored as seconds since the epoch plus their UTC offset. Like the
+  JSON codec the precision is limited to seconds, and decoding returns an aware `datetime` with the same offset. Unlike
+  the JSON codec no heuristic is involved: every aware datetime is decoded, wherever it is nested.
+
+Naive datetimes are not decoded by the JSON codec either, so they are stored as ISO formatted strings.
+"""
+
+import struct
+from datetime import datetime, timedelta, timezone
+from functools import cache
+from math import floor
+from typing import Any, Callable, Union
+from uuid import UUID
+
+import msgpack
+
+from pydantic_forms.utils.json import PY_JSON_TYPES, isoformat, to_serializable
+
+EXT_UUID = 1
+EXT_DATETIME = 2
+
+# Seconds since the epoch and the UTC offset in seconds
+_DATETIME = struct.Struct(">qi")
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+def to_msgpack_serializable(o: Any) -> Any:
+    """Convert an object into an object that the MessagePack encoder can serialize.
+
+    Args:
+    ----
+        o: Object to convert.
+
+    Returns:
+    -------
+        A MessagePack extension type for UUIDs and timezone aware datetimes, otherwise the result of
+        :func:`~pydantic_forms.utils.json.to_serializable`.
+
+    Raises:
+    ------
+        TypeError: in case no conversion was possible.
+
+    """
+    if isinstance(o, UUID):
+        return msgpack.ExtType(EXT_UUID, o.bytes)
+    if isinstance(o, datetime):
+        if (offset := o.utcoffset()) is None:
+            return isoformat(o)
+        return msgpack.ExtType(EXT_DATETIME, _DATETIME.pack(floor(o.timestamp()), int(offset.total_seconds())))
+    return to_serializable(o)
+
+
+@cache
+def _timezone(offset: int) -> timezone:
+    return timezone(timedelta(seconds=offset))
+
+
+def from_msgpack_ext(code: int, data: bytes) -> Any:
+    """Decode the MessagePack extension types written by :func:`to_msgpack_serializable`."""
+    if code == EXT_UUID:
+        # Same result as str(UUID(bytes=data)), without constructing the UUID
+        h = data.hex()
+        return f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
+    if code == EXT_DATETIME:
+        seconds, offset = _DATETIME.unpack(data)
+        return (_EPOCH + timedelta(seconds=seconds)).astimezone(_timezone(offset))
+    return msgpack.ExtType(code, data)
+
+
+def msgpack_dumps(obj: PY_JSON_TYPES, default: Callable = to_msgpack_serializable) -> bytes:
+    return msgpack.packb(obj, default=default)
+
+
+def msgpack_loads(b: Union[bytes, bytearray, memoryview]) -> PY_JSON_TYPES:
+    return msgpack.unpackb(b, ext_hook=from_msgpack_ext, strict_map_key=False)
@@ -1,22 +1,63 @@
-from pydantic_forms.validators.components.accept import Accept, AcceptValues
-from pydantic_forms.validators.components.callout import Callout, callout
-from pydantic_forms.validators.components.choice import Choice
-from pydantic_forms.validators.components.choice_list import choice_list
-from pydantic_forms.validators.components.contact_person import ContactPerson, ContactPersonName
-from pydantic_forms.validators.components.contact_person_list import contact_person_list
-from pydantic_forms.validators.components.display_subscription import DisplaySubscription
-from pydantic_forms.validators.components.divider import Divider
-from pydantic_forms.validators.components.hidden import Hidden
-from pydantic_forms.validators.components.label import Label
-from pydantic_forms.validators.components.list_of_one import ListOfOne
-from pydantic_forms.validators.components.list_of_two import ListOfTwo
-from pydantic_forms.validators.components.long_text import LongText
-from pydantic_forms.validators.components.markdown import Markdown, markdown
-from pydantic_forms.validators.components.migration_summary import MigrationSummary, migration_summary
-from pydantic_forms.validators.components.organisation_id import OrganisationId
-from pydantic_forms.validators.components.read_only import read_only_field, read_only_list
-from pydantic_forms.validators.components.timestamp import Timestamp, timestamp
-from pydantic_forms.validators.components.unique_constrained_list import unique_conlist, validate_unique_list
+"""The field types of forms.
+
+The components are imported on first access, so that importing this package doesn't import all of them, and with
+them email-validator and the type adapters and defaults that some of them build at import time.
+"""
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from pydantic_forms.validators.components.accept import Accept, AcceptValues
+    from pydantic_forms.validators.components.callout import Callout, callout
+    from pydantic_forms.validators.components.choice import Choice
+    from pydantic_forms.validators.components.choice_list import choice_list
+    from pydantic_forms.validators.components.contact_person import ContactPerson, ContactPersonName
+    from pydantic_forms.validators.components.contact_person_list import contact_person_list
+    from pydantic_forms.validators.components.display_subscription import DisplaySubscription
+    from pydantic_forms.validators.components.divider import Divider
+    from pydantic_forms.validators.components.hidden import Hidden
+    from pydantic_forms.validators.components.label import Label
+    from pydantic_forms.validators.components.list_of_one import ListOfOne
+    from pydantic_forms.validators.components.list_of_two import ListOfTwo
+    from pydantic_forms.validators.components.long_text import LongText
+    from pydantic_forms.validators.components.markdown import Markdown, markdown
+    from pydantic_forms.validators.components.migration_summary import MigrationSummary, migration_summary
+    from pydantic_forms.validators.components.organisation_id import OrganisationId
+    from pydantic_forms.validators.components.read_only import read_only_field, read_only_list
+    from pydantic_forms.validators.components.timestamp import Timestamp, timestamp
+    from pydantic_forms.validators.components.unique_constrained_list import unique_conlist, validate_unique_list
+
+_COMPONENTS = {
+    "Accept": "accept",
+    "AcceptValues": "accept",
+    "Callout": "callout",
+    "callout": "callout",
+    "Choice": "choice",
+    "choice_list": "choice_list",
+    "ContactPerson": "contact_person",
+    "ContactPersonName": "contact_person",
+    "contact_person_list": "contact_person_list",
+    "DisplaySubscription": "display_subscription",
+    "Divider": "divider",
+    "Hidden": "hidden",
+    "Label": "label",
+    "ListOfOne": "list_of_one",
+    "ListOfTwo": "list_of_two",
+    "LongText": "long_text",
+    "Markdown": "markdown",
+    "markdown": "markdown",
+    "MigrationSummary": "migration_summary",
+    "migration_summary": "migration_summary",
+    "OrganisationId": "organisation_id",
+    "read_only_field": "read_only",
+    "read_only_list": "read_only",
+    "Timestamp": "timestamp",
+    "timestamp": "timestamp",
+    "unique_conlist": "unique_constrained_list",
+    "validate_unique_list": "unique_constrained_list",
+}
+"""The component module that defines each name."""
 
 __all__ = (
     "Accept",
@@ -47,3 +88,16 @@ __all__ = (
     "markdown",
     "Markdown",
 )
+
+
+def __getattr__(name: str) -> Any:
+    if (module := _COMPONENTS.get(name)) is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f"pydantic_forms.validators.components.{module}"), name)
+    # Cache it, so that the next access doesn't call this function
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
@@ -15,11 +15,23 @@ from pydantic_forms.exceptions import (
     FormOverflowError,
     FormValidationError,
 )
+from pydantic_forms.settings import override_settings
+from pydantic_forms.utils.json import json_loads
+
+
+@pytest.fixture
+def debug_mode():
+    with override_settings(debug=True):
+        yield
+
+
+def make_request(headers=()):
+    return Request({"type": "http", "headers": [(k.lower().encode(), v.encode()) for k, v in headers]})
 
 
 async def test_form_not_complete():
     exception = FormNotCompleteError({"message": "foobar"})
-    response = await form_error_handler(mock.Mock(spec=Request), exception)
+    response = await form_error_handler(make_request(), exception)
     assert response.status_code == HTTPStatus.NOT_EXTENDED
     body = response.body.decode()
     assert "FormNotCompleteError" in body
@@ -27,10 +39,9 @@ async def test_form_not_complete():
     assert "traceback" not in body
 
 
-async def test_form_not_complete_with_stack_trace(monkeypatch):
-    monkeypatch.setenv("LOG_LEVEL_PYDANTIC_FORMS", "DEBUG")
+async def test_form_not_complete_with_stack_trace(debug_mode):
     exception = FormNotCompleteError({"message": "foobar"})
-    response = await form_error_handler(mock.Mock(spec=Request), exception)
+    response = await form_error_handler(make_request(), exception)
     assert response.status_code == HTTPStatus.NOT_EXTENDED
     body = response.body.decode()
     assert "FormNotCompleteError" in body
@@ -38,6 +49,40 @@ async def test_form_not_complete_with_stack_trace(monkeypatch):
     assert "traceback" in body
 
 
+async def test_form_not_complete_etag():
+    exception = FormNotCompleteError({"message": "foobar"}, meta={"hasNext": True})
+    response = await form_error_handler(make_request(), exception)
+    etag = response.headers["etag"]
+    assert etag.startswith('"') and etag.endswith('"')
+
+    same_page = FormNotCompleteError({"message": "foobar"}, meta={"hasNext": True})
+    response = await form_error_handler(make_request([("If-None-Match", etag)]), same_page)
+    assert response.status_code == HTTPStatus.NOT_EXTENDED
+    assert response.headers["etag"] == etag
+    body = json_loads(response.body)
+    assert body["not_modified"] is True
+    assert "form" not in body
+
+
+@pytest.mark.parametrize(
+    "exception",
+    [
+        FormNotCompleteError({"message": "other"}, meta={"hasNext": True}),
+        FormNotCompleteError({"message": "foobar"}, meta={"hasNext": False}),
+        FormNotCompleteError({"message": "foobar"}),
+    ],
+)
+async def test_form_not_complete_etag_changes(exception):
+    response = await form_error_handler(
+        make_request(), FormNotCompleteError({"message": "foobar"}, meta={"hasNext": True})
+    )
+    etag = response.headers["etag"]
+
+    response = await form_error_handler(make_request([("If-None-Match", etag)]), exception)
+    assert response.headers["etag"] != etag
+    assert "form" in json_loads(response.body)
+
+
 @pytest.fixture
 def example_form_error_invalid_int():
     class Form(FormPage):
@@ -71,8 +116,7 @@ async def test_form_validation_nl_NL(example_form_error_invalid_int):
     assert "traceback" not in body
 
 
-async def test_form_validation_with_stack_trace(example_form_error_invalid_int, monkeypatch):
-    monkeypatch.setenv("LOG_LEVEL_PYDANTIC_FORMS", "DEBUG")
+async def test_form_validation_with_stack_trace(example_form_error_invalid_int, debug_mode):
     tr = PydanticI18n(translations)
     exception = FormValidationError("myvalidator", example_form_error_invalid_int, tr)
     response = await form_error_handler(mock.Mock(spec=Request), exception)
@@ -99,3 +143,18 @@ async def test_overflow_error():
     body = response.body.decode()
     assert "FormOverflowError" in body
     assert "my error" in body
+
+
+async def test_form_validation_timestamp_input():
+    """A timestamp-like input value is passed on as the string it was, not turned into a datetime."""
+
+    class Form(FormPage):
+        number: int
+
+    with pytest.raises(ValidationError) as error_info:
+        Form(number="2024-01-01T12:00:00+00:00")
+
+    exception = FormValidationError("Form", error_info.value, PydanticI18n(translations))
+    response = await form_error_handler(mock.Mock(spec=Request), exception)
+    assert response.status_code == HTTPStatus.BAD_REQUEST
+    assert '"input":"2024-01-01T12:00:00+00:00"' in response.body.decode()
@@ -1,4 +1,7 @@
+from contextlib import contextmanager
+
 import pydantic.version
+import structlog
 
 PYDANTIC_VERSION = pydantic.version.version_short()
 
@@ -15,3 +18,14 @@ def assert_equal_ignore_key(expected, actual, ignore_keys):
     stripped_actual = deep_remove_keys(actual, ignore_keys)
 
     assert stripped_expected == stripped_actual, f"Expected {stripped_expected}, but got {stripped_actual}"
+
+
+@contextmanager
+def log_level(level):
+    """Configure structlog to drop the events below `level`, restoring its configuration afterwards."""
+    original = structlog.get_config()
+    structlog.configure(wrapper_class=structlog.make_filtering_bound_logger(level))
+    try:
+        yield
+    finally:
+        structlog.configure(**original)
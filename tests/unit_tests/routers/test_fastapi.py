@@ -0,0 +1,442 @@
+import gzip
+import time
+from http import HTTPStatus
+from itertools import count
+
+import pytest
+from fastapi import FastAPI
+from pydantic import ConfigDict, Field
+from structlog.testing import capture_logs
+
+from pydantic_forms.core import FormPage, FormRegistry, register_form
+from pydantic_forms.core.metrics import MetricsCollector
+from pydantic_forms.core.shared import FORMS
+from pydantic_forms.core.tracing import FORM_SPAN_NAME, InMemoryTracer
+from pydantic_forms.routers.fastapi import (
+    InMemorySchemaStore,
+    create_forms_router,
+)
+from pydantic_forms.settings import override_settings
+from pydantic_forms.types import strEnum
+from pydantic_forms.utils.json import json_loads
+
+
+class TestChoices(strEnum):
+    A = "a"
+    B = "b"
+
+
+class TestForm(FormPage):
+    meta__ = {"page": 1}
+    generic_select: TestChoices
+
+
+def sync_form(state):
+    user_input = yield TestForm
+    return user_input.model_dump()
+
+
+async def async_form(state):
+    user_input = yield TestForm
+    yield user_input.model_dump() | {"engine": "async"}
+
+
+@pytest.fixture
+def app():
+    saved = FORMS.copy()
+    FORMS.clear()
+    register_form("sync_form", sync_form)
+    register_form("async_form", async_form)
+
+    app = FastAPI()
+    app.include_router(create_forms_router(prefix="/forms"))
+    yield app
+
+    FORMS.clear()
+    FORMS.update(saved)
+
+
+async def request(app, method, path, body=b"", headers=()):
+    """Send a single request straight to the ASGI app and collect the response."""
+    messages = [{"type": "http.request", "body": body, "more_body": False}]
+    response = {"headers": {}, "body": b""}
+
+    async def receive():
+        return messages.pop(0) if messages else {"type": "http.disconnect"}
+
+    async def send(message):
+        if message["type"] == "http.response.start":
+            response["status"] = message["status"]
+            response["headers"] = {k.decode(): v.decode() for k, v in message["headers"]}
+        elif message["type"] == "http.response.body":
+            response["body"] += message.get("body", b"")
+
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": method,
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "query_string": b"",
+        "headers": [(k.lower().encode(), v.encode()) for k, v in headers],
+        "client": ("testclient", 123),
+        "server": ("testserver", 80),
+    }
+    await app(scope, receive, send)
+    return response["status"], response["headers"], response["body"]
+
+
+async def test_list_forms(app):
+    status, headers, body = await request(app, "GET", "/forms/")
+    assert status == HTTPStatus.OK
+    assert json_loads(body) == ["sync_form", "async_form"]
+    etag = headers["etag"]
+
+    status, headers, body = await request(app, "GET", "/forms/", headers=[("If-None-Match", etag)])
+    assert status == HTTPStatus.NOT_MODIFIED
+    assert headers["etag"] == etag
+    assert body == b""
+
+    status, _, _ = await request(app, "GET", "/forms/", headers=[("If-None-Match", f'"other", W/{etag}')])
+    assert status == HTTPStatus.NOT_MODIFIED
+
+
+async def test_list_forms_etag_changes_with_registry(app):
+    _, headers, _ = await request(app, "GET", "/forms/")
+
+    register_form("another_form", sync_form)
+    status, new_headers, body = await request(app, "GET", "/forms/", headers=[("If-None-Match", headers["etag"])])
+    assert status == HTTPStatus.OK
+    assert new_headers["etag"] != headers["etag"]
+    assert "another_form" in json_loads(body)
+
+
+@pytest.mark.parametrize(
+    "form_key, expected",
+    [
+        ("sync_form", {"generic_select": "a"}),
+        ("async_form", {"generic_select": "a", "engine": "async"}),
+    ],
+)
+async def test_submit_form(app, form_key, expected):
+    status, _, body = await request(app, "POST", f"/forms/{form_key}")
+    assert status == HTTPStatus.NOT_EXTENDED
+    content = json_loads(body)
+    assert content["type"] == "FormNotCompleteError"
+    assert content["form"]["required"] == ["generic_select"]
+    assert content["meta"] == {"page": 1}
+
+    status, _, body = await request(app, "POST", f"/forms/{form_key}", b'[{"generic_select": "a"}]')
+    assert status == HTTPStatus.OK
+    assert json_loads(body) == expected
+
+
+async def test_submit_form_reuses_not_complete_body(app):
+    registry = FormRegistry()
+    registry.register("registry_form", sync_form)
+    app.include_router(create_forms_router(registry=registry, prefix="/registry"))
+
+    responses = [await request(app, "POST", "/registry/registry_form", b"[]") for _ in range(3)]
+    assert len({(headers["etag"], body) for _, headers, body in responses}) == 1
+    # The first response generates the schema, the others reuse the body of the router
+    assert registry.metrics["schema_cache_misses"] == 1
+    assert registry.metrics["schema_cache_hits"] == 2
+
+
+async def test_submit_form_not_complete_bodies_per_router(app):
+    registry = FormRegistry()
+    registry.register("sync_form", sync_form)
+    app.include_router(create_forms_router(registry=registry, prefix="/registry"))
+    await request(app, "POST", "/forms/sync_form")
+
+    await request(app, "POST", "/registry/sync_form")
+    assert registry.metrics["schema_cache_misses"] == 1
+    assert registry.metrics["schema_cache_hits"] == 0
+
+
+async def test_submit_form_default_factory_is_not_cached(app):
+    counter = count()
+
+    class CounterForm(FormPage):
+        number: int = Field(default_factory=lambda: next(counter))
+
+    def counter_form(state):
+        user_input = yield CounterForm
+        return user_input.model_dump()
+
+    register_form("counter_form", counter_form)
+    defaults, etags = [], set()
+    for _ in range(2):
+        _, headers, body = await request(app, "POST", "/forms/counter_form")
+        defaults.append(json_loads(body)["form"]["properties"]["number"]["default"])
+        etags.add(headers["etag"])
+
+    assert defaults == [0, 1]
+    assert len(etags) == 2
+
+
+async def test_submit_form_etag(app):
+    _, headers, full_body = await request(app, "POST", "/forms/async_form")
+    etag = headers["etag"]
+
+    status, headers, body = await request(app, "POST", "/forms/async_form", headers=[("If-None-Match", etag)])
+    assert status == HTTPStatus.NOT_EXTENDED
+    assert headers["etag"] == etag
+    assert json_loads(body)["not_modified"] is True
+    assert len(body) < len(full_body)
+
+
+async def test_submit_form_invalid(app):
+    status, _, body = await request(app, "POST", "/forms/sync_form", b'[{"generic_select": "c"}]')
+    assert status == HTTPStatus.BAD_REQUEST
+    content = json_loads(body)
+    assert content["type"] == "FormValidationError"
+    assert content["validation_errors"][0]["loc"] == ["generic_select"]
+
+
+@pytest.mark.parametrize(
+    "path, body, expected_status",
+    [
+        ("/forms/nonexistent", b"", HTTPStatus.NOT_FOUND),
+        ("/forms/sync_form", b'[{"generic_select": "a"}, {}]', HTTPStatus.INTERNAL_SERVER_ERROR),
+        ("/forms/sync_form", b'{"generic_select": "a"}', HTTPStatus.UNPROCESSABLE_ENTITY),
+        ("/forms/sync_form", b"[", HTTPStatus.UNPROCESSABLE_ENTITY),
+        ("/forms/sync_form", b"[1]", HTTPStatus.UNPROCESSABLE_ENTITY),
+    ],
+)
+async def test_submit_form_errors(app, path, body, expected_status):
+    status, _, _ = await request(app, "POST", path, body)
+    assert status == expected_status
+
+
+@pytest.mark.parametrize("asynchronous", [False, True])
+async def test_on_complete(app, asynchronous):
+    def on_complete(form_key, state):
+        return {"form_key": form_key, "state": state}
+
+    async def on_complete_async(form_key, state):
+        return on_complete(form_key, state)
+
+    app.include_router(create_forms_router(on_complete_async if asynchronous else on_complete, prefix="/done"))
+
+    status, _, body = await request(app, "POST", "/done/sync_form", b'[{"generic_select": "b"}]')
+    assert status == HTTPStatus.OK
+    assert json_loads(body) == {"form_key": "sync_form", "state": {"generic_select": "b"}}
+
+
+async def test_schema_by_id(app):
+    app.include_router(create_forms_router(schema_by_id=True, prefix="/by-id"))
+    _, _, full_body = await request(app, "POST", "/forms/sync_form")
+    full_content = json_loads(full_body)
+
+    status, headers, body = await request(app, "POST", "/by-id/sync_form")
+    assert status == HTTPStatus.NOT_EXTENDED
+    content = json_loads(body)
+    assert "form" not in content
+    assert content["meta"] == {"page": 1}
+    assert len(body) < len(full_body)
+
+    status, headers, body = await request(app, "GET", f"/by-id/schemas/{content['schema_id']}")
+    assert status == HTTPStatus.OK
+    assert json_loads(body) == full_content["form"]
+    assert "immutable" in headers["cache-control"]
+
+    status, _, body = await request(
+        app, "GET", f"/by-id/schemas/{content['schema_id']}", headers=[("If-None-Match", headers["etag"])]
+    )
+    assert status == HTTPStatus.NOT_MODIFIED
+    assert body == b""
+
+
+async def test_schema_by_id_unknown(app):
+    app.include_router(create_forms_router(schema_by_id=True, prefix="/by-id"))
+    status, _, _ = await request(app, "GET", "/by-id/schemas/unknown")
+    assert status == HTTPStatus.NOT_FOUND
+
+
+async def test_schema_store_is_bounded():
+    store = InMemorySchemaStore(size=2)
+    for schema_id in ["a", "b", "c"]:
+        await store.set(schema_id, b"{}")
+    assert await store.get("a") is None
+
+    await store.get("b")
+    await store.set("d", b"{}")
+    assert [await store.get(schema_id) for schema_id in ["b", "c", "d"]] == [b"{}", None, b"{}"]
+
+
+async def test_schema_store_size_setting():
+    store = InMemorySchemaStore()
+    with override_settings(schema_store_size=1):
+        await store.set("a", b"{}")
+        await store.set("b", b"{}")
+    assert await store.get("a") is None
+
+
+async def test_schema_by_id_miss(app):
+    """A schema stored by another worker process, or evicted since, is not found in the store of this one."""
+    app.include_router(create_forms_router(schema_by_id=True, prefix="/worker-1"))
+    app.include_router(create_forms_router(schema_by_id=True, prefix="/worker-2"))
+
+    _, _, body = await request(app, "POST", "/worker-1/sync_form")
+    schema_id = json_loads(body)["schema_id"]
+
+    status, _, body = await request(app, "GET", f"/worker-2/schemas/{schema_id}")
+    assert status == HTTPStatus.NOT_FOUND
+    assert json_loads(body)["detail"] == f"Schema {schema_id} not found"
+
+
+async def test_shared_schema_store(app):
+    store = InMemorySchemaStore()
+    app.include_router(create_forms_router(schema_by_id=True, schema_store=store, prefix="/worker-1"))
+    app.include_router(create_forms_router(schema_by_id=True, schema_store=store, prefix="/worker-2"))
+
+    _, _, body = await request(app, "POST", "/worker-1/sync_form")
+    status, _, body = await request(app, "GET", f"/worker-2/schemas/{json_loads(body)['schema_id']}")
+    assert status == HTTPStatus.OK
+    assert json_loads(body)["required"] == ["generic_select"]
+
+
+async def test_max_body_size(app):
+    body = b'[{"generic_select": "a"}]'
+    with override_settings(max_body_size=len(body) - 1):
+        status, _, _ = await request(app, "POST", "/forms/sync_form", body)
+        assert status == HTTPStatus.REQUEST_ENTITY_TOO_LARGE
+
+        headers = [("Content-Length", str(len(body)))]
+        status, _, _ = await request(app, "POST", "/forms/sync_form", body, headers=headers)
+        assert status == HTTPStatus.REQUEST_ENTITY_TOO_LARGE
+
+    with override_settings(max_body_size=0):
+        status, _, _ = await request(app, "POST", "/forms/sync_form", body)
+        assert status == HTTPStatus.OK
+
+
+async def test_compression(app):
+    registry = FormRegistry()
+    registry.register("sync_form", sync_form)
+    app.include_router(create_forms_router(compression_threshold=100, registry=registry, prefix="/compressed"))
+    _, _, full_body = await request(app, "POST", "/forms/sync_form")
+
+    for _ in range(2):
+        status, headers, body = await request(
+            app, "POST", "/compressed/sync_form", headers=[("Accept-Encoding", "gzip")]
+        )
+        assert status == HTTPStatus.NOT_EXTENDED
+        assert headers["content-encoding"] == "gzip"
+        assert headers["vary"] == "Accept-Encoding"
+        assert int(headers["content-length"]) == len(body)
+        assert gzip.decompress(body) == full_body
+    assert registry.metrics["compressed_cache_misses"] == 1
+    assert registry.metrics["compressed_cache_hits"] == 1
+
+    status, headers, body = await request(app, "POST", "/compressed/sync_form")
+    assert "content-encoding" not in headers
+    assert headers["vary"] == "Accept-Encoding"
+    assert body == full_body
+
+
+async def test_compression_threshold(app):
+    app.include_router(create_forms_router(compression_threshold=100_000, prefix="/compressed"))
+    _, headers, _ = await request(app, "POST", "/compressed/sync_form", headers=[("Accept-Encoding", "gzip")])
+    assert "content-encoding" not in headers
+    assert "vary" not in headers
+
+
+async def test_compression_of_dynamic_bodies(app):
+    registry = FormRegistry()
+    registry.register("sync_form", sync_form)
+    app.include_router(create_forms_router(compression_threshold=10, registry=registry, prefix="/compressed"))
+    status, headers, body = await request(
+        app, "POST", "/compressed/sync_form", b'[{"generic_select": "a"}]', headers=[("Accept-Encoding", "gzip")]
+    )
+    assert status == HTTPStatus.OK
+    assert headers["content-encoding"] == "gzip"
+    assert json_loads(gzip.decompress(body)) == {"generic_select": "a"}
+    assert "compressed_cache_misses" not in registry.metrics
+
+
+async def test_registry(app):
+    registry = FormRegistry()
+    registry.register("registry_form", sync_form)
+    app.include_router(create_forms_router(registry=registry, prefix="/registry"))
+
+    status, _, body = await request(app, "GET", "/registry/")
+    assert json_loads(body) == ["registry_form"]
+
+    status, _, _ = await request(app, "POST", "/registry/sync_form")
+    assert status == HTTPStatus.NOT_FOUND
+
+    status, _, body = await request(app, "POST", "/registry/registry_form", b'[{"generic_select": "a"}]')
+    assert status == HTTPStatus.OK
+    assert json_loads(body) == {"generic_select": "a"}
+
+
+async def test_metrics(app):
+    registry = FormRegistry()
+    registry.register("registry_form", sync_form)
+    metrics = MetricsCollector(registry)
+    app.include_router(create_forms_router(registry=registry, prefix="/registry"))
+
+    await request(app, "POST", "/registry/registry_form")
+    await request(app, "POST", "/registry/registry_form", b'[{"generic_select": "c"}]')
+    await request(app, "POST", "/registry/registry_form", b'[{"generic_select": "a"}]')
+    await request(app, "POST", "/registry/unknown_form")
+    await request(app, "POST", "/registry/another_unknown_form")
+
+    exported = metrics.export()
+    for form_key, status, responses in [
+        ("registry_form", 200, 1),
+        ("registry_form", 400, 1),
+        ("registry_form", 510, 1),
+        ("unknown", 404, 2),
+    ]:
+        assert f'pydantic_forms_responses_total{{form_key="{form_key}",status="{status}"}} {responses}' in exported
+    assert 'pydantic_forms_runs_total{form_key="registry_form",outcome="Invalid"} 1' in exported
+    # Keys that are not registered are never run, and only reported as "unknown"
+    assert "unknown_form" not in exported
+
+
+@pytest.mark.parametrize("form_key", ["sync_form", "async_form"])
+async def test_schema_span_in_form_span(app, form_key):
+    registry = FormRegistry()
+    registry.register(form_key, sync_form if form_key == "sync_form" else async_form)
+    registry.add_hook(tracer := InMemoryTracer())
+    app.include_router(create_forms_router(registry=registry, prefix="/registry"))
+
+    status, _, _ = await request(app, "POST", f"/registry/{form_key}")
+    assert status == HTTPStatus.NOT_EXTENDED
+
+    [span] = tracer.spans
+    assert span.name == FORM_SPAN_NAME
+    assert [child.name for child in span.children] == ["pydantic_forms.step", "pydantic_forms.schema"]
+    assert all(span.start_ns <= child.start_ns <= child.end_ns <= span.end_ns for child in span.children)
+
+
+async def test_slow_schema_is_logged(app):
+    def slow_schema(schema):
+        time.sleep(0.02)
+
+    class SlowSchemaPage(FormPage):
+        model_config = ConfigDict(json_schema_extra=slow_schema)
+        name: str
+
+    def slow_schema_form(state):
+        user_input = yield SlowSchemaPage
+        return user_input.model_dump()
+
+    registry = FormRegistry()
+    registry.register("slow_schema_form", slow_schema_form)
+    app.include_router(create_forms_router(registry=registry, prefix="/registry"))
+
+    with override_settings(slow_form_threshold_ms=10), capture_logs() as logs:
+        status, _, _ = await request(app, "POST", "/registry/slow_schema_form")
+    assert status == HTTPStatus.NOT_EXTENDED
+
+    [log] = [log for log in logs if log["event"] == "Slow form"]
+    assert log["duration_ms"] >= 20
+    assert log["pages"][0]["schema_ms"] >= 20
+    assert log["slowest_phase"]["phase"] == "schema"
@@ -1,10 +1,25 @@
+import logging
+import sys
 from typing import Optional
 
 import pytest
 from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
-
-from pydantic_forms.core import FormPage, generate_form, post_form, register_form, start_form
-from pydantic_forms.core.shared import FORMS
+from structlog.testing import capture_logs
+
+from pydantic_forms.core import (
+    Completed,
+    FormPage,
+    Invalid,
+    NeedsInput,
+    generate_form,
+    list_forms,
+    post_form,
+    register_form,
+    register_forms,
+    run_form,
+    start_form,
+)
+from pydantic_forms.core.shared import FORMS, LAZY_FORMS
 from pydantic_forms.exceptions import (
     FormException,
     FormNotCompleteError,
@@ -12,10 +27,12 @@ from pydantic_forms.exceptions import (
     FormOverflowError,
     FormValidationError,
 )
+from pydantic_forms.settings import override_settings
 from pydantic_forms.types import strEnum
 
 # TODO: Remove when generic forms of pydantic_forms are ready
 from pydantic_forms.utils.json import json_dumps, json_loads
+from tests.unit_tests.helpers import log_level
 
 
 class TestChoices(strEnum):
@@ -356,3 +373,244 @@ def test_start_form_wrong_generator_type():
         assert not isinstance(e.value, FormNotFoundError)
     finally:
         FORMS.pop("async_only_form", None)
+
+
+class NoteForm(FormPage):
+    note: str
+
+
+def note_form(state):
+    user_input = yield NoteForm
+    return user_input.model_dump()
+
+
+@pytest.mark.parametrize(
+    "user_inputs",
+    [
+        '[{"note": "2024-01-01T12:00:00+00:00"}]',
+        b'[{"note": "2024-01-01T12:00:00+00:00"}]',
+        bytearray(b'[{"note": "2024-01-01T12:00:00+00:00"}]'),
+        memoryview(b'[{"note": "2024-01-01T12:00:00+00:00"}]'),
+    ],
+)
+def test_start_form_raw_user_inputs(user_inputs):
+    """The raw request body is accepted, and decoded without turning timestamp-like strings into datetimes."""
+    register_form("note_form", note_form)
+    try:
+        assert start_form("note_form", user_inputs=user_inputs) == {"note": "2024-01-01T12:00:00+00:00"}
+    finally:
+        FORMS.pop("note_form", None)
+
+
+def test_start_form_raw_user_inputs_not_an_array():
+    register_form("note_form", note_form)
+    try:
+        with pytest.raises(ValueError, match="user_inputs should be a JSON array, not dict"):
+            start_form("note_form", user_inputs=b'{"note": "a"}')
+    finally:
+        FORMS.pop("note_form", None)
+
+
+def test_start_form_raw_user_inputs_not_objects():
+    register_form("note_form", note_form)
+    try:
+        with pytest.raises(ValueError, match="user_inputs should be a JSON array of objects"):
+            start_form("note_form", user_inputs=b"[1]")
+    finally:
+        FORMS.pop("note_form", None)
+
+
+@pytest.mark.parametrize("user_inputs", [None, b"", "", []])
+def test_start_form_without_user_inputs(user_inputs):
+    register_form("note_form", note_form)
+    try:
+        with pytest.raises(FormNotCompleteError):
+            start_form("note_form", user_inputs=user_inputs)
+    finally:
+        FORMS.pop("note_form", None)
+
+
+def test_run_form():
+    class MetaForm(FormPage):
+        meta__ = {"last_page": True}
+        generic_select: TestChoices
+
+    def input_form(state):
+        user_input = yield TestForm
+        user_input_2 = yield MetaForm
+        return user_input.model_dump() | user_input_2.model_dump()
+
+    assert run_form(None, {}, []) == Completed({})
+
+    result = run_form(input_form, {}, [{"generic_select": "a"}])
+    assert isinstance(result, NeedsInput)
+    assert result.page is MetaForm
+    assert result.meta == {"last_page": True}
+    assert result.schema == generate_form(input_form, {}, [{"generic_select": "a"}])
+
+    result = run_form(input_form, {}, [{"generic_select": "a"}, {"generic_select": "c"}])
+    assert isinstance(result, Invalid)
+    assert result.validator_name == "MetaForm"
+    assert [error["loc"] for error in result.errors] == [("generic_select",)]
+
+    result = run_form(input_form, {}, [{"generic_select": "a"}, {"generic_select": "b"}])
+    assert result == Completed({"generic_select": "b"})
+
+    with pytest.raises(FormOverflowError, match=r"\(1 remaining\)"):
+        run_form(input_form, {}, [{"generic_select": "a"}, {"generic_select": "b"}, {}])
+
+
+def test_run_form_invalid_matches_post_form():
+    def input_form(state):
+        user_input = yield TestForm
+        return user_input.model_dump()
+
+    result = run_form(input_form, {}, [{"generic_select": 1, "extra_data": False}])
+    with pytest.raises(FormValidationError) as e:
+        post_form(input_form, {}, [{"generic_select": 1, "extra_data": False}])
+
+    assert (result.validator_name, result.errors) == (e.value.validator_name, e.value.errors)
+
+
+def test_form_validation_error_from_errors():
+    class CustomValidationError(FormValidationError):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            self.custom = True
+
+    errors = [{"type": "missing", "loc": ("name",), "msg": "Field required", "input": {}}]
+    exc = CustomValidationError("NamePage", errors=errors)
+
+    assert (exc.validator_name, exc.errors, exc.custom) == ("NamePage", errors, True)
+    with pytest.raises(TypeError):
+        FormValidationError("NamePage")
+
+
+@pytest.mark.parametrize(
+    "level, rate, logged", [(logging.INFO, 1.0, False), (logging.DEBUG, 1.0, True), (logging.DEBUG, 0.0, False)]
+)
+def test_post_form_debug_logging(level, rate, logged):
+    def input_form(state):
+        user_input = yield TestForm
+        return user_input.model_dump()
+
+    with log_level(level), override_settings(debug_sample_rate=rate), capture_logs() as logs:
+        post_form(input_form, {}, [{"generic_select": "a"}])
+
+    assert any(log["event"] == "Post form" for log in logs) is logged
+
+
+@pytest.mark.parametrize("level, logged", [(logging.INFO, False), (logging.DEBUG, True)])
+def test_start_form_validation_errors_logging(level, logged):
+    """The validation errors are logged at the level structlog is configured at, whatever `settings.debug` is."""
+    register_form("note_form", note_form)
+    try:
+        with log_level(level), override_settings(debug=not logged), capture_logs() as logs:
+            with pytest.raises(FormValidationError):
+                start_form("note_form", user_inputs=[{}])
+    finally:
+        FORMS.pop("note_form", None)
+
+    assert any(log["event"] == "Validation errors" for log in logs) is logged
+
+
+@pytest.mark.parametrize("debug", [False, True])
+def test_translation_info_logging(debug):
+    """The untranslated errors hold the user input, so they are only logged when debugging is switched on."""
+    register_form("note_form", note_form)
+    try:
+        with log_level(logging.DEBUG), override_settings(debug=debug), capture_logs() as logs:
+            with pytest.raises(FormValidationError):
+                start_form("note_form", user_inputs=[{}])
+    finally:
+        FORMS.pop("note_form", None)
+
+    assert any(log["event"] == "Form translation info" for log in logs) is debug
+
+
+def test_register_form_logging():
+    def input_form(state):
+        yield TestForm
+        return {}
+
+    try:
+        with capture_logs() as logs:
+            register_form("logged_form", input_form)
+    finally:
+        FORMS.pop("logged_form", None)
+
+    assert logs == [
+        {
+            "event": "Register form",
+            "log_level": "info",
+            "key": "logged_form",
+            "form": input_form.__qualname__,
+            "registered": len(FORMS),
+        }
+    ]
+
+
+@pytest.fixture
+def lazy_module(tmp_path, monkeypatch):
+    """A module with a form that has not been imported yet."""
+    (tmp_path / "lazy_forms_module.py").write_text(
+        "from pydantic_forms.core import FormPage\n"
+        "class LazyForm(FormPage):\n"
+        "    note: str\n"
+        "def lazy_form(state):\n"
+        "    user_input = yield LazyForm\n"
+        "    return user_input.model_dump()\n"
+    )
+    monkeypatch.syspath_prepend(str(tmp_path))
+    saved_forms, saved_lazy_forms = FORMS.copy(), LAZY_FORMS.copy()
+    yield "lazy_forms_module"
+
+    sys.modules.pop("lazy_forms_module", None)
+    FORMS.clear()
+    FORMS.update(saved_forms)
+    LAZY_FORMS.clear()
+    LAZY_FORMS.update(saved_lazy_forms)
+
+
+def test_register_form_lazy(lazy_module):
+    register_form("lazy_form", f"{lazy_module}:lazy_form")
+    assert "lazy_form" in list_forms()
+    assert lazy_module not in sys.modules
+
+    assert start_form("lazy_form", user_inputs=[{"note": "a"}]) == {"note": "a"}
+    assert lazy_module in sys.modules
+
+    # Registering the same function again, eagerly or by path, is allowed; another one is not
+    register_form("lazy_form", sys.modules[lazy_module].lazy_form)
+    register_form("lazy_form", f"{lazy_module}:lazy_form")
+    with pytest.raises(Exception, match="re-register form lazy_form"):
+        register_form("lazy_form", f"{lazy_module}:other_form")
+
+
+@pytest.mark.parametrize(
+    "path, match",
+    [
+        ("lazy_forms_module:missing_form", "could not be imported"),
+        ("missing_module:lazy_form", "could not be imported"),
+        ("lazy_forms_module:LazyForm", "is not a generator function"),
+    ],
+)
+def test_register_form_lazy_errors(lazy_module, path, match):
+    register_form("lazy_form", path)
+    with pytest.raises(FormException, match=match):
+        start_form("lazy_form")
+
+
+def test_register_form_lazy_invalid_path():
+    with pytest.raises(Exception, match="not 'module:attribute'"):
+        register_form("lazy_form", "lazy_forms_module.lazy_form")
+
+
+def test_register_forms(lazy_module):
+    with capture_logs() as logs:
+        register_forms({"note_form": note_form, "lazy_form": f"{lazy_module}:lazy_form"})
+
+    assert [log["event"] for log in logs] == ["Register forms"]
+    assert logs[0]["count"] == 2
+    assert FORMS["note_form"] is note_form
+    assert LAZY_FORMS["lazy_form"] == f"{lazy_module}:lazy_form"
@@ -1,8 +1,9 @@
 from pydantic import ConfigDict
 from pytest import raises
 
-from pydantic_forms.core import FormPage
-from pydantic_forms.core.asynchronous import generate_form, post_form, start_form
+from pydantic_forms.core import Completed, FormPage, Invalid, NeedsInput, register_form
+from pydantic_forms.core.asynchronous import generate_form, post_form, run_form, start_form
+from pydantic_forms.core.shared import FORMS
 from pydantic_forms.exceptions import (
     FormNotCompleteError,
     FormNotFoundError,
@@ -212,3 +213,40 @@ async def test_generate_form():
 async def test_start_form_unknown_key():
     with raises(FormNotFoundError, match="Form nonexistent does not exist."):
         await start_form("nonexistent")
+
+
+async def test_start_form_raw_user_inputs():
+    async def input_form(state):
+        user_input = yield TestForm
+        yield user_input.model_dump()
+
+    register_form("async_raw_form", input_form)
+    try:
+        assert await start_form("async_raw_form", user_inputs=b'[{"generic_select": "a"}]') == {"generic_select": "a"}
+
+        with raises(FormNotCompleteError):
+            await start_form("async_raw_form", user_inputs=memoryview(b"[]"))
+    finally:
+        FORMS.pop("async_raw_form", None)
+
+
+async def test_run_form():
+    async def input_form(state):
+        user_input = yield TestForm
+        yield user_input.model_dump()
+
+    assert await run_form(None, {}, []) == Completed({})
+
+    result = await run_form(input_form, {}, [])
+    assert isinstance(result, NeedsInput)
+    assert result.page is TestForm
+    assert result.schema == await generate_form(input_form, {}, [])
+
+    result = await run_form(input_form, {}, [{"generic_select": "c"}])
+    assert isinstance(result, Invalid)
+    assert result.validator_name == "TestForm"
+
+    assert await run_form(input_form, {}, [{"generic_select": "a"}]) == Completed({"generic_select": "a"})
+
+    with raises(FormOverflowError):
+        await run_form(input_form, {}, [{"generic_select": "a"}, {}])
@@ -0,0 +1,83 @@
+from importlib.metadata import EntryPoint
+
+import pytest
+from structlog.testing import capture_logs
+
+from pydantic_forms.core import discover_forms
+from pydantic_forms.core.discovery import ENTRY_POINT_GROUP
+from pydantic_forms.core.shared import FORMS, LAZY_FORMS
+from pydantic_forms.utils.json import json_loads
+
+FORM_ENTRY_POINTS = [
+    EntryPoint("create_port", "app.forms.create_port:create_port_form", ENTRY_POINT_GROUP),
+    EntryPoint("modify_port", "app.forms.modify_port:modify_port_form", ENTRY_POINT_GROUP),
+]
+
+
+@pytest.fixture
+def scanned(monkeypatch):
+    """Count the scans of the installed distributions, which return FORM_ENTRY_POINTS."""
+    scans = []
+
+    def entry_points(group):
+        scans.append(group)
+        return FORM_ENTRY_POINTS
+
+    monkeypatch.setattr("pydantic_forms.core.discovery.entry_points", entry_points)
+    saved_forms, saved_lazy_forms = FORMS.copy(), LAZY_FORMS.copy()
+    yield scans
+
+    FORMS.clear()
+    FORMS.update(saved_forms)
+    LAZY_FORMS.clear()
+    LAZY_FORMS.update(saved_lazy_forms)
+
+
+def test_discover_forms(scanned):
+    with capture_logs() as logs:
+        forms = discover_forms()
+
+    assert forms == {
+        "create_port": "app.forms.create_port:create_port_form",
+        "modify_port": "app.forms.modify_port:modify_port_form",
+    }
+    assert {key: LAZY_FORMS[key] for key in forms} == forms
+    assert scanned == [ENTRY_POINT_GROUP]
+    assert [log["event"] for log in logs] == ["Register forms"]
+
+
+def test_discover_forms_manifest(scanned, tmp_path):
+    manifest = tmp_path / "forms.json"
+    forms = discover_forms(manifest)
+    assert json_loads(manifest.read_bytes())["forms"] == forms
+    assert len(scanned) == 1
+
+    assert discover_forms(manifest) == forms
+    assert len(scanned) == 1
+
+
+def test_discover_forms_stale_manifest(scanned, tmp_path, monkeypatch):
+    manifest = tmp_path / "forms.json"
+    discover_forms(manifest)
+
+    monkeypatch.setattr("pydantic_forms.core.discovery._fingerprint", lambda: [["site-packages", 1]])
+    discover_forms(manifest)
+    assert len(scanned) == 2
+    assert json_loads(manifest.read_bytes())["fingerprint"] == [["site-packages", 1]]
+
+
+@pytest.mark.parametrize("content", [b"", b"[]", b'{"version": 0}'])
+def test_discover_forms_invalid_manifest(scanned, tmp_path, content):
+    manifest = tmp_path / "forms.json"
+    manifest.write_bytes(content)
+    assert discover_forms(manifest) == {entry_point.name: entry_point.value for entry_point in FORM_ENTRY_POINTS}
+    assert len(scanned) == 1
+
+
+def test_discover_forms_conflict(scanned):
+    FORM_ENTRY_POINTS.append(EntryPoint("create_port", "other.forms:create_port_form", ENTRY_POINT_GROUP))
+    try:
+        with pytest.raises(Exception, match="create_port is declared as both"):
+            discover_forms()
+    finally:
+        FORM_ENTRY_POINTS.pop()
@@ -0,0 +1,111 @@
+import pytest
+
+from pydantic_forms.core import FormPage, FormRegistry, Phase, register_form, start_form
+from pydantic_forms.core.asynchronous import start_form as start_form_async
+from pydantic_forms.core.hooks import NO_CLOCK, _error_loc
+from pydantic_forms.exceptions import FormNotCompleteError, FormValidationError
+
+
+class FirstPage(FormPage):
+    name: str
+
+
+class SecondPage(FormPage):
+    size: int
+
+
+def wizard(state):
+    first = yield FirstPage
+    second = yield SecondPage
+    return first.model_dump() | second.model_dump()
+
+
+async def async_wizard(state):
+    first = yield FirstPage
+    second = yield SecondPage
+    yield first.model_dump() | second.model_dump()
+
+
+class RecordingHook:
+    def __init__(self):
+        self.timings = []
+
+    def on_phase(self, timing):
+        self.timings.append(timing)
+
+    @property
+    def phases(self):
+        return [(timing.phase, timing.page_index, timing.page) for timing in self.timings]
+
+
+@pytest.fixture
+def hook():
+    return RecordingHook()
+
+
+@pytest.fixture
+def registry(hook):
+    registry = FormRegistry()
+    register_form("wizard", wizard, registry=registry)
+    register_form("async_wizard", async_wizard, registry=registry)
+    registry.add_hook(hook)
+    return registry
+
+
+COMPLETED_PHASES = [
+    (Phase.STEP, 0, "FirstPage"),
+    (Phase.VALIDATE, 0, "FirstPage"),
+    (Phase.DUMP, 0, "FirstPage"),
+    (Phase.STEP, 1, "SecondPage"),
+    (Phase.VALIDATE, 1, "SecondPage"),
+    (Phase.DUMP, 1, "SecondPage"),
+    (Phase.STEP, 2, None),
+]
+
+
+def test_completed(registry, hook):
+    assert start_form("wizard", [{"name": "a"}, {"size": 1}], registry=registry) == {"name": "a", "size": 1}
+    assert hook.phases == COMPLETED_PHASES
+    assert {timing.form_key for timing in hook.timings} == {"wizard"}
+    assert all(timing.duration_ns >= 0 for timing in hook.timings)
+    starts = [timing.start_ns for timing in hook.timings]
+    assert starts == sorted(starts)
+
+
+async def test_completed_async(registry, hook):
+    await start_form_async("async_wizard", [{"name": "a"}, {"size": 1}], registry=registry)
+    assert hook.phases == COMPLETED_PHASES
+    assert {timing.form_key for timing in hook.timings} == {"async_wizard"}
+
+
+def test_not_complete(registry, hook):
+    with pytest.raises(FormNotCompleteError):
+        start_form("wizard", [{"name": "a"}], registry=registry)
+    assert hook.phases[-2:] == [(Phase.STEP, 1, "SecondPage"), (Phase.SCHEMA, 1, "SecondPage")]
+
+
+def test_invalid(registry, hook):
+    with pytest.raises(FormValidationError):
+        start_form("wizard", [{"name": "a"}, {"size": "large"}], registry=registry)
+    assert hook.phases[-2:] == [(Phase.VALIDATE, 1, "SecondPage"), (Phase.TRANSLATE, 1, "SecondPage")]
+
+
+@pytest.mark.parametrize(
+    "error, loc",
+    [
+        ({"type": "missing", "loc": ("name",)}, "name"),
+        ({"type": "missing", "loc": ("contacts", 3, "email")}, "contacts.*.email"),
+        ({"type": "extra_forbidden", "loc": ("contacts", 0, "made_up")}, "contacts.*.<extra>"),
+        ({"type": "int_parsing", "loc": ("sizes", "made_up", "[key]")}, "sizes.<extra>.[key]"),
+        ({"type": "value_error", "loc": ()}, ""),
+    ],
+)
+def test_error_loc(error, loc):
+    assert _error_loc(error) == loc
+
+
+def test_remove_hook(registry, hook):
+    registry.remove_hook(hook)
+    assert registry.phase_clock("wizard") is NO_CLOCK
+    start_form("wizard", [{"name": "a"}, {"size": 1}], registry=registry)
+    assert hook.timings == []
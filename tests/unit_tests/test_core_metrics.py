@@ -0,0 +1,106 @@
+import pytest
+
+from pydantic_forms.core import FormPage, FormRegistry, register_form, start_form
+from pydantic_forms.core.metrics import DURATION_BUCKETS, MetricsCollector
+from pydantic_forms.exceptions import FormNotCompleteError, FormOverflowError, FormValidationError
+
+
+class Contact(FormPage):
+    email: str
+
+
+class ContactPage(FormPage):
+    name: str
+    contacts: list[Contact]
+
+
+def contact_form(state):
+    user_input = yield ContactPage
+    return user_input.model_dump()
+
+
+@pytest.fixture
+def registry():
+    registry = FormRegistry()
+    register_form("contact_form", contact_form, registry=registry)
+    return registry
+
+
+@pytest.fixture
+def metrics(registry):
+    return MetricsCollector(registry)
+
+
+def samples(metrics):
+    """Return the samples of the export by name and labels."""
+    return {
+        line.rsplit(" ", 1)[0]: float(line.rsplit(" ", 1)[1])
+        for line in metrics.export().splitlines()
+        if not line.startswith("#")
+    }
+
+
+def test_runs(registry, metrics):
+    for _ in range(2):
+        with pytest.raises(FormNotCompleteError):
+            start_form("contact_form", registry=registry)
+    start_form("contact_form", [{"name": "a", "contacts": []}], registry=registry)
+    with pytest.raises(FormOverflowError):
+        start_form("contact_form", [{"name": "a", "contacts": []}, {}], registry=registry)
+
+    exported = samples(metrics)
+    assert exported['pydantic_forms_runs_total{form_key="contact_form",outcome="NeedsInput"}'] == 2
+    assert exported['pydantic_forms_runs_total{form_key="contact_form",outcome="Completed"}'] == 1
+    assert exported['pydantic_forms_runs_total{form_key="contact_form",outcome="FormOverflowError"}'] == 1
+    assert exported['pydantic_forms_run_duration_seconds_count{form_key="contact_form"}'] == 4
+    assert exported['pydantic_forms_schema_cache_total{result="miss"}'] == 1
+    assert exported['pydantic_forms_schema_cache_total{result="hit"}'] == 1
+
+
+def test_validation_errors(registry, metrics):
+    for _ in range(3):
+        with pytest.raises(FormValidationError):
+            start_form("contact_form", [{"contacts": [{"email": "a"}, {}, {}]}], registry=registry)
+
+    exported = samples(metrics)
+    assert exported['pydantic_forms_runs_total{form_key="contact_form",outcome="Invalid"}'] == 3
+    assert exported['pydantic_forms_validation_errors_total{form_key="contact_form",loc="name"}'] == 3
+    # The errors of all items of the list share a label value
+    assert exported['pydantic_forms_validation_errors_total{form_key="contact_form",loc="contacts.*.email"}'] == 6
+    assert not any("contacts.1" in sample for sample in exported)
+
+
+def test_validation_errors_of_user_keys(registry, metrics):
+    """The keys that a client makes up are counted under a placeholder, however many different ones it sends."""
+    for key in ("made_up_a", "made_up_b"):
+        with pytest.raises(FormValidationError):
+            start_form("contact_form", [{"name": "a", "contacts": [{"email": "a", key: 1}], key: 1}], registry=registry)
+
+    exported = samples(metrics)
+    assert exported['pydantic_forms_validation_errors_total{form_key="contact_form",loc="<extra>"}'] == 2
+    assert exported['pydantic_forms_validation_errors_total{form_key="contact_form",loc="contacts.*.<extra>"}'] == 2
+    assert not any("made_up" in sample for sample in exported)
+
+
+def test_phase_histogram(registry, metrics):
+    start_form("contact_form", [{"name": "a", "contacts": []}], registry=registry)
+
+    labels = 'form_key="contact_form",page="ContactPage",page_index="0",phase="validate"'
+    exported = samples(metrics)
+    assert exported[f"pydantic_forms_phase_duration_seconds_count{{{labels}}}"] == 1
+    assert exported[f'pydantic_forms_phase_duration_seconds_bucket{{{labels},le="+Inf"}}'] == 1
+    buckets = [
+        exported[f'pydantic_forms_phase_duration_seconds_bucket{{{labels},le="{bound}"}}'] for bound in DURATION_BUCKETS
+    ]
+    assert buckets == sorted(buckets)
+
+
+def test_export_format(metrics):
+    metrics.on_response('form "1"\n', 510)
+    exported = metrics.export()
+    assert "# TYPE pydantic_forms_responses_total counter" in exported
+    assert 'pydantic_forms_responses_total{form_key="form \\"1\\"\\n",status="510"} 1' in exported
+    assert exported.endswith("\n")
+
+    metrics.clear()
+    assert "pydantic_forms_responses_total{" not in metrics.export()
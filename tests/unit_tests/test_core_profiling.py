@@ -0,0 +1,87 @@
+import pstats
+import time
+
+import pytest
+
+from pydantic_forms.__main__ import main
+from pydantic_forms.core import FormPage, FormRegistry, Phase, register_form
+from pydantic_forms.core.profiling import profile_form
+from pydantic_forms.utils.json import json_dumps
+
+
+class NamePage(FormPage):
+    name: str
+
+
+def slow_form(state):
+    user_input = yield NamePage
+    # Sleeping releases the GIL, so the sampler is sure to catch the form here
+    time.sleep(0.005)
+    return {"name": user_input.name, "customer": state["customer"]}
+
+
+async def async_name_form(state):
+    user_input = yield NamePage
+    yield user_input.model_dump()
+
+
+registry = FormRegistry()
+register_form("slow_form", slow_form, registry=registry)
+register_form("async_name_form", async_name_form, registry=registry)
+
+
+def test_profile_form():
+    profile = profile_form(
+        "slow_form", [{"name": "port-1"}], extra_state={"customer": "SURF"}, runs=3, registry=registry
+    )
+
+    assert profile.outcome == "Completed"
+    assert profile.runs == 3
+    assert profile.form_ns >= 3 * 5_000_000
+    assert profile.phases[Phase.VALIDATE] > 0
+    assert profile.library_ns == sum(duration for phase, duration in profile.phases.items() if phase != Phase.STEP)
+    assert all(stack.startswith("_run_once ") for stack in profile.stacks)
+    assert any(";slow_form (" in stack for stack in profile.stacks)
+    assert "form generator:" in str(profile)
+    assert profile not in registry.hooks
+
+
+def test_profile_form_outcomes():
+    assert profile_form("slow_form", [], registry=registry).outcome == "NeedsInput"
+    assert profile_form("slow_form", [{"name": 1}], registry=registry).outcome == "Invalid"
+    assert profile_form("async_name_form", [{"name": "a"}], registry=registry).outcome == "Completed"
+    assert profile_form("unknown_form", [], registry=registry).outcome == "FormNotFoundError"
+    with pytest.raises(ValueError):
+        profile_form("slow_form", [], runs=0, registry=registry)
+
+
+@pytest.mark.parametrize("form_key", ["slow_form", "async_name_form"])
+def test_profile_form_schema(form_key):
+    """A run that ends on a page generates its schema, like `start_form` does."""
+    profile = profile_form(form_key, [], registry=registry)
+    assert profile.outcome == "NeedsInput"
+    assert profile.phases[Phase.SCHEMA] > 0
+
+
+def test_profile_command(tmp_path, capsys):
+    inputs = tmp_path / "inputs.json"
+    # A record of a recording holds the extra state the form needs
+    inputs.write_text(json_dumps({"user_inputs": [{"name": "port-1"}], "extra_state": {"customer": "SURF"}}))
+    output = tmp_path / "slow"
+
+    args = ["profile", "slow_form", "--inputs", str(inputs), "--registry", f"{__name__}:registry"]
+
+    assert main([*args, "--output", str(output)]) == 0
+
+    assert "1 runs of slow_form: Completed" in capsys.readouterr().out
+    stats = pstats.Stats(str(output.with_suffix(".pstats")))
+    assert any(function == "slow_form" for _, _, function in stats.stats)
+    assert output.with_suffix(".collapsed").read_text().startswith("_run_once ")
+
+
+def test_profile_command_rejects_other_json(tmp_path):
+    inputs = tmp_path / "inputs.json"
+    inputs.write_text('{"name": "port-1"}')
+
+    with pytest.raises(SystemExit):
+        main(["profile", "slow_form", "--inputs", str(inputs)])
@@ -0,0 +1,149 @@
+from uuid import UUID
+
+import pytest
+
+from pydantic_forms.__main__ import main
+from pydantic_forms.core import FormPage, FormRegistry, register_form, start_form
+from pydantic_forms.core.asynchronous import start_form as start_form_async
+from pydantic_forms.core.recording import FormRecorder, Mismatch, read_recordings, replay
+from pydantic_forms.exceptions import FormNotCompleteError, FormValidationError
+
+
+class NamePage(FormPage):
+    name: str
+
+
+class CountPage(FormPage):
+    count: int
+
+
+def wizard_form(state):
+    name = yield NamePage
+    count = yield CountPage
+    return {"name": name.name, "count": count.count, "customer": state.get("customer")}
+
+
+async def async_name_form(state):
+    user_input = yield NamePage
+    yield user_input.model_dump()
+
+
+def name_only_form(state):
+    user_input = yield NamePage
+    return user_input.model_dump()
+
+
+registry = FormRegistry()
+register_form("wizard", wizard_form, registry=registry)
+register_form("async_name_form", async_name_form, registry=registry)
+
+
+def run_wizards():
+    with pytest.raises(FormNotCompleteError):
+        start_form("wizard", [], registry=registry, customer="SURF")
+    with pytest.raises(FormValidationError):
+        start_form("wizard", [{"name": "port-1"}, {"count": "many"}], registry=registry, locale="nl_NL")
+    start_form("wizard", [{"name": "port-1"}, {"count": 2}], registry=registry, customer="SURF")
+
+
+def record_traffic(path, **kwargs):
+    with FormRecorder(path, registry=registry, **kwargs):
+        run_wizards()
+
+
+async def test_records(tmp_path):
+    path = tmp_path / "forms.jsonl"
+    with FormRecorder(path, registry=registry) as recorder:
+        run_wizards()
+        await start_form_async("async_name_form", [{"name": "port-1"}], registry=registry)
+
+    records = list(read_recordings(path))
+
+    assert [record["outcome"] for record in records] == ["NeedsInput", "Invalid", "Completed", "Completed"]
+    assert records[0]["extra_state"] == {"customer": "SURF"}
+    assert records[1]["locale"] == "nl_NL"
+    assert records[2]["user_inputs"] == [{"name": "port-1"}, {"count": 2}]
+    assert records[3]["form_key"] == "async_name_form"
+    assert all(record["duration_ms"] > 0 and record["time"] > 0 for record in records)
+    assert recorder not in registry.hooks
+
+
+def test_unencodable_extra_state_is_dropped(tmp_path):
+    path = tmp_path / "forms.jsonl"
+    with FormRecorder(path, registry=registry) as recorder:
+        start_form("wizard", [{"name": "a"}, {"count": 1}], registry=registry, customer=object())
+        start_form("wizard", [{"name": "a"}, {"count": 1}], registry=registry, customer=UUID(int=1))
+
+    assert recorder.dropped == 1
+    assert [record["extra_state"] for record in read_recordings(path)] == [{"customer": str(UUID(int=1))}]
+
+
+def test_rotation(tmp_path):
+    path = tmp_path / "forms.jsonl"
+    for _ in range(3):
+        record_traffic(path, max_bytes=1, backup_count=4)
+
+    assert sorted(file.name for file in tmp_path.iterdir()) == [
+        "forms.jsonl",
+        "forms.jsonl.1",
+        "forms.jsonl.2",
+        "forms.jsonl.3",
+        "forms.jsonl.4",
+    ]
+    # The current file was emptied by the last rotation, so the last four records are in the backups
+    assert path.read_text() == ""
+    assert [record["outcome"] for record in read_recordings(path)] == [
+        "Completed",
+        "NeedsInput",
+        "Invalid",
+        "Completed",
+    ]
+
+
+def test_replay(tmp_path):
+    path = tmp_path / "forms.jsonl"
+    record_traffic(path)
+
+    report = replay(path, registry=registry)
+
+    assert report.runs == 3
+    assert report.mismatches == []
+    assert len(report.replayed_ms["wizard"]) == 3
+    assert str(report).startswith("Replayed 3 runs, 0 with another outcome")
+
+
+def test_replay_generates_schema(tmp_path):
+    """A replayed run that ends on a page generates its schema within its duration, like `start_form` does."""
+    path = tmp_path / "forms.jsonl"
+    record_traffic(path)
+    replayed = FormRegistry()
+    register_form("wizard", wizard_form, registry=replayed)
+
+    replay(path, registry=replayed)
+
+    assert replayed.metrics["schema_cache_misses"] == 1
+
+
+def test_replay_reports_changed_outcomes(tmp_path):
+    path = tmp_path / "forms.jsonl"
+    record_traffic(path)
+    changed = FormRegistry()
+    register_form("wizard", name_only_form, registry=changed)
+
+    report = replay(path, registry=changed)
+
+    assert report.mismatches == [
+        Mismatch(1, "wizard", "Invalid", "FormOverflowError"),
+        Mismatch(2, "wizard", "Completed", "FormOverflowError"),
+    ]
+
+
+def test_replay_command(tmp_path, capsys):
+    path = tmp_path / "forms.jsonl"
+    record_traffic(path)
+
+    assert main(["replay", str(path), "--registry", f"{__name__}:registry"]) == 0
+    assert "Replayed 3 runs" in capsys.readouterr().out
+
+    assert main(["replay", str(path)]) == 1
+    assert "FormNotFoundError" in capsys.readouterr().out
@@ -0,0 +1,136 @@
+import gc
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+import pytest
+from pydantic import Field
+
+from pydantic_forms.core import FormPage, FormRegistry, list_forms, register_form, start_form
+from pydantic_forms.core.asynchronous import start_form as start_form_async
+from pydantic_forms.exceptions import FormNotCompleteError, FormNotFoundError, FormValidationError
+
+
+class NameForm(FormPage):
+    name: str
+
+
+class TimestampForm(FormPage):
+    created: datetime = Field(default_factory=datetime.now)
+
+
+def name_form(state):
+    user_input = yield NameForm
+    return user_input.model_dump()
+
+
+async def async_name_form(state):
+    user_input = yield NameForm
+    yield user_input.model_dump()
+
+
+def test_registries_are_isolated():
+    registry = FormRegistry()
+    register_form("name_form", name_form, registry=registry)
+
+    assert list_forms(registry=registry) == ["name_form"]
+    assert "name_form" not in list_forms()
+    assert start_form("name_form", [{"name": "a"}], registry=registry) == {"name": "a"}
+    with pytest.raises(FormNotFoundError):
+        start_form("name_form", [{"name": "a"}])
+
+
+async def test_registry_async():
+    registry = FormRegistry()
+    registry.register("async_name_form", async_name_form)
+    assert await start_form_async("async_name_form", [{"name": "a"}], registry=registry) == {"name": "a"}
+
+
+def test_start_form_registry_is_keyword_only():
+    registry = FormRegistry()
+    register_form("name_form", name_form, registry=registry)
+
+    with pytest.raises(TypeError):
+        start_form("name_form", [{"name": "a"}], "user", "en_US", None, registry)
+
+
+def test_schema_cache():
+    registry = FormRegistry()
+    register_form("name_form", name_form, registry=registry)
+
+    for _ in range(3):
+        with pytest.raises(FormNotCompleteError) as e:
+            start_form("name_form", registry=registry)
+    assert e.value.form["required"] == ["name"]
+    assert registry.metrics["schema_cache_misses"] == 1
+    assert registry.metrics["schema_cache_hits"] == 2
+
+    # Every caller gets its own copy
+    registry.schema(NameForm)["title"] = "Changed"
+    assert registry.schema(NameForm)["title"] != "Changed"
+
+
+def test_schema_cache_size():
+    registry = FormRegistry(schema_cache_size=1)
+    registry.schema(NameForm)
+    registry.schema(NameForm)
+    registry.schema(FormPage)
+    registry.schema(NameForm)
+    assert registry.metrics == {"schema_cache_misses": 3, "schema_cache_hits": 1}
+
+
+def test_schema_cache_evicts_least_recently_used():
+    class OtherForm(FormPage):
+        other: str
+
+    registry = FormRegistry(schema_cache_size=2)
+    for page in (NameForm, FormPage, NameForm, OtherForm, NameForm, FormPage):
+        registry.schema(page)
+    # NameForm stayed in use, so FormPage was evicted for OtherForm
+    assert registry.metrics == {"schema_cache_misses": 4, "schema_cache_hits": 2}
+
+
+def test_schema_cache_forgets_collected_pages():
+    registry = FormRegistry()
+
+    class TemporaryForm(FormPage):
+        name: str
+
+    registry.schema(TemporaryForm)
+    assert len(registry._schemas) == 1
+    del TemporaryForm
+    gc.collect()
+    assert len(registry._schemas) == 0
+
+
+def test_schema_cache_skips_default_factories():
+    registry = FormRegistry()
+    first = registry.schema(TimestampForm)["properties"]["created"]["default"]
+    second = registry.schema(TimestampForm)["properties"]["created"]["default"]
+    assert first != second
+    assert registry.metrics["schema_cache_hits"] == 0
+
+
+def test_translations():
+    registry = FormRegistry(translations={"en_US": {}, "nl_NL": {"Field required": "Verplicht"}})
+    register_form("name_form", name_form, registry=registry)
+
+    with pytest.raises(FormValidationError) as e:
+        start_form("name_form", [{}], locale="nl_NL", registry=registry)
+    assert e.value.errors[0]["msg"] == "Verplicht"
+    assert registry.translator is registry.translator
+
+
+def test_concurrent_reads():
+    registry = FormRegistry()
+    register_form("name_form", name_form, registry=registry)
+
+    def run(i):
+        if i % 10 == 0:
+            register_form(f"form_{i}", name_form, registry=registry)
+        return start_form("name_form", [{"name": str(i)}], registry=registry)
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(run, range(200)))
+
+    assert results == [{"name": str(i)} for i in range(200)]
+    assert len(list_forms(registry=registry)) == 21
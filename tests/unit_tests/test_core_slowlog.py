@@ -0,0 +1,113 @@
+import time
+
+import pytest
+from structlog.testing import capture_logs
+
+from pydantic_forms.core import FormPage, FormRegistry, register_form, start_form
+from pydantic_forms.core.asynchronous import start_form as start_form_async
+from pydantic_forms.core.hooks import NO_CLOCK
+from pydantic_forms.core.slowlog import REDACTED, slow_form_log
+from pydantic_forms.exceptions import FormNotCompleteError, FormValidationError
+from pydantic_forms.settings import override_settings
+
+
+class NamePage(FormPage):
+    name: str
+
+
+class CountPage(FormPage):
+    count: int
+
+
+def slow_wizard(state):
+    name = yield NamePage
+    count = yield CountPage
+    # Sleeping in the generator makes the last step the slowest phase
+    time.sleep(0.02)
+    return {"name": name.name, "count": count.count}
+
+
+async def async_slow_wizard(state):
+    name = yield NamePage
+    time.sleep(0.02)
+    yield name.model_dump()
+
+
+registry = FormRegistry()
+register_form("slow_wizard", slow_wizard, registry=registry)
+register_form("async_slow_wizard", async_slow_wizard, registry=registry)
+
+
+def slow_form_logs(logs):
+    return [log for log in logs if log["event"] == "Slow form"]
+
+
+def test_slow_form_is_logged():
+    with override_settings(slow_form_threshold_ms=10), capture_logs() as logs:
+        start_form("slow_wizard", [{"name": "port-1"}, {"count": 2}], registry=registry)
+
+    [log] = slow_form_logs(logs)
+    assert log["log_level"] == "warning"
+    assert log["form_key"] == "slow_wizard"
+    assert log["outcome"] == "Completed"
+    assert log["duration_ms"] >= 20
+    assert log["threshold_ms"] == 10
+    assert log["pages_replayed"] == 2
+    assert [(page["page_index"], page["page"]) for page in log["pages"]] == [
+        (0, "NamePage"),
+        (1, "CountPage"),
+        (2, None),
+    ]
+    assert set(log["pages"][0]) == {"page_index", "page", "step_ms", "validate_ms", "dump_ms"}
+    assert log["payload_bytes"] == [len(b'{"name":"port-1"}'), len(b'{"count":2}')]
+    assert log["payload_total_bytes"] == sum(log["payload_bytes"])
+    assert log["slowest_phase"]["phase"] == "step"
+    assert log["slowest_phase"]["page_index"] == 2
+    assert log["slowest_phase"]["duration_ms"] >= 20
+    assert log["user_inputs"] == [{"name": REDACTED}, {"count": REDACTED}]
+
+
+def test_slow_form_inputs_can_be_logged():
+    with override_settings(slow_form_threshold_ms=10, slow_form_log_inputs=True), capture_logs() as logs:
+        start_form("slow_wizard", [{"name": "port-1"}, {"count": 2}], registry=registry)
+
+    assert slow_form_logs(logs)[0]["user_inputs"] == [{"name": "port-1"}, {"count": 2}]
+
+
+def test_slow_form_failures_are_logged():
+    with override_settings(slow_form_threshold_ms=0.001), capture_logs() as logs:
+        with pytest.raises(FormNotCompleteError):
+            start_form("slow_wizard", [{"name": "port-1"}], registry=registry)
+        with pytest.raises(FormValidationError):
+            start_form("slow_wizard", [{"name": "port-1"}, {"count": "many"}], registry=registry)
+
+    not_complete, invalid = slow_form_logs(logs)
+    assert not_complete["outcome"] == "NeedsInput"
+    # The schema of the next page is generated within the run
+    assert "schema_ms" in not_complete["pages"][1]
+    assert invalid["outcome"] == "Invalid"
+    assert "translate_ms" in invalid["pages"][1]
+
+
+async def test_async_slow_form_is_logged():
+    with override_settings(slow_form_threshold_ms=10), capture_logs() as logs:
+        await start_form_async("async_slow_wizard", [{"name": "port-1"}], registry=registry)
+
+    [log] = slow_form_logs(logs)
+    assert log["form_key"] == "async_slow_wizard"
+    assert log["slowest_phase"]["page_index"] == 1
+
+
+def test_fast_form_is_not_logged():
+    with override_settings(slow_form_threshold_ms=60_000), capture_logs() as logs:
+        start_form("slow_wizard", [{"name": "port-1"}, {"count": 2}], registry=registry)
+
+    assert slow_form_logs(logs) == []
+
+
+def test_slow_form_log_is_off_by_default():
+    with override_settings(slow_form_threshold_ms=0):
+        assert registry.phase_clock("slow_wizard") is NO_CLOCK
+    with override_settings(slow_form_threshold_ms=10):
+        assert registry.phase_clock("slow_wizard")._hooks == (slow_form_log,)
+    assert slow_form_log not in registry.hooks
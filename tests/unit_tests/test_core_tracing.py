@@ -0,0 +1,135 @@
+import pytest
+
+from pydantic_forms.core import FormPage, FormRegistry, register_form, run_form, start_form
+from pydantic_forms.core.asynchronous import start_form as start_form_async
+from pydantic_forms.core.tracing import FORM_SPAN_NAME, InMemoryTracer, OpenTelemetryTracer
+from pydantic_forms.exceptions import FormNotCompleteError, FormOverflowError, FormValidationError
+
+
+class FirstPage(FormPage):
+    name: str
+
+
+class SecondPage(FormPage):
+    size: int
+
+
+def wizard(state):
+    first = yield FirstPage
+    second = yield SecondPage
+    return first.model_dump() | second.model_dump()
+
+
+async def async_wizard(state):
+    first = yield FirstPage
+    second = yield SecondPage
+    yield first.model_dump() | second.model_dump()
+
+
+@pytest.fixture
+def tracer():
+    return InMemoryTracer()
+
+
+@pytest.fixture
+def registry(tracer):
+    registry = FormRegistry()
+    register_form("wizard", wizard, registry=registry)
+    register_form("async_wizard", async_wizard, registry=registry)
+    registry.add_hook(tracer)
+    return registry
+
+
+def test_start_form_span(registry, tracer):
+    with pytest.raises(FormNotCompleteError):
+        start_form("wizard", [{"name": "a"}], registry=registry)
+
+    [span] = tracer.spans
+    assert span.name == FORM_SPAN_NAME
+    assert span.attributes == {
+        "pydantic_forms.form_key": "wizard",
+        "pydantic_forms.inputs": 1,
+        "pydantic_forms.outcome": "NeedsInput",
+        "pydantic_forms.error_count": 0,
+    }
+    assert [(child.name, child.attributes["pydantic_forms.page"]) for child in span.children] == [
+        ("pydantic_forms.step", "FirstPage"),
+        ("pydantic_forms.validate", "FirstPage"),
+        ("pydantic_forms.dump", "FirstPage"),
+        ("pydantic_forms.step", "SecondPage"),
+        ("pydantic_forms.schema", "SecondPage"),
+    ]
+    assert all(span.start_ns <= child.start_ns <= child.end_ns <= span.end_ns for child in span.children)
+
+
+async def test_start_form_span_async(registry, tracer):
+    await start_form_async("async_wizard", [{"name": "a"}, {"size": 1}], registry=registry)
+    [span] = tracer.spans
+    assert span.attributes["pydantic_forms.outcome"] == "Completed"
+    assert len(span.children) == 7
+
+
+def test_start_form_span_errors(registry, tracer):
+    with pytest.raises(FormValidationError):
+        start_form("wizard", [{"name": "a"}, {"size": "large"}], registry=registry)
+    with pytest.raises(FormOverflowError):
+        start_form("wizard", [{"name": "a"}, {"size": 1}, {}], registry=registry)
+
+    invalid, overflow = tracer.spans
+    assert invalid.attributes["pydantic_forms.outcome"] == "Invalid"
+    assert invalid.attributes["pydantic_forms.error_count"] == 1
+    assert invalid.children[-1].name == "pydantic_forms.translate"
+    assert overflow.attributes["pydantic_forms.outcome"] == "FormOverflowError"
+
+
+def test_phases_outside_start_form(registry, tracer):
+    run_form(wizard, {}, [{"name": "a"}, {"size": 1}], registry=registry)
+    assert len(tracer.spans) == 7
+    assert {span.name for span in tracer.spans} == {
+        "pydantic_forms.step",
+        "pydantic_forms.validate",
+        "pydantic_forms.dump",
+    }
+
+
+def test_open_telemetry_tracer(registry):
+    trace = pytest.importorskip("opentelemetry.trace")
+
+    class FakeSpan(trace.NonRecordingSpan):
+        def __init__(self, name, start_time, attributes):
+            super().__init__(trace.INVALID_SPAN_CONTEXT)
+            self.name, self.start_time, self.end_time = name, start_time, None
+            self.attributes, self.status = dict(attributes or {}), None
+            self.parent = trace.get_current_span()
+
+        def set_attributes(self, attributes):
+            self.attributes.update(attributes)
+
+        def set_status(self, status, description=None):
+            self.status = status
+
+        def end(self, end_time=None):
+            self.end_time = end_time or 1
+
+    class FakeTracer:
+        def __init__(self):
+            self.spans = []
+
+        def start_span(self, name, start_time=None, attributes=None):
+            self.spans.append(span := FakeSpan(name, start_time, attributes))
+            return span
+
+    fake = FakeTracer()
+    registry.add_hook(OpenTelemetryTracer(fake))
+    with pytest.raises(FormOverflowError):
+        start_form("wizard", [{"name": "a"}, {"size": 1}, {}], registry=registry)
+
+    form_span, *phase_spans = fake.spans
+    assert form_span.name == FORM_SPAN_NAME
+    assert form_span.attributes["pydantic_forms.outcome"] == "FormOverflowError"
+    assert form_span.status.status_code == trace.StatusCode.ERROR
+    assert form_span.end_time is not None
+    assert len(phase_spans) == 7
+    assert all(span.parent is form_span for span in phase_spans)
+    assert all(span.start_time <= span.end_time for span in phase_spans)
+    assert trace.get_current_span() is not form_span
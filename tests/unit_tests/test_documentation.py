@@ -44,7 +44,7 @@ DOCS_DIR = ROOT / "docs"
 
 # Languages we knowingly use in the docs. Anything else is most likely a typo in the fence
 # (```py, ```pyhton), which would silently exclude a snippet from this test.
-KNOWN_LANGUAGES = frozenset({"", "json", "python", "sh", "shell", "text", "yaml", "pycon"})
+KNOWN_LANGUAGES = frozenset({"", "json", "python", "sh", "shell", "text", "toml", "yaml", "pycon"})
 
 SKIP_MARKER = "<!-- test: skip -->"
 
@@ -0,0 +1,41 @@
+import subprocess
+import sys
+
+import pytest
+
+import pydantic_forms.core
+import pydantic_forms.validators
+
+
+def imported_modules(code):
+    """Return the modules of pydantic-forms and email-validator that are imported after running `code`."""
+    script = (
+        f"{code}\nimport sys\nprint(' '.join(m for m in sys.modules if m.startswith(('pydantic_forms', 'email_'))))"
+    )
+    return set(subprocess.check_output([sys.executable, "-c", script], text=True).split())  # noqa: S603
+
+
+def test_validators_are_imported_on_access():
+    modules = imported_modules("import pydantic_forms.validators")
+    assert not any(module.startswith("pydantic_forms.validators.components") for module in modules)
+
+    modules = imported_modules("from pydantic_forms.validators import Label")
+    assert "pydantic_forms.validators.components.label" in modules
+    assert "pydantic_forms.validators.components.accept" not in modules
+    assert "email_validator" not in modules
+
+
+def test_core_is_imported_on_access():
+    modules = imported_modules("import pydantic_forms.core.hooks")
+    assert "pydantic_forms.core.shared" not in modules
+
+    modules = imported_modules("from pydantic_forms.core import start_form")
+    assert {"pydantic_forms.core.shared", "pydantic_forms.core.sync"} <= modules
+
+
+@pytest.mark.parametrize("package", [pydantic_forms.core, pydantic_forms.validators])
+def test_lazy_package_exports(package):
+    assert all(getattr(package, name) is not None for name in package.__all__)
+    assert set(package.__all__) <= set(dir(package))
+    with pytest.raises(AttributeError, match="has no attribute 'unknown'"):
+        package.unknown  # noqa: B018
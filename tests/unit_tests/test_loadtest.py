@@ -0,0 +1,83 @@
+from pydantic_forms.core import FormPage, FormRegistry, register_form
+from pydantic_forms.loadtest import Wizard, create_app, load_test
+from pydantic_forms.routers.fastapi import create_forms_router
+
+
+class NamePage(FormPage):
+    name: str
+
+
+class CountPage(FormPage):
+    count: int
+
+
+def wizard_form(state):
+    name = yield NamePage
+    count = yield CountPage
+    return {"name": name.name, "count": count.count}
+
+
+async def async_wizard_form(state):
+    name = yield NamePage
+    count = yield CountPage
+    yield {"name": name.name, "count": count.count}
+
+
+def failing_form(state):
+    yield NamePage
+    raise RuntimeError("Broken form")
+
+
+WIZARD = Wizard("wizard", [{"name": "port-1"}, {"count": 2}], invalid_inputs={1: {"count": "many"}})
+
+ASYNC_WIZARD = Wizard("async_wizard", [{"name": "port-1"}, {"count": 2}], invalid_inputs={1: {"count": "many"}})
+
+
+def _registry():
+    registry = FormRegistry()
+    register_form("wizard", wizard_form, registry=registry)
+    register_form("async_wizard", async_wizard_form, registry=registry)
+    register_form("failing_form", failing_form, registry=registry)
+    return registry
+
+
+async def test_load_test():
+    report = await load_test([WIZARD, ASYNC_WIZARD], frontends=3, rounds=2, failure_rate=1.0, registry=_registry())
+
+    assert report.wizards == 12
+    # Per walk: two pages, a retry after invalid input on the second, and the completed form
+    assert report.statuses == {510: 24, 400: 12, 200: 12}
+    assert report.requests == 48
+    assert report.unexpected == 0
+    assert 0 < report.percentile(50) <= report.percentile(99)
+    assert "3 frontends walked 12 wizards" in str(report)
+
+
+async def test_load_test_without_failures():
+    report = await load_test([WIZARD], frontends=2, rounds=1, failure_rate=0.0, registry=_registry())
+
+    assert report.statuses == {510: 4, 200: 2}
+
+
+async def test_load_test_counts_unexpected_responses():
+    wizard = Wizard("failing_form", [{"name": "port-1"}])
+
+    report = await load_test([wizard], frontends=1, rounds=1, app=create_app(_registry()))
+
+    assert report.wizards == 1
+    assert report.unexpected == 1
+    assert report.statuses == {510: 1, 500: 1}
+
+
+async def test_load_test_router():
+    from fastapi import FastAPI
+
+    app = FastAPI()
+    app.include_router(create_forms_router(registry=_registry(), prefix="/router"))
+
+    report = await load_test(
+        [WIZARD, ASYNC_WIZARD], frontends=2, rounds=1, failure_rate=1.0, app=app, path="/router/{form_key}"
+    )
+
+    assert report.unexpected == 0
+    assert report.statuses == {510: 8, 400: 4, 200: 4}
@@ -0,0 +1,157 @@
+"""Check that running forms over and over doesn't make a long-running worker grow.
+
+Forms define their pages inside the generator, so every run creates new classes: with `new_class` in the component
+factories, and pydantic builds a schema and validator for each page. All of that must be freed once the run is over.
+`measure_growth` runs a form in batches under `tracemalloc` and counts the live classes after each batch; after a
+warm-up both must stay flat.
+
+`typing` keeps the last 128 `Annotated` aliases it created in a cache, and with them the classes that the component
+factories put in them. That is bounded, but a run evicts an alias that was created before the measurement started, so
+the traced memory would grow until the cache turned over completely. The harness clears those caches after each batch.
+"""
+
+import gc
+import tracemalloc
+import typing
+from typing import NamedTuple
+
+import pytest
+
+from pydantic_forms.core import FormPage, FormRegistry, register_form, start_form
+from pydantic_forms.validators import callout, markdown, migration_summary, read_only_field
+
+WARMUP_RUNS = 10
+BATCH_RUNS = 10
+BATCHES = 4
+
+# A page class with its schema and validator takes tens of kilobytes, so a leak of one per run is far above this
+MAX_GROWTH_PER_RUN = 256
+
+
+class Growth(NamedTuple):
+    memory: list[int]
+    """The traced memory in bytes after each batch."""
+
+    classes: list[int]
+    """The number of live classes after each batch."""
+
+    @property
+    def bytes_per_run(self) -> float:
+        return (self.memory[-1] - self.memory[0]) / ((len(self.memory) - 1) * BATCH_RUNS)
+
+
+def _count_classes() -> int:
+    return sum(1 for obj in gc.get_objects() if isinstance(obj, type))
+
+
+def measure_growth(form_key: str, user_inputs: list[dict], registry: FormRegistry) -> Growth:
+    def run(times: int) -> None:
+        for _ in range(times):
+            start_form(form_key, user_inputs, registry=registry)
+        for cache_clear in typing._cleanups:  # type: ignore[attr-defined]
+            cache_clear()
+        gc.collect()
+
+    # Fill the caches that are meant to fill once, such as the imports and the lazily created translator
+    run(WARMUP_RUNS)
+    memory, classes = [], []
+    tracemalloc.start()
+    try:
+        for _ in range(BATCHES + 1):
+            run(BATCH_RUNS)
+            memory.append(tracemalloc.get_traced_memory()[0])
+            classes.append(_count_classes())
+    finally:
+        tracemalloc.stop()
+    return Growth(memory, classes)
+
+
+def callout_form(state):
+    class CalloutForm(FormPage):
+        notice: callout(header="Maintenance", message="The port goes down for 10 minutes")
+        name: str
+
+    user_input = yield CalloutForm
+    return user_input.model_dump()
+
+
+def markdown_form(state):
+    class MarkdownForm(FormPage):
+        intro: markdown(content="# Create a port\n\nPick a **name**")
+        name: str
+
+    user_input = yield MarkdownForm
+    return user_input.model_dump()
+
+
+def migration_summary_form(state):
+    class SummaryForm(FormPage):
+        summary: migration_summary({"headers": ["Port", "Speed"], "columns": [["1G", "10G"]]})
+        name: str
+
+    user_input = yield SummaryForm
+    return user_input.model_dump()
+
+
+def read_only_field_form(state):
+    class ReadOnlyForm(FormPage):
+        customer: read_only_field("SURF")
+        name: str
+
+    user_input = yield ReadOnlyForm
+    return user_input.model_dump()
+
+
+def wizard_form(state):
+    class NameForm(FormPage):
+        name: str
+
+    user_input = yield NameForm
+
+    class ConfirmForm(FormPage):
+        confirm: read_only_field(user_input.name)
+        count: int = 1
+
+    confirmed = yield ConfirmForm
+    return {"name": user_input.name, "count": confirmed.count}
+
+
+FORMS = {
+    "callout": (callout_form, [{"name": "port-1"}]),
+    "markdown": (markdown_form, [{"name": "port-1"}]),
+    "migration_summary": (migration_summary_form, [{"name": "port-1"}]),
+    "read_only_field": (read_only_field_form, [{"name": "port-1"}]),
+    "wizard": (wizard_form, [{"name": "port-1"}, {"count": 2}]),
+}
+
+
+@pytest.mark.parametrize("form_key", FORMS, ids=str)
+def test_memory_plateaus(form_key):
+    registry = FormRegistry()
+    form, user_inputs = FORMS[form_key]
+    register_form(form_key, form, registry=registry)
+
+    growth = measure_growth(form_key, user_inputs, registry)
+
+    assert growth.bytes_per_run < MAX_GROWTH_PER_RUN, growth.memory
+    assert growth.classes[-1] <= growth.classes[0], growth.classes
+
+
+def test_measure_growth_detects_leak():
+    registry = FormRegistry()
+    leaked = []
+
+    def leaking_form(state):
+        class NameForm(FormPage):
+            name: str
+
+        leaked.append(NameForm)
+        user_input = yield NameForm
+        return user_input.model_dump()
+
+    register_form("leaking_form", leaking_form, registry=registry)
+
+    growth = measure_growth("leaking_form", [{"name": "a"}], registry)
+
+    assert growth.bytes_per_run > MAX_GROWTH_PER_RUN
+    assert growth.classes[-1] - growth.classes[0] >= BATCHES * BATCH_RUNS
@@ -0,0 +1,104 @@
+import logging
+
+import pytest
+import structlog
+
+from pydantic_forms.settings import (
+    Settings,
+    debug_enabled,
+    debug_sampled,
+    override_settings,
+    reload_settings,
+    settings,
+)
+from tests.unit_tests.helpers import log_level
+
+
+def test_from_env_defaults():
+    assert Settings.from_env({}) == Settings()
+
+
+@pytest.mark.parametrize("log_level, debug", [("DEBUG", True), ("debug", True), ("INFO", False), ("", False)])
+def test_from_env_debug(log_level, debug):
+    assert Settings.from_env({"LOG_LEVEL_PYDANTIC_FORMS": log_level}).debug is debug
+
+
+def test_from_env():
+    environ = {
+        "PYDANTIC_FORMS_SCHEMA_STORE_SIZE": "10",
+        "PYDANTIC_FORMS_COMPRESSED_CACHE_SIZE": "20",
+        "PYDANTIC_FORMS_MAX_BODY_SIZE": "0",
+        "PYDANTIC_FORMS_DEBUG_SAMPLE_RATE": "0.25",
+        "PYDANTIC_FORMS_SLOW_FORM_THRESHOLD_MS": "250",
+        "PYDANTIC_FORMS_SLOW_FORM_LOG_INPUTS": "true",
+    }
+    assert Settings.from_env(environ) == Settings(
+        schema_store_size=10,
+        compressed_cache_size=20,
+        max_body_size=0,
+        debug_sample_rate=0.25,
+        slow_form_threshold_ms=250,
+        slow_form_log_inputs=True,
+    )
+
+
+def test_override_settings():
+    before = Settings(**vars(settings))
+    with override_settings(debug=not before.debug, schema_store_size=1) as overridden:
+        assert overridden is settings
+        assert settings.debug is not before.debug
+        assert settings.schema_store_size == 1
+    assert settings == before
+
+
+def test_override_unknown_setting():
+    with pytest.raises(TypeError):
+        with override_settings(unknown=True):
+            pass
+
+
+def test_reload_settings(monkeypatch):
+    before = Settings(**vars(settings))
+    monkeypatch.setenv("PYDANTIC_FORMS_SCHEMA_STORE_SIZE", "3")
+    try:
+        assert reload_settings() is settings
+        assert settings.schema_store_size == 3
+    finally:
+        monkeypatch.undo()
+        reload_settings()
+    assert settings == before
+
+
+@pytest.mark.parametrize("level, expected", [(logging.DEBUG, True), (logging.INFO, False)])
+def test_debug_enabled(level, expected):
+    with log_level(level):
+        assert debug_enabled(structlog.get_logger()) is expected
+    stdlib_logger = logging.getLogger("pydantic_forms.test_debug_enabled")
+    stdlib_logger.setLevel(level)
+    assert debug_enabled(stdlib_logger) is expected
+
+
+def test_debug_enabled_ignores_debug_setting():
+    with log_level(logging.INFO), override_settings(debug=True):
+        assert debug_enabled(structlog.get_logger()) is False
+
+
+@pytest.mark.parametrize(
+    "level, rate, expected",
+    [
+        (logging.INFO, 1.0, False),
+        (logging.DEBUG, 1.0, True),
+        (logging.DEBUG, 0.0, False),
+        (logging.INFO, 0.5, False),
+    ],
+)
+def test_debug_sampled(level, rate, expected):
+    with log_level(level), override_settings(debug_sample_rate=rate):
+        assert debug_sampled(structlog.get_logger()) is expected
+
+
+def test_debug_sampled_rate(monkeypatch):
+    monkeypatch.setattr("pydantic_forms.settings.random", iter([0.1, 0.9]).__next__)
+    logger = structlog.get_logger()
+    with log_level(logging.DEBUG), override_settings(debug_sample_rate=0.5):
+        assert [debug_sampled(logger), debug_sampled(logger)] == [True, False]
@@ -0,0 +1,47 @@
+import gzip
+
+import pytest
+
+from pydantic_forms.utils.compression import ENCODINGS, IS_BROTLI, compress, negotiate_encoding
+
+
+@pytest.mark.parametrize(
+    "accept_encoding, expected",
+    [
+        (None, None),
+        ("", None),
+        ("identity", None),
+        ("gzip", "gzip"),
+        ("deflate, GZIP", "gzip"),
+        ("gzip;q=0", None),
+        ("gzip;q=0.5", "gzip"),
+        ("gzip;q=nonsense", None),
+        ("*", next(iter(ENCODINGS))),
+        ("br, gzip", "br" if IS_BROTLI else "gzip"),
+        ("br", "br" if IS_BROTLI else None),
+        ("br;q=0, *", "gzip"),
+        ("*, gzip;q=0", "br" if IS_BROTLI else None),
+        ("*;q=0", None),
+        ("gzip;q=1.0, br;q=0.1", "gzip"),
+        ("br;q=0.1, *;q=0.5", "gzip"),
+        ("gzip;q=0.5, br", "br" if IS_BROTLI else "gzip"),
+        ("gzip; level=1; q=0", None),
+    ],
+)
+def test_negotiate_encoding(accept_encoding, expected):
+    assert negotiate_encoding(accept_encoding) == expected
+
+
+def test_gzip_roundtrip():
+    body = b'{"type": "object"}' * 100
+    compressed = compress(body, "gzip")
+    assert len(compressed) < len(body)
+    assert gzip.decompress(compressed) == body
+    # mtime is fixed, so the same body always compresses to the same bytes
+    assert compress(body, "gzip") == compressed
+
+
+def test_brotli_roundtrip():
+    brotli = pytest.importorskip("brotli")
+    body = b'{"type": "object"}' * 100
+    assert brotli.decompress(compress(body, "br")) == body
@@ -0,0 +1,124 @@
+"""Every available JSON backend must write and read exactly the same JSON."""
+
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from ipaddress import IPv4Address, IPv6Network
+from uuid import UUID
+
+import pytest
+from pydantic import BaseModel
+
+from pydantic_forms.utils.json import JSON_BACKEND, JSON_BACKENDS, json_dumps, json_loads
+
+TEST_UUID = UUID("12345678123456781234567812345678")
+TIMESTAMP = datetime(2024, 1, 1, 12, 0, 0, 123456, tzinfo=timezone(timedelta(hours=2)))
+
+
+@dataclass
+class TestDataClass:
+    id: int
+    name: str
+
+
+class TestModel(BaseModel):
+    subscription_id: UUID
+    ip: IPv4Address
+
+
+class CustomJsonObject:
+    def __json__(self):
+        return {"custom": "json"}
+
+
+class CustomDictObject:
+    def to_dict(self):
+        return {"custom": "dict"}
+
+
+@pytest.fixture(params=sorted(JSON_BACKENDS))
+def backend(request):
+    return JSON_BACKENDS[request.param]
+
+
+@pytest.mark.parametrize(
+    "obj, expected",
+    [
+        ({"a": 1, "b": [1, 2.5, None, True]}, '{"a":1,"b":[1,2.5,null,true]}'),
+        ({"text": "é€ a/b"}, '{"text":"é€ a/b"}'),
+        ({1: "int key"}, '{"1":"int key"}'),
+        ((1, 2), "[1,2]"),
+        (TEST_UUID, '"12345678-1234-5678-1234-567812345678"'),
+        (IPv4Address("192.168.1.1"), '"192.168.1.1"'),
+        (IPv6Network("2001:db8::/32"), '"2001:db8::/32"'),
+        (TIMESTAMP, '"2024-01-01T12:00:00+02:00"'),
+        (datetime(2024, 1, 1), '"2024-01-01T00:00:00"'),
+        (TestDataClass(id=1, name="Test"), '{"id":1,"name":"Test"}'),
+        (
+            TestModel(subscription_id=TEST_UUID, ip=IPv4Address("10.0.0.1")),
+            '{"subscription_id":"12345678-1234-5678-1234-567812345678","ip":"10.0.0.1"}',
+        ),
+        (CustomJsonObject(), '{"custom":"json"}'),
+        (CustomDictObject(), '{"custom":"dict"}'),
+        ({"one"}, '["one"]'),
+        (ValueError("oops"), '"oops"'),
+    ],
+)
+def test_dumps(backend, obj, expected):
+    dumps, _ = backend
+    assert dumps(obj) == expected
+
+
+def test_dumps_unsupported_type(backend):
+    class UnsupportedClass:
+        pass
+
+    dumps, _ = backend
+    # orjson replaces the message of the TypeError raised by to_serializable with its own
+    with pytest.raises(TypeError, match="UnsupportedClass"):
+        dumps({"a": UnsupportedClass()})
+
+
+@pytest.mark.parametrize("data", ['{"a":1}', b'{"a":1}', bytearray(b'{"a":1}'), memoryview(b'{"a":1}')])
+def test_loads_input_types(backend, data):
+    _, loads = backend
+    assert loads(data) == {"a": 1}
+
+
+@pytest.mark.parametrize(
+    "data, expected",
+    [
+        ('"2024-01-01T12:00:00+00:00"', "2024-01-01T12:00:00+00:00"),
+        ('[1, "a", null]', [1, "a", None]),
+        ("3", 3),
+        ('{"t": "2024-01-01T12:00:00+00:00"}', {"t": datetime(2024, 1, 1, 12, tzinfo=timezone.utc)}),
+        ('[{"t": "2024-01-01T12:00:00+00:00"}, 1]', [{"t": datetime(2024, 1, 1, 12, tzinfo=timezone.utc)}, 1]),
+        ('{"a": {"t": "2024-01-01T12:00:00+00:00"}}', {"a": {"t": "2024-01-01T12:00:00+00:00"}}),
+        ('{"t": "2024-01-01T12:00:00"}', {"t": "2024-01-01T12:00:00"}),
+    ],
+)
+def test_loads(backend, data, expected):
+    _, loads = backend
+    assert loads(data) == expected
+
+
+def test_roundtrip(backend):
+    dumps, loads = backend
+    state = {"subscription_id": TEST_UUID, "created": TIMESTAMP, "items": [TestDataClass(id=1, name="Test")]}
+    assert loads(dumps(state)) == {
+        "subscription_id": str(TEST_UUID),
+        "created": TIMESTAMP.replace(microsecond=0),
+        "items": [{"id": 1, "name": "Test"}],
+    }
+
+
+def test_default_backend():
+    assert (json_dumps, json_loads) == JSON_BACKENDS[JSON_BACKEND]
+    assert JSON_BACKEND in ("orjson", "rapidjson", "json")
+
+
+def test_stdlib_dumps_options():
+    dumps, _ = JSON_BACKENDS["json"]
+    obj = {"b": TEST_UUID, "a": "é"}
+    assert dumps(obj) == f'{{"b":"{TEST_UUID}","a":"é"}}'
+    assert dumps(obj, sort_keys=True, ensure_ascii=True) == f'{{"a":"\\u00e9","b":"{TEST_UUID}"}}'
+    assert dumps(obj, indent=2) == f'{{\n  "b": "{TEST_UUID}",\n  "a": "é"\n}}'
@@ -0,0 +1,96 @@
+from datetime import datetime, timedelta, timezone
+from typing import Annotated, Any, Optional
+
+import pytest
+from pydantic import Field, TypeAdapter, ValidationError, ValidationInfo, field_validator
+
+from pydantic_forms.core import FormPage
+from pydantic_forms.utils.json import json_loads, json_loads_as
+
+
+class TimestampForm(FormPage):
+    start: datetime
+    end: Optional[datetime] = None
+    note: str = ""
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        ("2024-01-01T12:00:00+00:00", datetime(2024, 1, 1, 12, tzinfo=timezone.utc)),
+        ("2024-01-01T12:00:00Z", datetime(2024, 1, 1, 12, tzinfo=timezone.utc)),
+        ("2024-01-01T12:00:00.123456+02:00", datetime(2024, 1, 1, 10, 0, 0, 123456, tzinfo=timezone.utc)),
+    ],
+)
+def test_form_page_timestamps(value, expected):
+    """Timestamps that the from_serializable heuristic misses are decoded as well."""
+    result = json_loads_as(f'{{"start": "{value}"}}', TimestampForm)
+    assert result.start == expected
+
+
+def test_only_annotated_fields_are_converted():
+    result = json_loads_as('{"start": "2024-01-01T12:00:00+00:00", "note": "2024-01-01T12:00:00+00:00"}', TimestampForm)
+    assert result.note == "2024-01-01T12:00:00+00:00"
+    # Whereas the heuristic of json_loads converts any string that looks like a timestamp
+    assert isinstance(json_loads('{"note": "2024-01-01T12:00:00+00:00"}')["note"], datetime)
+
+
+def test_type_adapter():
+    adapter = TypeAdapter(list[datetime])
+    assert json_loads_as(b'["2024-01-01T12:00:00Z"]', adapter) == [datetime(2024, 1, 1, 12, tzinfo=timezone.utc)]
+
+
+def test_plain_type():
+    assert json_loads_as('{"delay": 90}', dict[str, timedelta]) == {"delay": timedelta(seconds=90)}
+
+
+def test_any_is_decoded_as_is():
+    document = b'{"start": "2024-01-01T12:00:00+00:00", "nested": [1, null]}'
+    expected = {"start": "2024-01-01T12:00:00+00:00", "nested": [1, None]}
+    assert json_loads_as(document, Any) == expected
+    assert json_loads_as(memoryview(document), Any) == expected
+
+
+def test_memoryview():
+    assert json_loads_as(memoryview(b'{"start": "2024-01-01T12:00:00Z"}'), TimestampForm).start.year == 2024
+
+
+def test_unhashable_type():
+    type_ = Annotated[int, Field(json_schema_extra={"unhashable": []})]
+    assert json_loads_as("3", type_) == 3
+
+
+def test_invalid_document():
+    with pytest.raises(ValidationError):
+        json_loads_as('{"start": "yesterday"}', TimestampForm)
+
+
+def test_form_page_frozen_field_uses_default():
+    """Like FormPage(**data), decoding ignores the input for a frozen field."""
+
+    class Form(FormPage):
+        int_field: int = Field(1, frozen=True)
+        other: int
+
+    assert json_loads_as('{"int_field": 2, "other": 3}', Form).model_dump() == {"int_field": 1, "other": 3}
+
+
+@pytest.mark.parametrize("frozen", [False, True])
+def test_form_page_model_validate_json_options(frozen):
+    """The options of model_validate_json are honoured, also for pages with frozen fields."""
+
+    class Form(FormPage):
+        int_field: int = Field(1, frozen=frozen)
+        other: int
+
+        @field_validator("other")
+        @classmethod
+        def add_offset(cls, value: int, info: ValidationInfo) -> int:
+            return value + (info.context or {}).get("offset", 0)
+
+    assert Form.model_validate_json('{"other": 3}', context={"offset": 10}).other == 13
+    assert Form.model_validate_json('{"other": "3"}').other == 3
+    with pytest.raises(ValidationError):
+        Form.model_validate_json('{"other": "3"}', strict=True)
+    with pytest.raises(TypeError):
+        Form.model_validate_json('{"other": 3}', "positional")
@@ -0,0 +1,89 @@
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from ipaddress import IPv4Address, IPv6Network
+from uuid import UUID
+
+import pytest
+from pydantic import BaseModel
+
+from pydantic_forms.utils.json import json_dumps, json_loads
+from pydantic_forms.utils.msgpack import msgpack_dumps, msgpack_loads
+
+TEST_UUID = UUID("12345678123456781234567812345678")
+
+
+@dataclass
+class TestDataClass:
+    id: int
+    name: str
+
+
+class TestModel(BaseModel):
+    subscription_id: UUID
+    ip: IPv4Address
+
+
+def test_uuid_decodes_as_str():
+    assert msgpack_loads(msgpack_dumps({"id": TEST_UUID})) == {"id": str(TEST_UUID)}
+
+
+def test_uuid_is_smaller_than_json():
+    state = {"ids": [UUID(int=i) for i in range(100)]}
+    assert len(msgpack_dumps(state)) < len(json_dumps(state).encode()) / 2
+
+
+@pytest.mark.parametrize(
+    "timestamp",
+    [
+        datetime(2024, 1, 1, 12, 0, tzinfo=timezone.utc),
+        datetime(2024, 1, 1, 12, 0, tzinfo=timezone(timedelta(hours=2))),
+        datetime(2024, 1, 1, 12, 0, tzinfo=timezone(timedelta(hours=-5, minutes=-30))),
+        datetime(1900, 1, 1, 0, 0, tzinfo=timezone.utc),
+    ],
+)
+def test_aware_datetime_roundtrip(timestamp):
+    result = msgpack_loads(msgpack_dumps({"timestamp": timestamp}))
+    assert result["timestamp"] == timestamp
+    assert result["timestamp"].utcoffset() == timestamp.utcoffset()
+
+
+def test_aware_datetime_precision_is_seconds():
+    timestamp = datetime(2024, 1, 1, 12, 0, 0, 999999, tzinfo=timezone.utc)
+    assert msgpack_loads(msgpack_dumps(timestamp)) == timestamp.replace(microsecond=0)
+
+
+def test_nested_aware_datetime_is_decoded():
+    timestamp = datetime(2024, 1, 1, 12, 0, tzinfo=timezone.utc)
+    assert msgpack_loads(msgpack_dumps({"a": [{"b": timestamp}]})) == {"a": [{"b": timestamp}]}
+
+
+def test_naive_datetime_is_a_string():
+    assert msgpack_loads(msgpack_dumps(datetime(2024, 1, 1))) == "2024-01-01T00:00:00"
+
+
+def test_same_rules_as_json():
+    timestamp = datetime(2024, 1, 1, 12, 0, tzinfo=timezone.utc)
+    state = {
+        "form_key": "create_port",
+        "subscription_id": TEST_UUID,
+        "network": IPv6Network("2001:db8::/32"),
+        "dataclass": TestDataClass(id=1, name="Test"),
+        "model": TestModel(subscription_id=TEST_UUID, ip=IPv4Address("192.168.1.1")),
+        "tags": {"a"},
+        "created": timestamp,
+        "count": 3,
+        "none": None,
+    }
+    assert msgpack_loads(msgpack_dumps(state)) == json_loads(json_dumps(state))
+
+
+def test_non_str_keys():
+    assert msgpack_loads(msgpack_dumps({1: "a"})) == {1: "a"}
+
+
+def test_unsupported_type():
+    class UnsupportedClass:
+        pass
+
+    with pytest.raises(TypeError, match="Could not serialize object of type UnsupportedClass to JSON"):
+        msgpack_dumps({"a": UnsupportedClass()})
@@ -1,12 +1,14 @@
 # Test UUID serialization
 from dataclasses import asdict, dataclass
-from datetime import datetime
+from datetime import datetime, timezone
 from ipaddress import IPv4Address, IPv4Network, IPv6Address, IPv6Network
+from typing import Any
 from uuid import UUID
 
 import pytest
+from pydantic import BaseModel, ConfigDict
 
-from pydantic_forms.utils.json import to_serializable
+from pydantic_forms.utils.json import isoformat, json_dumps, json_loads, to_serializable
 
 
 def test_to_serializable_uuid():
@@ -104,3 +106,73 @@ def test_to_serializable_unsupported_type():
     obj = UnsupportedClass()
     with pytest.raises(TypeError, match="Could not serialize object of type UnsupportedClass to JSON"):
         to_serializable(obj)
+
+
+# Test pydantic model serialization
+class TestModel(BaseModel):
+    id: UUID
+    network: IPv4Network
+
+
+class TimestampedModel(BaseModel):
+    id: UUID
+    created: datetime
+
+
+class NestedModel(BaseModel):
+    models: list[TimestampedModel]
+
+
+class AnyModel(BaseModel):
+    value: Any
+
+
+def test_to_serializable_model():
+    obj = TestModel(id=UUID(int=1), network="10.0.0.0/8")
+    assert to_serializable(obj) == {"id": "00000000-0000-0000-0000-000000000001", "network": "10.0.0.0/8"}
+
+
+CREATED = datetime(2024, 1, 1, 12, 0, 0, 123456, tzinfo=timezone.utc)
+
+
+@pytest.mark.parametrize(
+    "obj, expected",
+    [
+        (TimestampedModel(id=UUID(int=1), created=CREATED), {"id": str(UUID(int=1)), "created": isoformat(CREATED)}),
+        (
+            NestedModel(models=[TimestampedModel(id=UUID(int=1), created=CREATED)]),
+            {"models": [{"id": str(UUID(int=1)), "created": isoformat(CREATED)}]},
+        ),
+        (AnyModel(value=CREATED), {"value": isoformat(CREATED)}),
+    ],
+)
+def test_model_datetimes_are_isoformatted(obj, expected):
+    """Datetimes in models have the same format as the ones outside of them."""
+    assert json_loads(json_dumps({"model": obj, "created": CREATED})) == {
+        "model": expected,
+        "created": CREATED.replace(microsecond=0),
+    }
+
+
+def test_to_serializable_model_arbitrary_type():
+    class ArbitraryModel(BaseModel):
+        model_config = ConfigDict(arbitrary_types_allowed=True)
+
+        id: UUID
+        custom: CustomDictObject
+
+    obj = ArbitraryModel(id=UUID(int=1), custom=CustomDictObject())
+    result = to_serializable(obj)
+    assert result["id"] == UUID(int=1)
+    assert isinstance(result["custom"], CustomDictObject)
+    assert json_loads(json_dumps(obj)) == {"id": str(UUID(int=1)), "custom": {"custom": "dict"}}
+
+
+def test_to_serializable_model_with_to_dict():
+    class ModelWithToDict(BaseModel):
+        id: int
+
+        def to_dict(self):
+            return {"custom": self.id}
+
+    assert to_serializable(ModelWithToDict(id=1)) == {"custom": 1}